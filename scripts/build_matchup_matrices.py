@@ -0,0 +1,69 @@
+"""
+Build Tier Matchup Matrices
+Precomputes all-pairs matchup artifacts for each tier in data/competitive/tier_data.csv
+"""
+
+import sys
+import time
+from pathlib import Path
+import argparse
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from matchup_matrix import build_matchups, matchup_path
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Build all-pairs matchup matrices for competitive tiers'
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        default='data',
+        help='Data directory (default: data)'
+    )
+
+    parser.add_argument(
+        '--tiers',
+        nargs='+',
+        help='Tiers to build (default: every tier in tier_data.csv)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes (default: CPU count)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild tiers even if their inputs are unchanged'
+    )
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    status = build_matchups(
+        data_dir=args.data_dir,
+        tiers=args.tiers,
+        max_workers=args.workers,
+        force=args.force
+    )
+    elapsed = time.perf_counter() - start
+
+    print("=" * 60)
+    print("TIER MATCHUP MATRICES")
+    print("=" * 60)
+    for tier, result in status.items():
+        icon = {'built': '✅', 'unchanged': '⏭️', 'empty': '⚠️'}[result]
+        print(f"{icon} {tier:<8} {result:<10} {matchup_path(tier, args.data_dir)}")
+    print(f"\nDone in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
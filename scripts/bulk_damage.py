@@ -0,0 +1,104 @@
+"""
+Bulk Damage Calculator
+Evaluates a CSV/JSONL file of damage scenarios and streams results to CSV/Parquet
+
+Scenario columns:
+    attacker, defender, move        Required (Pokemon and move names)
+    move_type, move_category,
+    move_power                      Supply or override the move
+    attacker_evs / defender_evs     "252/0/0/0/4/252", a list or a stat dict
+    attacker_ivs / defender_ivs     Same forms (default 31)
+    attacker_nature / ...           Nature name (default neutral)
+    attacker_level / ...            Level (default 100)
+    modifiers                       JSON dict, e.g. {"weather": 1.5}
+    attack_boost, defense_boost,
+    critical, weather, item,
+    ability, stab                   Individual modifier columns
+
+Sides without EVs, IVs or a nature use base stats, as the dashboard does.
+"""
+
+import sys
+import time
+from pathlib import Path
+import argparse
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from bulk_damage import run_scenarios, DEFAULT_CHUNK_SIZE
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Evaluate damage scenarios in bulk',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('\n', 3)[3]
+    )
+
+    parser.add_argument(
+        'input',
+        help='Scenario file (.csv or .jsonl)'
+    )
+
+    parser.add_argument(
+        'output',
+        help='Results file (.csv or .parquet)'
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        default='data',
+        help='Data directory (default: data)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes (default: CPU count; 1 runs in-process)'
+    )
+
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f'Scenarios per chunk (default: {DEFAULT_CHUNK_SIZE})'
+    )
+
+    parser.add_argument(
+        '--ko-hits',
+        type=int,
+        default=0,
+        help='Add ko_1..ko_N columns with the chance to KO within N hits'
+    )
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        stats = run_scenarios(
+            args.input,
+            args.output,
+            data_dir=args.data_dir,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            ko_hits=args.ko_hits
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 60)
+    print("BULK DAMAGE")
+    print("=" * 60)
+    print(f"✅ {stats['scenarios']} scenarios in {stats['chunks']} chunks -> {args.output}")
+    if stats['errors']:
+        print(f"⚠️  {stats['errors']} scenarios failed (see the error column)")
+    print(f"\nDone in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,12 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import json
+import sys
+
+# Add data loaders directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src" / "data_loaders"))
+
+from dex_enrichment import add_type_effectiveness
 
 # ==================== VARIANT DEFINITIONS ====================
 
@@ -398,6 +404,9 @@ def generate_variant_csv():
     )
     enhanced_df = enhanced_df.sort_values(['pokedex_number', 'variant_sort']).drop('variant_sort', axis=1)
     
+    # Recompute against_* columns; variants copied from base rows may have new types
+    enhanced_df = add_type_effectiveness(enhanced_df)
+    
     # Save to new file
     output_path = 'data/national_dex_with_variants.csv'
     enhanced_df.to_csv(output_path, index=False)
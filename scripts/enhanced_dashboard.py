@@ -362,13 +362,9 @@ def create_type_effectiveness_heatmap(pokemon):
         'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
     ]
     
-    effectiveness = []
-    for t in types:
-        col_name = f'against_{t}'
-        if col_name in pokemon:
-            effectiveness.append(pokemon[col_name])
-        else:
-            effectiveness.append(1.0)
+    # The dataset spells the Fighting column against_fight
+    columns = [f"against_{'fight' if t == 'fighting' else t}" for t in types]
+    effectiveness = pokemon.reindex(columns).fillna(1.0).tolist()
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
@@ -0,0 +1,431 @@
+"""
+Bulk Damage Scenarios
+Evaluates CSV/JSONL files of damage scenarios in vectorized chunks across a process pool
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from data_catalog import get_data_catalog
+from damage_cache import MODIFIER_DEFAULTS, canonical
+from damage_engine import DamageEngine, damage_rolls, ko_chances, DEFAULT_CRIT_CHANCE
+from stat_engine import StatEngine, STATS, MAX_IV, calculate_stats
+from type_engine import get_type_engine
+
+# Optional pyarrow import
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DEFAULT_CHUNK_SIZE = 5000
+
+SIDES = ('attacker', 'defender')
+
+# Per-side spread columns, e.g. attacker_evs, defender_nature
+SPREAD_FIELDS = ('evs', 'ivs', 'nature', 'level')
+
+MOVE_OVERRIDES = ('type', 'category', 'power')
+
+RESULT_COLUMNS = [
+    'scenario', 'attacker', 'defender', 'move',
+    'min_damage', 'max_damage', 'damage', 'min_percent', 'max_percent',
+    'type_multiplier', 'ohko', 'twoko', 'ohko_guaranteed', 'error'
+]
+
+
+def _present(value) -> bool:
+    """Whether a scenario cell holds a value (not missing / NaN / empty)"""
+    if value is None:
+        return False
+    if isinstance(value, float) and np.isnan(value):
+        return False
+    return not (isinstance(value, str) and not value.strip())
+
+
+def parse_stats(value, default: int) -> np.ndarray:
+    """
+    A six-stat value from a scenario cell
+
+    Accepts a stat dict, a list of six numbers, a "252/0/0/0/4/252" string
+    (STATS order), a JSON string of either, or a single number for every stat.
+    """
+    if not _present(value):
+        return np.full(len(STATS), default, dtype=np.int64)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith(('{', '[')):
+            value = json.loads(text)
+        elif '/' in text:
+            value = [int(v) for v in text.split('/')]
+        else:
+            value = int(float(text))
+    if isinstance(value, dict):
+        return np.array([int(value.get(stat, default) or 0) for stat in STATS], dtype=np.int64)
+    values = np.asarray(value, dtype=np.int64)
+    if values.ndim == 0:
+        return np.full(len(STATS), int(values), dtype=np.int64)
+    if values.shape != (len(STATS),):
+        raise ValueError(f"expected {len(STATS)} stat values, got {len(values)}")
+    return values
+
+
+def parse_modifiers(row: Dict) -> Dict:
+    """Modifiers of a scenario: a 'modifiers' dict/JSON cell overlaid by per-modifier columns"""
+    modifiers = row.get('modifiers')
+    if isinstance(modifiers, str) and modifiers.strip():
+        modifiers = json.loads(modifiers)
+    modifiers = dict(modifiers) if isinstance(modifiers, dict) else {}
+    for name, default in MODIFIER_DEFAULTS.items():
+        value = row.get(name)
+        if _present(value):
+            if isinstance(default, bool):
+                value = str(value).strip().lower() in ('1', 'true', 'yes') if isinstance(value, str) else bool(value)
+            else:
+                value = type(default)(value)
+            modifiers[name] = value
+    return modifiers
+
+
+class ScenarioEvaluator:
+    """
+    Evaluates scenario frames with the vectorized engines
+
+    Final stats of every row are one stat engine expression. Rows sharing an
+    attacker, move and modifiers are then swept against their defenders in a
+    single damage engine call, so results equal DamageCalculator's single
+    calculations.
+    """
+
+    def __init__(self, pokemon: pd.DataFrame, moves: Optional[List[Dict]] = None,
+                 natures: Optional[Dict] = None):
+        """
+        Initialize the evaluator
+
+        Args:
+            pokemon: Dex rows with name, types and base stats
+            moves: Known moves (name, type, category, power)
+            natures: Nature reference (default: natures_reference.json)
+        """
+        self.pokemon = pokemon.drop_duplicates('name').set_index('name', drop=False)
+        self.stat_engine = StatEngine(pokemon, natures)
+        self.type_engine = get_type_engine()
+        self.moves = {str(m['name']).lower(): m for m in (moves or [])}
+
+    @classmethod
+    def from_data_dir(cls, data_dir: str = "data") -> 'ScenarioEvaluator':
+        """Evaluator over a data directory's dex and move table"""
+        catalog = get_data_catalog(data_dir)
+        try:
+            moves = catalog.movesets().moves
+        except Exception as e:
+            print(f"Warning: Movesets unavailable, moves need type/category/power columns: {e}")
+            moves = []
+        return cls(catalog.pokemon(), moves)
+
+    def _move(self, row: Dict) -> Dict:
+        """A scenario's move from the move table, overridden by move_* columns"""
+        name = row.get('move')
+        known = self.moves.get(str(name).lower()) if _present(name) else None
+        move = dict(known) if known else {'name': name if _present(name) else None}
+        for field in MOVE_OVERRIDES:
+            value = row.get(f"move_{field}")
+            if _present(value):
+                move[field] = int(float(value)) if field == 'power' else str(value)
+        if not known and ('power' not in move or 'type' not in move):
+            raise ValueError(f"unknown move {name!r}; give move_type, move_category and move_power")
+        move['power'] = move.get('power') or 0
+        return move
+
+    def _spread(self, row: Dict, side: str) -> Dict:
+        """Parsed EVs, IVs, nature and level of one side of a scenario"""
+        nature = row.get(f"{side}_nature")
+        if _present(nature) and nature not in self.stat_engine.nature_names:
+            raise ValueError(f"unknown {side} nature {nature!r}")
+        level = row.get(f"{side}_level")
+        return {
+            'evs': parse_stats(row.get(f"{side}_evs"), 0),
+            'ivs': parse_stats(row.get(f"{side}_ivs"), MAX_IV),
+            'nature': nature if _present(nature) else None,
+            'level': int(float(level)) if _present(level) else 100,
+            'custom': any(_present(row.get(f"{side}_{field}")) for field in ('evs', 'ivs', 'nature'))
+        }
+
+    def _side_stats(self, names: List[str], spreads: List[Dict]) -> pd.DataFrame:
+        """Stats of one side of every row: final stats where a spread is given, else base"""
+        base = self.pokemon.loc[names, STATS].to_numpy(dtype=np.int64)
+        evs = np.array([s['evs'] for s in spreads]).reshape(-1, len(STATS))
+        ivs = np.array([s['ivs'] for s in spreads]).reshape(-1, len(STATS))
+        natures = self.stat_engine.nature_modifiers([s['nature'] for s in spreads])
+        levels = np.array([s['level'] for s in spreads], dtype=np.int64)
+        custom = np.array([s['custom'] for s in spreads], dtype=bool)
+
+        stats = np.where(custom[:, None], calculate_stats(base, ivs, evs, natures, levels), base)
+        frame = self.pokemon.loc[names, ['name', 'type_1', 'type_2']].reset_index(drop=True)
+        frame[STATS] = stats
+        frame['level'] = levels
+        return frame
+
+    def evaluate(self, scenarios: pd.DataFrame, start: int = 0, ko_hits: int = 0,
+                 crit_chance: float = DEFAULT_CRIT_CHANCE) -> pd.DataFrame:
+        """
+        Results of a frame of scenarios
+
+        Args:
+            scenarios: One row per scenario (see scripts/bulk_damage.py)
+            start: Scenario number of the first row
+            ko_hits: Also report ko_1..ko_n, the chance to KO within n hits
+            crit_chance: Crit chance for the KO probabilities
+
+        Returns:
+            DataFrame with RESULT_COLUMNS (plus ko_* columns), one row per scenario
+        """
+        rows = scenarios.to_dict('records')
+        n = len(rows)
+        result = pd.DataFrame({
+            'scenario': np.arange(start, start + n),
+            'attacker': [r.get('attacker') for r in rows],
+            'defender': [r.get('defender') for r in rows],
+            'move': [r.get('move') for r in rows],
+        })
+        for column in RESULT_COLUMNS[4:-1]:
+            result[column] = np.nan
+        result['error'] = None
+        ko_columns = [f"ko_{hits}" for hits in range(1, ko_hits + 1)]
+        for column in ko_columns:
+            result[column] = np.nan
+
+        # Validate rows; invalid ones only get an error message
+        valid, moves, modifiers = [], {}, {}
+        spreads = {side: [] for side in SIDES}
+        for i, row in enumerate(rows):
+            try:
+                for side in SIDES:
+                    if row.get(side) not in self.pokemon.index:
+                        raise ValueError(f"unknown {side} {row.get(side)!r}")
+                parsed = {side: self._spread(row, side) for side in SIDES}
+                moves[i] = self._move(row)
+                modifiers[i] = parse_modifiers(row)
+            except (ValueError, TypeError) as e:
+                result.at[i, 'error'] = str(e)
+                continue
+            valid.append(i)
+            for side in SIDES:
+                spreads[side].append(parsed[side])
+        if not valid:
+            return result
+
+        attackers = self._side_stats([rows[i]['attacker'] for i in valid], spreads['attacker'])
+        defenders = self._side_stats([rows[i]['defender'] for i in valid], spreads['defender'])
+
+        # One sweep per distinct attacker, move and modifiers
+        groups: Dict[tuple, List[int]] = {}
+        attacker_records = attackers.to_dict('records')
+        for position, i in enumerate(valid):
+            record = attacker_records[position]
+            key = (
+                canonical([record[f] for f in ('name', 'level', 'attack', 'sp_attack')]),
+                canonical(moves[i]),
+                canonical(modifiers[i])
+            )
+            groups.setdefault(key, []).append(position)
+
+        out = {column: result[column].to_numpy(dtype=object).copy() for column in RESULT_COLUMNS[4:-1] + ko_columns}
+        for positions in groups.values():
+            first = valid[positions[0]]
+            attacker = attacker_records[positions[0]]
+            move, mods = moves[first], modifiers[first]
+            engine = DamageEngine(defenders.iloc[positions], self.type_engine)
+            sweep = engine.sweep(attacker, move, mods)
+            targets = [valid[p] for p in positions]
+            for column in RESULT_COLUMNS[4:-1]:
+                out[column][targets] = sweep[column]
+
+            if ko_hits:
+                self._ko_columns(engine, attacker, move, mods, targets, out, ko_hits, crit_chance)
+
+        for column, values in out.items():
+            result[column] = values
+        for column in ('min_damage', 'max_damage', 'damage'):
+            result[column] = pd.array(result[column], dtype='Int64')
+        for column in ('ohko', 'twoko', 'ohko_guaranteed'):
+            result[column] = pd.array(result[column], dtype='boolean')
+        for column in ['min_percent', 'max_percent', 'type_multiplier'] + ko_columns:
+            result[column] = result[column].astype('float64')
+        return result
+
+    @staticmethod
+    def _ko_columns(engine: DamageEngine, attacker: Dict, move: Dict, modifiers: Dict,
+                    targets: List[int], out: Dict, ko_hits: int, crit_chance: float):
+        """Fill ko_1..ko_n for one sweep group, as DamageCalculator.damage_distribution does"""
+        if not move.get('power'):
+            for hits in range(1, ko_hits + 1):
+                out[f"ko_{hits}"][targets] = 0.0
+            return
+        normal = {**modifiers, 'critical': False}
+        rolls = damage_rolls(engine.base_damage(attacker, move, normal))
+        crit_rolls = damage_rolls(engine.base_damage(attacker, move, {**normal, 'critical': True}))
+        chance = crit_chance
+        if modifiers.get('critical', False):
+            rolls, chance = crit_rolls, 1.0
+        for target, hp, row_rolls, row_crit in zip(targets, engine.hp, rolls, crit_rolls):
+            for hits, value in enumerate(ko_chances(row_rolls, row_crit, hp, chance, ko_hits), start=1):
+                out[f"ko_{hits}"][target] = value
+
+
+# ---------- file processing ----------
+
+_worker_evaluator: Optional[ScenarioEvaluator] = None
+
+
+def _init_worker(data_dir: str):
+    """Load the evaluator once per worker process"""
+    global _worker_evaluator
+    _worker_evaluator = ScenarioEvaluator.from_data_dir(data_dir)
+
+
+def _evaluate_chunk(scenarios: pd.DataFrame, start: int, ko_hits: int) -> pd.DataFrame:
+    """Evaluate one chunk in a worker"""
+    return _worker_evaluator.evaluate(scenarios, start=start, ko_hits=ko_hits)
+
+
+def read_scenarios(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Scenario chunks from a .csv or .jsonl file"""
+    path = Path(path)
+    if path.suffix.lower() in ('.jsonl', '.ndjson'):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    elif path.suffix.lower() == '.csv':
+        reader = pd.read_csv(path, chunksize=chunk_size, keep_default_na=True)
+    else:
+        raise ValueError(f"Unsupported scenario file: {path.suffix} (use .csv or .jsonl)")
+    with reader:
+        for chunk in reader:
+            yield chunk.reset_index(drop=True)
+
+
+def result_schema(ko_hits: int = 0) -> 'pa.Schema':
+    """
+    Arrow schema of result chunks
+
+    Fixed up front rather than inferred from the first chunk, where a column
+    such as error may be all null.
+    """
+    types = {
+        'scenario': pa.int64(),
+        'attacker': pa.string(),
+        'defender': pa.string(),
+        'move': pa.string(),
+        'min_damage': pa.int64(),
+        'max_damage': pa.int64(),
+        'damage': pa.int64(),
+        'min_percent': pa.float64(),
+        'max_percent': pa.float64(),
+        'type_multiplier': pa.float64(),
+        'ohko': pa.bool_(),
+        'twoko': pa.bool_(),
+        'ohko_guaranteed': pa.bool_(),
+        'error': pa.string(),
+    }
+    fields = [pa.field(column, types[column]) for column in RESULT_COLUMNS]
+    fields += [pa.field(f"ko_{hits}", pa.float64()) for hits in range(1, ko_hits + 1)]
+    return pa.schema(fields)
+
+
+class ResultWriter:
+    """Streams result chunks to CSV or Parquet as they arrive"""
+
+    def __init__(self, path: Path, ko_hits: int = 0):
+        self.path = Path(path)
+        self.format = 'parquet' if self.path.suffix.lower() == '.parquet' else 'csv'
+        if self.format == 'parquet' and not HAS_PYARROW:
+            raise ValueError("Parquet output needs pyarrow; write .csv instead")
+        self.schema = result_schema(ko_hits) if self.format == 'parquet' else None
+        self.rows = 0
+        self._parquet = None
+
+    def write(self, chunk: pd.DataFrame):
+        """Append one chunk"""
+        if self.format == 'parquet':
+            table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, self.schema)
+            self._parquet.write_table(table)
+        else:
+            chunk.to_csv(self.path, mode='w' if self.rows == 0 else 'a',
+                         header=self.rows == 0, index=False)
+        self.rows += len(chunk)
+
+    def close(self):
+        """Finish the file"""
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+
+def run_scenarios(input_path: Path, output_path: Path, data_dir: str = "data",
+                  workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  ko_hits: int = 0) -> Dict:
+    """
+    Evaluate a scenario file into a results file
+
+    Chunks are evaluated across a process pool (at most two chunks in flight
+    per worker) and written in input order as soon as each one is ready.
+
+    Args:
+        input_path: Scenarios (.csv or .jsonl)
+        output_path: Results (.csv or .parquet)
+        data_dir: Data directory for the dex and moves
+        workers: Worker processes (default: CPU count); 1 evaluates in-process
+        chunk_size: Scenarios per chunk
+        ko_hits: Add ko_1..ko_n probability columns
+
+    Returns:
+        dict: scenarios, errors and chunks processed
+    """
+    writer = ResultWriter(output_path, ko_hits)
+    stats = {'scenarios': 0, 'errors': 0, 'chunks': 0}
+
+    def record(result: pd.DataFrame):
+        writer.write(result)
+        stats['scenarios'] += len(result)
+        stats['errors'] += int(result['error'].notna().sum())
+        stats['chunks'] += 1
+
+    try:
+        chunks = read_scenarios(input_path, chunk_size)
+        if workers == 1:
+            _init_worker(data_dir)
+            start = 0
+            for chunk in chunks:
+                record(_evaluate_chunk(chunk, start, ko_hits))
+                start += len(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(data_dir,)) as executor:
+                window = 2 * (workers or os.cpu_count() or 1)
+                pending, start = [], 0
+                for chunk in chunks:
+                    pending.append(executor.submit(_evaluate_chunk, chunk, start, ko_hits))
+                    start += len(chunk)
+                    if len(pending) >= window:
+                        record(pending.pop(0).result())
+                for future in pending:
+                    record(future.result())
+    finally:
+        writer.close()
+
+    return stats
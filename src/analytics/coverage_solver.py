@@ -0,0 +1,250 @@
+"""
+Offensive Coverage Solver
+Minimal attacking-type sets hitting the 171 defensive type combinations super effectively
+"""
+
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from type_engine import get_type_engine, TypeEngine
+
+
+class CoverageSolver:
+    """
+    Set cover over type combinations, encoded as bitmasks
+
+    Bit c of an attacking type's mask is set when that type hits combination c
+    (see TypeEngine.combo_types) for at least min_multiplier. A set of moves
+    covers the union of its types' masks.
+    """
+
+    def __init__(self, engine: Optional[TypeEngine] = None, min_multiplier: float = 2.0):
+        """
+        Initialize the solver
+
+        Args:
+            engine: Type engine (default: the shared engine)
+            min_multiplier: Multiplier that counts as covering a combination
+        """
+        self.engine = engine or get_type_engine()
+        self.min_multiplier = min_multiplier
+        self.n_combos = self.engine.n_combos
+
+        hits = self.engine.combo_profiles.T >= min_multiplier  # (attack, combo)
+        self.masks = [self._to_mask(row) for row in hits]
+        self.coverable = 0
+        for mask in self.masks:
+            self.coverable |= mask
+
+    @staticmethod
+    def _to_mask(bits: np.ndarray) -> int:
+        """Pack a boolean vector into an int, bit i = bits[i]"""
+        return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+    def _type_indices(self, attack_types: Iterable[str]) -> List[int]:
+        """Known type indices, in order, without duplicates"""
+        indices = []
+        for name in attack_types:
+            index = self.engine.index(name)
+            if index >= 0 and index not in indices:
+                indices.append(index)
+        return indices
+
+    # ---------- evaluation ----------
+
+    def covered_mask(self, attack_types: Iterable[str]) -> int:
+        """Bitmask of combinations hit by any of the attacking types"""
+        mask = 0
+        for index in self._type_indices(attack_types):
+            mask |= self.masks[index]
+        return mask
+
+    def coverage(self, attack_types: Iterable[str]) -> int:
+        """Number of combinations hit by any of the attacking types"""
+        return self.covered_mask(attack_types).bit_count()
+
+    def uncovered(self, attack_types: Iterable[str]) -> List[str]:
+        """Combinations not hit by the attacking types, as 'Type' or 'Type/Type'"""
+        mask = self.covered_mask(attack_types)
+        return [
+            '/'.join(self.engine.combo_names(combo_id))
+            for combo_id in range(self.n_combos)
+            if not mask >> combo_id & 1
+        ]
+
+    # ---------- search ----------
+
+    def solve(self, target: Union[float, int] = 1.0, required: Iterable[str] = (),
+              allowed: Optional[Iterable[str]] = None, max_size: Optional[int] = None,
+              max_solutions: int = 20) -> Dict:
+        """
+        Find the smallest attacking-type sets reaching a coverage target
+
+        Sizes are tried in increasing order (iterative deepening), so the first
+        size with a solution is the minimum. A full cover branches on the
+        uncovered combination with the fewest covering types; a partial cover
+        adds types in index order. Both prune a branch when its best remaining
+        types cannot reach the target, and memoize states proven hopeless.
+
+        Args:
+            target: Fraction of the combinations the candidates can cover
+                (float <= 1) or a count (int)
+            required: Types that every solution must include
+            allowed: Candidate types to add (default: all 18)
+            max_size: Largest set size to try (default: all candidates)
+            max_solutions: Cap on the number of minimal sets returned
+
+        Returns:
+            dict: size, solutions (list of type name lists), covered count per
+            solution, target count, coverable and total combinations
+        """
+        base = self._type_indices(required)
+        candidates = [
+            i for i in (self._type_indices(allowed) if allowed is not None
+                        else range(self.engine.n_types))
+            if i not in base
+        ]
+        start_mask = 0
+        for index in base:
+            start_mask |= self.masks[index]
+        reachable = start_mask
+        for index in candidates:
+            reachable |= self.masks[index]
+
+        coverable = reachable.bit_count()
+        if isinstance(target, float):
+            goal = int(np.ceil(target * coverable))
+        else:
+            goal = int(target)
+        goal = min(goal, coverable)
+
+        limit = len(candidates) if max_size is None else max(0, max_size - len(base))
+        found: List[List[int]] = []
+
+        for extra in range(0, limit + 1):
+            if goal == coverable:
+                found = self._search_full(candidates, start_mask, reachable, extra, max_solutions)
+            else:
+                found = self._search(candidates, start_mask, extra, goal, max_solutions)
+            if found:
+                break
+
+        solutions = [base + chosen for chosen in found]
+        return {
+            'size': len(solutions[0]) if solutions else None,
+            'solutions': [[self.engine.types[i] for i in s] for s in solutions],
+            'covered': [self.coverage(self.engine.types[i] for i in s) for s in solutions],
+            'target': goal,
+            'coverable': coverable,
+            'total': self.n_combos
+        }
+
+    def _search(self, candidates: List[int], start_mask: int, size: int,
+                goal: int, max_solutions: int) -> List[List[int]]:
+        """All sets of exactly `size` candidates reaching `goal` (up to max_solutions)"""
+        masks = self.masks
+        solutions: List[List[int]] = []
+        hopeless = set()
+
+        if size == 0:
+            return [[]] if start_mask.bit_count() >= goal else []
+
+        def search(position: int, left: int, covered: int, chosen: List[int]):
+            if len(solutions) >= max_solutions:
+                return
+            count = covered.bit_count()
+            if left == 0:
+                if count >= goal:
+                    solutions.append(list(chosen))
+                return
+
+            key = (position, left, covered)
+            if key in hopeless:
+                return
+
+            # Bound: the `left` largest remaining gains, taken independently
+            gains = sorted(
+                ((masks[i] & ~covered).bit_count() for i in candidates[position:]),
+                reverse=True
+            )
+            if len(gains) < left or count + sum(gains[:left]) < goal:
+                hopeless.add(key)
+                return
+
+            before = len(solutions)
+            for offset in range(position, len(candidates) - left + 1):
+                index = candidates[offset]
+                chosen.append(index)
+                search(offset + 1, left - 1, covered | masks[index], chosen)
+                chosen.pop()
+            if len(solutions) == before:
+                hopeless.add(key)
+
+        search(0, size, start_mask, [])
+        return solutions
+
+    def _search_full(self, candidates: List[int], start_mask: int, goal_mask: int,
+                     size: int, max_solutions: int) -> List[List[int]]:
+        """All sets of at most `size` candidates covering goal_mask (up to max_solutions)"""
+        masks = self.masks
+        best_gain = max((masks[i].bit_count() for i in candidates), default=0)
+        # Candidates covering each combination, fewest-first branching uses these
+        coverers = {
+            combo_id: [i for i in candidates if masks[i] >> combo_id & 1]
+            for combo_id in range(self.n_combos) if goal_mask >> combo_id & 1
+        }
+        seen = set()
+        solutions: List[List[int]] = []
+        hopeless = set()
+
+        def search(left: int, covered: int, chosen: int):
+            if len(solutions) >= max_solutions:
+                return
+            missing = goal_mask & ~covered
+            if not missing:
+                if chosen not in seen:
+                    seen.add(chosen)
+                    solutions.append([i for i in candidates if chosen >> i & 1])
+                return
+            if left == 0 or missing.bit_count() > left * best_gain:
+                return
+
+            key = (left, covered)
+            if key in hopeless:
+                return
+
+            # Some chosen type must hit the hardest uncovered combination
+            options = min(
+                (coverers[combo_id] for combo_id in range(self.n_combos) if missing >> combo_id & 1),
+                key=len
+            )
+            before = len(solutions)
+            for index in options:
+                search(left - 1, covered | masks[index], chosen | 1 << index)
+            if len(solutions) == before:
+                hopeless.add(key)
+
+        search(size, start_mask, 0)
+        return solutions
+
+    def best_additions(self, attack_types: Iterable[str], top_n: int = 5) -> List[Dict]:
+        """Single types that add the most coverage to an existing set"""
+        mask = self.covered_mask(attack_types)
+        have = set(self._type_indices(attack_types))
+        gains = [
+            {'type': self.engine.types[i], 'added': (self.masks[i] & ~mask).bit_count()}
+            for i in range(self.engine.n_types) if i not in have
+        ]
+        return sorted(gains, key=lambda g: g['added'], reverse=True)[:top_n]
+
+
+_coverage_solver = None
+
+
+def get_coverage_solver() -> CoverageSolver:
+    """Get the shared coverage solver"""
+    global _coverage_solver
+    if _coverage_solver is None:
+        _coverage_solver = CoverageSolver()
+    return _coverage_solver
@@ -0,0 +1,147 @@
+"""
+Damage Calculation Cache
+LRU memoization of damage results keyed on canonicalized battle inputs
+"""
+
+import copy
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+DEFAULT_CACHE_SIZE = 2048
+
+# Values DamageCalculator assumes for missing keys, so {} and explicit defaults share a key
+MODIFIER_DEFAULTS = {
+    'attack_boost': 0,
+    'defense_boost': 0,
+    'critical': False,
+    'weather': 1.0,
+    'item': 1.0,
+    'ability': 1.0,
+    'stab': 1.5,
+}
+
+ATTACKER_DEFAULTS = {'level': 100, 'attack': 100, 'sp_attack': 100}
+DEFENDER_DEFAULTS = {'hp': 100, 'defense': 100, 'sp_defense': 100}
+
+# Only the fields the damage formula reads take part in a key
+ATTACKER_FIELDS = ('name', 'level', 'attack', 'sp_attack', 'type_1', 'type_2')
+DEFENDER_FIELDS = ('name', 'hp', 'defense', 'sp_defense', 'type_1', 'type_2')
+MOVE_FIELDS = ('name', 'type', 'category', 'power')
+
+
+def canonical(value: Any) -> Hashable:
+    """A hashable, order-independent form of a value (dicts, lists, NumPy scalars, NaN)"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(canonical(v) for v in value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _fields_key(record: Dict, fields, defaults: Dict) -> tuple:
+    """Selected fields of a record, with defaults filled and missing types as None"""
+    key = []
+    for field in fields:
+        value = canonical(record.get(field, defaults.get(field)))
+        if field.startswith('type_') and not isinstance(value, str):
+            value = None
+        key.append(value)
+    return tuple(key)
+
+
+def battle_key(kind: str, attacker: Dict, defender: Optional[Dict], move: Dict,
+               modifiers: Optional[Dict], *extra) -> tuple:
+    """
+    Canonical key of one damage query
+
+    Args:
+        kind: Which result is cached (e.g. 'damage', 'distribution')
+        attacker, defender, move, modifiers: As passed to DamageCalculator
+        *extra: Further arguments that change the result
+    """
+    modifiers = {**MODIFIER_DEFAULTS, **(modifiers or {})}
+    return (
+        kind,
+        _fields_key(attacker, ATTACKER_FIELDS, ATTACKER_DEFAULTS),
+        _fields_key(defender, DEFENDER_FIELDS, DEFENDER_DEFAULTS) if defender is not None else None,
+        _fields_key(move, MOVE_FIELDS, {'power': 0, 'category': 'Physical', 'type': 'Normal'}),
+        canonical(modifiers),
+        canonical(extra)
+    )
+
+
+class DamageCache:
+    """
+    Thread-safe LRU cache with hit/miss counters
+
+    Streamlit sessions share one calculator across threads, so lookups and
+    evictions happen under a lock. Callers get copies of cached results and
+    cannot alter them.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Entries kept before the least recently used is evicted
+                (0 disables caching but still counts misses)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached result for key, computing and storing it on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+            self.misses += 1
+
+        result = compute()
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def resize(self, maxsize: int):
+        """Change the capacity, evicting the oldest entries if needed"""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict:
+        """Counters for the performance profiler"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
@@ -5,29 +5,58 @@ Implements exact damage formula from Pokemon games
 
 import streamlit as st
 import pandas as pd
-import json
+import sys
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import math
 
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from data_catalog import DataCatalog, get_data_catalog
+from type_engine import get_type_engine
+from damage_engine import (
+    DamageEngine, damage_rolls, ko_chances, ko_cache_info, DEFAULT_CRIT_CHANCE
+)
+from damage_cache import DamageCache, battle_key, DEFAULT_CACHE_SIZE
+from stat_engine import StatEngine, STATS, MAX_IV, MAX_EV, MAX_TOTAL_EVS
+from ev_optimizer import EVOptimizer
+
+# Defender spreads offered by the sweep; None keeps raw base stats
+DEFENDER_SPREADS = {
+    "Base stats": None,
+    "Uninvested (31 IVs, neutral)": {'evs': 0, 'nature': None},
+    "Max HP / Def (Bold)": {'evs': {'hp': 252, 'defense': 252, 'sp_defense': 4}, 'nature': 'Bold'},
+    "Max HP / Sp. Def (Calm)": {'evs': {'hp': 252, 'sp_defense': 252, 'defense': 4}, 'nature': 'Calm'},
+}
+
 
 class DamageCalculator:
     """Calculate exact Pokemon battle damage"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", catalog: Optional[DataCatalog] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
         self.data_dir = Path(data_dir)
+        self.catalog = catalog or get_data_catalog(data_dir)
+        # Results of calculate_damage, damage_distribution and sweep, shared across reruns
+        self.cache = DamageCache(cache_size)
         self.load_data()
         self.load_type_chart()
     
     def load_data(self):
         """Load Pokemon and move data"""
         try:
-            self.pokemon_data = pd.read_csv(self.data_dir / "pokemon.csv")
+            self.pokemon_data = self.catalog.pokemon()
+            self.pokemon_index = self.catalog.pokemon_index()
+            self.damage_engine = DamageEngine(self.pokemon_data)
+            self.stat_engine = StatEngine(self.pokemon_data)
+            self.ev_optimizer = EVOptimizer(self.stat_engine, get_type_engine())
             
             # Load moveset database
-            moveset_path = self.data_dir / "moves" / "pokemon_movesets.json"
-            with open(moveset_path, 'r') as f:
-                self.movesets = json.load(f)
+            self.movesets = self.catalog.movesets()
             
             print("✅ Data loaded successfully")
         except Exception as e:
@@ -36,67 +65,28 @@ class DamageCalculator:
     
     def load_type_chart(self):
         """Load type effectiveness chart"""
-        # Complete 18x18 type effectiveness matrix
-        self.type_chart = {
-            'Normal': {'Rock': 0.5, 'Ghost': 0, 'Steel': 0.5},
-            'Fire': {'Fire': 0.5, 'Water': 0.5, 'Grass': 2.0, 'Ice': 2.0, 
-                    'Bug': 2.0, 'Rock': 0.5, 'Dragon': 0.5, 'Steel': 2.0},
-            'Water': {'Fire': 2.0, 'Water': 0.5, 'Grass': 0.5, 'Ground': 2.0,
-                     'Rock': 2.0, 'Dragon': 0.5},
-            'Electric': {'Water': 2.0, 'Electric': 0.5, 'Grass': 0.5, 
-                        'Ground': 0, 'Flying': 2.0, 'Dragon': 0.5},
-            'Grass': {'Fire': 0.5, 'Water': 2.0, 'Grass': 0.5, 'Poison': 0.5,
-                     'Ground': 2.0, 'Flying': 0.5, 'Bug': 0.5, 'Rock': 2.0,
-                     'Dragon': 0.5, 'Steel': 0.5},
-            'Ice': {'Fire': 0.5, 'Water': 0.5, 'Grass': 2.0, 'Ice': 0.5,
-                   'Ground': 2.0, 'Flying': 2.0, 'Dragon': 2.0, 'Steel': 0.5},
-            'Fighting': {'Normal': 2.0, 'Ice': 2.0, 'Poison': 0.5, 
-                        'Flying': 0.5, 'Psychic': 0.5, 'Bug': 0.5, 
-                        'Rock': 2.0, 'Ghost': 0, 'Dark': 2.0, 'Steel': 2.0,
-                        'Fairy': 0.5},
-            'Poison': {'Grass': 2.0, 'Poison': 0.5, 'Ground': 0.5, 
-                      'Rock': 0.5, 'Ghost': 0.5, 'Steel': 0, 'Fairy': 2.0},
-            'Ground': {'Fire': 2.0, 'Electric': 2.0, 'Grass': 0.5, 
-                      'Poison': 2.0, 'Flying': 0, 'Bug': 0.5, 'Rock': 2.0,
-                      'Steel': 2.0},
-            'Flying': {'Electric': 0.5, 'Grass': 2.0, 'Fighting': 2.0,
-                      'Bug': 2.0, 'Rock': 0.5, 'Steel': 0.5},
-            'Psychic': {'Fighting': 2.0, 'Poison': 2.0, 'Psychic': 0.5,
-                       'Dark': 0, 'Steel': 0.5},
-            'Bug': {'Fire': 0.5, 'Grass': 2.0, 'Fighting': 0.5, 'Poison': 0.5,
-                   'Flying': 0.5, 'Psychic': 2.0, 'Ghost': 0.5, 'Dark': 2.0,
-                   'Steel': 0.5, 'Fairy': 0.5},
-            'Rock': {'Fire': 2.0, 'Ice': 2.0, 'Fighting': 0.5, 'Ground': 0.5,
-                    'Flying': 2.0, 'Bug': 2.0, 'Steel': 0.5},
-            'Ghost': {'Normal': 0, 'Psychic': 2.0, 'Ghost': 2.0, 'Dark': 0.5},
-            'Dragon': {'Dragon': 2.0, 'Steel': 0.5, 'Fairy': 0},
-            'Dark': {'Fighting': 0.5, 'Psychic': 2.0, 'Ghost': 2.0,
-                    'Dark': 0.5, 'Fairy': 0.5},
-            'Steel': {'Fire': 0.5, 'Water': 0.5, 'Electric': 0.5, 'Ice': 2.0,
-                     'Rock': 2.0, 'Steel': 0.5, 'Fairy': 2.0},
-            'Fairy': {'Fire': 0.5, 'Fighting': 2.0, 'Poison': 0.5, 
-                     'Dragon': 2.0, 'Dark': 2.0, 'Steel': 0.5}
-        }
+        self.type_engine = get_type_engine()
     
     def get_type_effectiveness(self, attack_type: str, 
                                defend_types: list) -> float:
         """Calculate type effectiveness multiplier"""
-        multiplier = 1.0
-        
-        for defend_type in defend_types:
-            if attack_type in self.type_chart:
-                multiplier *= self.type_chart[attack_type].get(defend_type, 1.0)
-        
-        return multiplier
+        return self.type_engine.effectiveness(attack_type, defend_types)
     
     def calculate_damage(self, attacker: Dict, defender: Dict, 
                         move: Dict, modifiers: Dict) -> Dict:
         """
-        Calculate damage using Gen 5+ formula
+        Calculate damage using Gen 5+ formula, memoized on the canonical inputs
         
         Damage = ((2 * Level / 5 + 2) * Power * A/D / 50 + 2) * Modifiers
         """
-        level = attacker.get('level', 100)
+        return self.cache.get_or_compute(
+            battle_key('damage', attacker, defender, move, modifiers),
+            lambda: self._calculate_damage(attacker, defender, move, modifiers)
+        )
+    
+    def _calculate_damage(self, attacker: Dict, defender: Dict,
+                          move: Dict, modifiers: Dict) -> Dict:
+        """Uncached calculate_damage"""
         power = move.get('power', 0)
         
         if power == 0:
@@ -105,9 +95,54 @@ class DamageCalculator:
                 'min_damage': 0,
                 'max_damage': 0,
                 'percentage': "0%",
-                'effectiveness': "Status Move"
+                'effectiveness': "Status Move",
+                'type_multiplier': 1.0,
+                'ohko': False,
+                'twoko': False
             }
         
+        damage, effectiveness = self._base_damage(attacker, defender, move, modifiers)
+        
+        # Random factor (0.85 to 1.0)
+        min_damage = int(damage * 0.85)
+        max_damage = int(damage * 1.0)
+        avg_damage = int((min_damage + max_damage) / 2)
+        
+        # Calculate percentage of defender's HP
+        defender_hp = defender.get('hp', 100)
+        percentage = (avg_damage / defender_hp) * 100
+        
+        # Effectiveness description
+        if effectiveness == 0:
+            eff_text = "No Effect"
+        elif effectiveness < 0.5:
+            eff_text = "Not Very Effective (0.25x)"
+        elif effectiveness == 0.5:
+            eff_text = "Not Very Effective (0.5x)"
+        elif effectiveness == 1.0:
+            eff_text = "Neutral"
+        elif effectiveness == 2.0:
+            eff_text = "Super Effective! (2x)"
+        else:
+            eff_text = "Super Effective! (4x)"
+        
+        return {
+            'damage': avg_damage,
+            'min_damage': min_damage,
+            'max_damage': max_damage,
+            'percentage': f"{percentage:.1f}%",
+            'effectiveness': eff_text,
+            'type_multiplier': effectiveness,
+            'ohko': avg_damage >= defender_hp,
+            'twoko': (avg_damage * 2) >= defender_hp
+        }
+    
+    def _base_damage(self, attacker: Dict, defender: Dict,
+                     move: Dict, modifiers: Dict) -> Tuple[float, float]:
+        """Damage before the random factor, and the type multiplier"""
+        level = attacker.get('level', 100)
+        power = move.get('power', 0)
+        
         # Determine if Physical or Special
         category = move.get('category', 'Physical')
         
@@ -157,40 +192,131 @@ class DamageCalculator:
         if modifiers.get('critical', False):
             damage *= 1.5
         
-        # Random factor (0.85 to 1.0)
-        min_damage = int(damage * 0.85)
-        max_damage = int(damage * 1.0)
-        avg_damage = int((min_damage + max_damage) / 2)
-        
-        # Calculate percentage of defender's HP
+        return damage, effectiveness
+    
+    def damage_distribution(self, attacker: Dict, defender: Dict, move: Dict,
+                            modifiers: Dict, crit_chance: float = DEFAULT_CRIT_CHANCE,
+                            max_hits: int = 4) -> Dict:
+        """
+        Exact damage rolls and KO chances for repeated hits
+        
+        Args:
+            attacker: Attacker stats and types
+            defender: Defender stats and types
+            move: Move to use
+            modifiers: Same as calculate_damage; 'critical' forces a crit every hit
+            crit_chance: Critical hit chance per hit when not forced
+            max_hits: Number of hits to evaluate
+        
+        Returns:
+            dict: rolls and crit_rolls (16 values each), percent_rolls,
+            ko_chances (index n-1 = KO within n hits) and an nHKO summary
+        """
+        return self.cache.get_or_compute(
+            battle_key('distribution', attacker, defender, move, modifiers, crit_chance, max_hits),
+            lambda: self._damage_distribution(attacker, defender, move, modifiers,
+                                              crit_chance, max_hits)
+        )
+    
+    def _damage_distribution(self, attacker: Dict, defender: Dict, move: Dict,
+                             modifiers: Dict, crit_chance: float, max_hits: int) -> Dict:
+        """Uncached damage_distribution"""
         defender_hp = defender.get('hp', 100)
-        percentage = (avg_damage / defender_hp) * 100
-        
-        # Effectiveness description
-        if effectiveness == 0:
-            eff_text = "No Effect"
-        elif effectiveness < 0.5:
-            eff_text = "Not Very Effective (0.25x)"
-        elif effectiveness == 0.5:
-            eff_text = "Not Very Effective (0.5x)"
-        elif effectiveness == 1.0:
-            eff_text = "Neutral"
-        elif effectiveness == 2.0:
-            eff_text = "Super Effective! (2x)"
+        if not move.get('power'):
+            rolls = crit_rolls = np.zeros(16, dtype=np.int64)
         else:
-            eff_text = "Super Effective! (4x)"
+            normal, _ = self._base_damage(attacker, defender, move,
+                                          {**modifiers, 'critical': False})
+            crit, _ = self._base_damage(attacker, defender, move,
+                                        {**modifiers, 'critical': True})
+            rolls, crit_rolls = damage_rolls(normal), damage_rolls(crit)
         
+        if modifiers.get('critical', False):
+            rolls, crit_chance = crit_rolls, 1.0
+        
+        chances = ko_chances(rolls, crit_rolls, defender_hp,
+                             crit_chance=crit_chance, max_hits=max_hits)
         return {
-            'damage': avg_damage,
-            'min_damage': min_damage,
-            'max_damage': max_damage,
-            'percentage': f"{percentage:.1f}%",
-            'effectiveness': eff_text,
-            'type_multiplier': effectiveness,
-            'ohko': avg_damage >= defender_hp,
-            'twoko': (avg_damage * 2) >= defender_hp
+            'rolls': rolls.tolist(),
+            'crit_rolls': crit_rolls.tolist(),
+            'percent_rolls': [round(r / defender_hp * 100, 1) for r in rolls.tolist()],
+            'crit_chance': crit_chance,
+            'ko_chances': chances,
+            'summary': self._nhko_summary(chances)
+        }
+    
+    @staticmethod
+    def _nhko_summary(chances: List[float]) -> str:
+        """Describe the first hit count with any chance to KO"""
+        for hits, chance in enumerate(chances, start=1):
+            if chance >= 1.0 - 1e-9:
+                return f"Guaranteed {hits}HKO"
+            if chance > 0:
+                return f"{chance * 100:.1f}% chance to {hits}HKO"
+        return f"Not a {len(chances)}HKO"
+    
+    def sweep(self, attacker: Dict, move: Dict, modifiers: Dict,
+              tier: Optional[str] = None,
+              defender_spread: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        Damage of one attacker and move against every defender at once
+        
+        Args:
+            attacker: Attacker stats and types
+            move: Move to use
+            modifiers: Same as calculate_damage
+            tier: Restrict defenders to a competitive tier (default: whole dex)
+            defender_spread: evs / nature / ivs / level applied to every
+                defender (default: raw base stats)
+        
+        Returns:
+            DataFrame with one row per defender, highest damage first
+        """
+        return self.cache.get_or_compute(
+            battle_key('sweep', attacker, None, move, modifiers, tier, defender_spread),
+            lambda: self._sweep(attacker, move, modifiers, tier, defender_spread)
+        )
+    
+    def _sweep(self, attacker: Dict, move: Dict, modifiers: Dict,
+               tier: Optional[str], defender_spread: Optional[Dict]) -> pd.DataFrame:
+        """Uncached sweep"""
+        engine = self.damage_engine
+        if tier:
+            tier_data = self.catalog.tier_data()
+            engine = engine.subset(tier_data.loc[tier_data['tier'] == tier, 'name'])
+        if defender_spread:
+            engine = DamageEngine(
+                self.stat_engine.frame(engine.defenders, **defender_spread),
+                engine.type_engine
+            )
+        return engine.sweep_frame(attacker, move, modifiers)
+    
+    def cache_stats(self) -> Dict[str, Dict]:
+        """Hit/miss counters of the calculator's caches, for the performance profiler"""
+        ko = ko_cache_info()
+        return {
+            'damage_calculator': self.cache.info(),
+            'ko_chances': {'hits': ko.hits, 'misses': ko.misses,
+                           'size': ko.currsize, 'maxsize': ko.maxsize}
         }
     
+    def optimize_evs(self, defender: Dict, threats: List[Dict], nature: Optional[str] = None,
+                     target: float = 0.9, **kwargs) -> Dict:
+        """
+        Fewest HP/Def/SpD EVs for a defender to survive every threat
+        
+        Args:
+            defender: Defender base stats and types
+            threats: Dicts of attacker, move and optional modifiers
+            nature: Defender nature
+            target: Required probability of surviving each hit
+            **kwargs: ivs, level, crit_chance, top_n (see EVOptimizer.optimize)
+        
+        Returns:
+            Dictionary with the spread, its stats and per-threat survival
+        """
+        return self.ev_optimizer.optimize(defender, threats, nature, target, **kwargs)
+    
     def _get_stat_multiplier(self, boost: int) -> float:
         """Convert stat boost/drop to multiplier"""
         if boost >= 0:
@@ -228,9 +354,112 @@ class DamageCalculator:
             if attacker and defender and move:
                 result = self.calculate_damage(attacker, defender, 
                                                move, modifiers)
-                self._display_results(result, attacker, defender, move)
+                distribution = self.damage_distribution(attacker, defender,
+                                                        move, modifiers)
+                self._display_results(result, attacker, defender, move,
+                                      distribution)
             else:
                 st.error("Please select attacker, defender, and move")
+        
+        st.divider()
+        
+        # One attacker and move against every defender
+        if attacker and move:
+            self._render_sweep(attacker, move, modifiers)
+        
+        if defender:
+            st.divider()
+            self._render_ev_optimizer(attacker, defender, move, modifiers)
+    
+    def _render_sweep(self, attacker: Dict, move: Dict, modifiers: Dict):
+        """Render the one-vs-all damage table"""
+        st.subheader(f"🎯 {move['name']} vs Every Defender")
+        
+        try:
+            tiers = sorted(self.catalog.tier_data()['tier'].dropna().unique())
+        except Exception:
+            tiers = []
+        pool_col, spread_col = st.columns(2)
+        with pool_col:
+            pool = st.selectbox("Defender Pool", ["All Pokemon"] + tiers, key="sweep_pool")
+        with spread_col:
+            spread = st.selectbox("Defender Spread", list(DEFENDER_SPREADS), key="sweep_spread")
+        
+        results = self.sweep(attacker, move, modifiers,
+                             tier=None if pool == "All Pokemon" else pool,
+                             defender_spread=DEFENDER_SPREADS[spread])
+        if results.empty:
+            st.info("No defenders in this pool")
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Defenders", len(results))
+        col2.metric("Guaranteed OHKO", int(results['ohko_guaranteed'].sum()))
+        col3.metric("2HKO (avg roll)", int(results['twoko'].sum()))
+        
+        display_df = pd.DataFrame({
+            'Defender': results['name'],
+            'Damage': results['min_damage'].astype(str) + ' - ' + results['max_damage'].astype(str),
+            '% HP': results['min_percent'].round(1).astype(str) + ' - ' + results['max_percent'].round(1).astype(str),
+            'Type': results['type_multiplier'].map(lambda m: f"{m:g}x"),
+            'OHKO': results['ohko_guaranteed']
+        })
+        st.dataframe(display_df, use_container_width=True, hide_index=True, height=400)
+    
+    def _render_ev_optimizer(self, attacker: Optional[Dict], defender: Dict,
+                             move: Optional[Dict], modifiers: Dict):
+        """Render the defensive EV spread optimizer"""
+        st.subheader(f"🛡️ EV Spread Optimizer for {defender['name']}")
+        st.caption("Fewest HP / Def / Sp. Def EVs that survive every listed attack")
+        
+        if 'ev_threats' not in st.session_state:
+            st.session_state.ev_threats = []
+        threats = st.session_state.ev_threats
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("➕ Add Current Attack", disabled=not (attacker and move),
+                         key="ev_add_threat"):
+                threats.append({'attacker': dict(attacker), 'move': dict(move),
+                                'modifiers': dict(modifiers)})
+        with col2:
+            if st.button("🗑️ Clear Attacks", key="ev_clear_threats"):
+                threats.clear()
+        
+        if not threats:
+            st.info("Add the attacks this Pokemon should survive")
+            return
+        
+        for threat in threats:
+            st.write(f"• {threat['attacker']['name']} — {threat['move']['name']}")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            nature = st.selectbox("Nature", self.stat_engine.nature_names, key="ev_nature")
+        with col2:
+            target = st.slider("Survival Chance per Hit", 0.5, 1.0, 0.9, 0.05, key="ev_target")
+        
+        # Base stats, even if final stats were applied to the defender above
+        base = self.pokemon_index.row(defender['name']).to_dict()
+        result = self.optimize_evs(base, threats, nature, target,
+                                   level=defender.get('level', 100))
+        
+        if result['feasible']:
+            st.success(f"✅ {result['total']} EVs needed, {result['remaining']} left to spend")
+        else:
+            st.warning(f"⚠️ No legal spread reaches {target:.0%}; "
+                       f"the best gives {result['worst']:.1%} against the worst attack")
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("HP", result['stats']['hp'], f"{result['evs']['hp']} EVs", delta_color="off")
+        col2.metric("Defense", result['stats']['defense'], f"{result['evs']['defense']} EVs", delta_color="off")
+        col3.metric("Sp. Def", result['stats']['sp_defense'], f"{result['evs']['sp_defense']} EVs", delta_color="off")
+        
+        st.dataframe(pd.DataFrame({
+            'Attacker': [t['attacker']['name'] for t in threats],
+            'Move': [t['move']['name'] for t in threats],
+            'Survival': [f"{p:.1%}" for p in result['survival']]
+        }), use_container_width=True, hide_index=True)
     
     def _render_pokemon_selector(self, key: str) -> Optional[Dict]:
         """Render Pokemon selection interface"""
@@ -243,9 +472,7 @@ class DamageCalculator:
         )
         
         if selected:
-            pokemon = self.pokemon_data[
-                self.pokemon_data['name'] == selected
-            ].iloc[0].to_dict()
+            pokemon = self.pokemon_index.row(selected).to_dict()
             
             # Display stats
             with st.expander("📊 View Stats"):
@@ -276,6 +503,29 @@ class DamageCalculator:
                 key=f"{key}_level"
             )
             
+            # Final stats from EVs, IVs and nature instead of base stats
+            with st.expander("🧬 EVs, IVs & Nature"):
+                if st.checkbox("Use final stats", key=f"{key}_use_spread"):
+                    nature = st.selectbox(
+                        "Nature", self.stat_engine.nature_names, key=f"{key}_nature"
+                    )
+                    iv = st.number_input("IVs (all stats)", 0, MAX_IV, MAX_IV,
+                                         key=f"{key}_ivs")
+                    ev_cols = st.columns(3)
+                    evs = {}
+                    labels = ["HP", "Attack", "Defense", "Sp. Atk", "Sp. Def", "Speed"]
+                    for i, (stat, label) in enumerate(zip(STATS, labels)):
+                        with ev_cols[i % 3]:
+                            evs[stat] = st.number_input(
+                                f"{label} EVs", 0, MAX_EV, 0, step=4,
+                                key=f"{key}_ev_{stat}"
+                            )
+                    if sum(evs.values()) > MAX_TOTAL_EVS:
+                        st.warning(f"⚠️ More than {MAX_TOTAL_EVS} EVs assigned")
+                    
+                    pokemon = self.stat_engine.apply(pokemon, evs, nature, iv)
+                    st.caption(" / ".join(f"{pokemon[stat]}" for stat in STATS))
+            
             return pokemon
         
         return None
@@ -291,7 +541,7 @@ class DamageCalculator:
         # Get moves for this Pokemon
         pokemon_moves = []
         if pokemon_name in self.movesets:
-            pokemon_moves = self.movesets[pokemon_name].get('moves', [])
+            pokemon_moves = self.movesets.moveset(pokemon_name)
         
         if not pokemon_moves:
             st.warning("No moveset data available")
@@ -393,7 +643,8 @@ class DamageCalculator:
         return modifiers
     
     def _display_results(self, result: Dict, attacker: Dict, 
-                        defender: Dict, move: Dict):
+                        defender: Dict, move: Dict,
+                        distribution: Optional[Dict] = None):
         """Display calculation results"""
         st.success("✅ Damage Calculated!")
         
@@ -425,6 +676,21 @@ class DamageCalculator:
             if result['twoko']:
                 st.success("💥 **2HKO** (Two-Hit KO)")
         
+        # Exact roll distribution
+        if distribution:
+            st.markdown(f"**{distribution['summary']}** "
+                        f"(crit chance {distribution['crit_chance']:.1%})")
+            ko_cols = st.columns(len(distribution['ko_chances']))
+            for hits, (col, chance) in enumerate(
+                    zip(ko_cols, distribution['ko_chances']), start=1):
+                col.metric(f"{hits}HKO", f"{chance * 100:.1f}%")
+            
+            with st.expander("🎲 All 16 Damage Rolls"):
+                st.write("**Rolls:** " + ', '.join(map(str, distribution['rolls'])))
+                st.write("**% HP:** " + ', '.join(map(str, distribution['percent_rolls'])))
+                st.write("**Critical rolls:** " +
+                         ', '.join(map(str, distribution['crit_rolls'])))
+        
         # Detailed breakdown
         with st.expander("📊 Detailed Breakdown"):
             st.write(f"**Attacker:** {attacker['name']} (Lv. {attacker['level']})")
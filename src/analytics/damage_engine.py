@@ -0,0 +1,223 @@
+"""
+Vectorized Damage Engine
+One attacker and move against every defender in a pool, computed over NumPy arrays
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from type_engine import get_type_engine, TypeEngine, NO_TYPE
+
+# Random factor bounds of the damage roll
+MIN_ROLL = 0.85
+MAX_ROLL = 1.0
+
+CRITICAL_MULTIPLIER = 1.5
+
+# The 16 discrete random factors, 0.85 to 1.00
+ROLL_FACTORS = np.arange(85, 101) / 100
+
+# Critical hit chance at the default stage (Gen 7+)
+DEFAULT_CRIT_CHANCE = 1 / 24
+
+
+def stat_stage_multiplier(boost):
+    """Multiplier of a stat stage from -6 to +6 (scalar or array)"""
+    boost = np.asarray(boost)
+    return np.where(boost >= 0, (2 + boost) / 2, 2 / (2 - np.minimum(boost, 0)))
+
+
+def damage_rolls(damage) -> np.ndarray:
+    """
+    The 16 possible damage values of a hit (scalar or array of pre-roll damage)
+
+    Returns:
+        int64 array with a trailing axis of 16, lowest roll first; the first
+        and last rolls equal min_damage and max_damage of the calculators
+    """
+    damage = np.asarray(damage, dtype=np.float64)
+    return np.trunc(damage[..., None] * ROLL_FACTORS).astype(np.int64)
+
+
+@lru_cache(maxsize=4096)
+def _ko_chances(rolls: Tuple[int, ...], crit_rolls: Tuple[int, ...], hp: int,
+                crit_chance: float, max_hits: int) -> Tuple[float, ...]:
+    """Cached core of ko_chances on canonical (hashable) inputs"""
+    # Single-hit distribution over damage 0..hp, with every lethal amount lumped at hp
+    hit = np.zeros(hp + 1)
+    np.add.at(hit, np.minimum(rolls, hp), (1 - crit_chance) / len(rolls))
+    np.add.at(hit, np.minimum(crit_rolls, hp), crit_chance / len(crit_rolls))
+
+    total = hit
+    chances = [float(total[hp])]
+    for _ in range(1, max_hits):
+        total = np.convolve(total, hit)
+        total[hp] = total[hp:].sum()
+        total = total[:hp + 1]
+        chances.append(float(min(total[hp], 1.0)))
+    return tuple(chances)
+
+
+def ko_chances(rolls: Sequence[int], crit_rolls: Sequence[int], hp: int,
+               crit_chance: float = DEFAULT_CRIT_CHANCE, max_hits: int = 4) -> List[float]:
+    """
+    Exact probability of a KO within 1..max_hits hits
+
+    Each hit independently crits with crit_chance and then takes one of its
+    rolls uniformly; the n-hit damage distribution is the n-fold convolution
+    of the single-hit one. Results are cached on the canonical inputs (sorted
+    integer rolls, HP, crit chance, hits), so repeated queries are lookups.
+
+    Args:
+        rolls: Non-critical damage rolls (see damage_rolls)
+        crit_rolls: Critical damage rolls
+        hp: Defender HP
+        crit_chance: Probability of a critical hit
+        max_hits: Number of hits to evaluate
+
+    Returns:
+        list: chances[n - 1] is the probability of a KO in n hits or fewer
+    """
+    hp = int(hp)
+    if hp <= 0:
+        return [1.0] * max_hits
+    return list(_ko_chances(
+        tuple(sorted(int(r) for r in rolls)),
+        tuple(sorted(int(r) for r in crit_rolls)),
+        hp,
+        round(float(crit_chance), 6),
+        int(max_hits)
+    ))
+
+
+def ko_cache_info():
+    """Hit/miss statistics of the KO probability cache"""
+    return _ko_chances.cache_info()
+
+
+class DamageEngine:
+    """
+    Defender pool as arrays, swept by one attacker and move at a time
+
+    Follows DamageCalculator.calculate_damage step for step, including where
+    it truncates to integers, so a sweep row equals the single calculation.
+    """
+
+    def __init__(self, defenders: pd.DataFrame, type_engine: Optional[TypeEngine] = None):
+        """
+        Initialize the pool
+
+        Args:
+            defenders: Dex rows with name, hp, defense, sp_defense and
+                type_combo_id (or type_1/type_2)
+            type_engine: Type engine (default: the shared engine)
+        """
+        self.type_engine = type_engine or get_type_engine()
+        self.defenders = defenders
+        self.names = defenders['name'].to_numpy()
+        self.hp = defenders['hp'].to_numpy(dtype=np.float64)
+        self.defense = defenders['defense'].to_numpy(dtype=np.float64)
+        self.sp_defense = defenders['sp_defense'].to_numpy(dtype=np.float64)
+
+        if 'type_combo_id' in defenders.columns:
+            self.combo_ids = defenders['type_combo_id'].to_numpy()
+        else:
+            type_2 = defenders['type_2'] if 'type_2' in defenders.columns else [None] * len(defenders)
+            self.combo_ids = self.type_engine.combo_ids(defenders['type_1'], type_2)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def subset(self, names: Iterable[str]) -> 'DamageEngine':
+        """Engine over the defenders whose names are in `names` (e.g. a tier pool)"""
+        return DamageEngine(
+            self.defenders[self.defenders['name'].isin(list(names))],
+            self.type_engine
+        )
+
+    def type_multipliers(self, move_type: str) -> np.ndarray:
+        """Type effectiveness of a move type against every defender"""
+        attack = self.type_engine.index(move_type)
+        if attack == NO_TYPE:
+            return np.ones(len(self), dtype=np.float64)
+        return self.type_engine.combo_profile(self.combo_ids)[:, attack].astype(np.float64)
+
+    def base_damage(self, attacker: Dict, move: Dict, modifiers: Optional[Dict] = None) -> np.ndarray:
+        """
+        Damage before the random roll against every defender
+
+        Args:
+            attacker: Attacker stats, types and optional level
+            move: Move with power, type and category
+            modifiers: Same keys as DamageCalculator.calculate_damage
+
+        Returns:
+            float64 array, zeros for status moves
+        """
+        modifiers = modifiers or {}
+        level = attacker.get('level', 100)
+        power = move.get('power', 0) or 0
+        if power == 0:
+            return np.zeros(len(self), dtype=np.float64)
+
+        if move.get('category', 'Physical') == 'Physical':
+            attack_stat = attacker.get('attack', 100)
+            defense_stat = self.defense
+        else:
+            attack_stat = attacker.get('sp_attack', 100)
+            defense_stat = self.sp_defense
+
+        # Stat stages, truncated like int() in the single calculation
+        attack_stat = int(attack_stat * stat_stage_multiplier(modifiers.get('attack_boost', 0)))
+        defense_stat = np.trunc(defense_stat * stat_stage_multiplier(modifiers.get('defense_boost', 0)))
+
+        damage = ((2 * level / 5 + 2) * power * attack_stat / defense_stat) / 50 + 2
+
+        move_type = move.get('type', 'Normal')
+        if move_type in [attacker.get('type_1'), attacker.get('type_2')]:
+            damage = damage * modifiers.get('stab', 1.5)
+
+        damage = damage * self.type_multipliers(move_type)
+        damage = damage * modifiers.get('weather', 1.0)
+        damage = damage * modifiers.get('item', 1.0)
+        damage = damage * modifiers.get('ability', 1.0)
+        if modifiers.get('critical', False):
+            damage = damage * CRITICAL_MULTIPLIER
+        return damage
+
+    def sweep(self, attacker: Dict, move: Dict, modifiers: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+        """
+        Damage of one attacker and move against every defender
+
+        Returns:
+            dict of arrays aligned with self.names: min_damage, max_damage,
+            damage (average of the two), percent / min_percent / max_percent of
+            the defender's HP, type_multiplier, ohko / twoko (average roll, as
+            in the single calculation) and ohko_guaranteed (lowest roll)
+        """
+        damage = self.base_damage(attacker, move, modifiers)
+        min_damage = np.trunc(damage * MIN_ROLL).astype(np.int64)
+        max_damage = np.trunc(damage * MAX_ROLL).astype(np.int64)
+        avg_damage = (min_damage + max_damage) // 2
+
+        return {
+            'name': self.names,
+            'min_damage': min_damage,
+            'max_damage': max_damage,
+            'damage': avg_damage,
+            'percent': avg_damage / self.hp * 100,
+            'min_percent': min_damage / self.hp * 100,
+            'max_percent': max_damage / self.hp * 100,
+            'type_multiplier': self.type_multipliers(move.get('type', 'Normal')),
+            'ohko': avg_damage >= self.hp,
+            'twoko': avg_damage * 2 >= self.hp,
+            'ohko_guaranteed': min_damage >= self.hp
+        }
+
+    def sweep_frame(self, attacker: Dict, move: Dict, modifiers: Optional[Dict] = None) -> pd.DataFrame:
+        """sweep() as a DataFrame sorted by damage percent, highest first"""
+        result = pd.DataFrame(self.sweep(attacker, move, modifiers))
+        return result.sort_values('percent', ascending=False, kind='stable').reset_index(drop=True)
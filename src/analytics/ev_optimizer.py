@@ -0,0 +1,170 @@
+"""
+Defensive EV Optimizer
+Minimal HP/Def/SpD EV spreads that survive a set of attacks with a target probability
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from damage_engine import DamageEngine, damage_rolls, DEFAULT_CRIT_CHANCE
+from stat_engine import StatEngine, STATS, MAX_IV, MAX_EV, calculate_stats, stat_vector
+from type_engine import get_type_engine, TypeEngine
+
+EV_STEP = 4
+
+# 510 total EVs, of which only multiples of 4 affect stats
+MAX_SPREAD_EVS = 508
+
+
+class EVOptimizer:
+    """
+    Exhaustive search over defensive EV spreads, evaluated as arrays
+
+    Physical attacks only depend on HP and Defense and special attacks only on
+    HP and Sp. Def, so each threat is evaluated on a 2-D (HP, Def) or (HP, SpD)
+    grid and the grids are combined by broadcasting instead of evaluating
+    every 3-D spread. EV amounts that do not raise the stat over the previous
+    step (common below level 100) are pruned from each axis first.
+    """
+
+    def __init__(self, stat_engine: StatEngine, type_engine: Optional[TypeEngine] = None):
+        """
+        Initialize the optimizer
+
+        Args:
+            stat_engine: Stat engine providing the nature table
+            type_engine: Type engine (default: the shared engine)
+        """
+        self.stat_engine = stat_engine
+        self.type_engine = type_engine or get_type_engine()
+
+    def _stat_axis(self, base: np.ndarray, ivs: np.ndarray, modifiers: np.ndarray,
+                   level: int, stat: str):
+        """EV amounts worth investing in one stat and the stats they give"""
+        i = STATS.index(stat)
+        evs = np.arange(0, MAX_EV + 1, EV_STEP)
+        spreads = np.zeros((len(evs), len(STATS)), dtype=np.int64)
+        spreads[:, i] = evs
+        values = calculate_stats(base, ivs, spreads, modifiers, level)[:, i]
+        keep = np.r_[True, values[1:] != values[:-1]]
+        return evs[keep], values[keep]
+
+    def _survival(self, defender: Dict, hp: np.ndarray, bulk: np.ndarray,
+                  threats: List[Dict], crit_chance: float) -> np.ndarray:
+        """
+        Probability of surviving each threat on an (HP, bulk) grid
+
+        Returns:
+            float64 array, (threat, len(hp), len(bulk))
+        """
+        grid_hp, grid_bulk = np.meshgrid(hp, bulk, indexing='ij')
+        engine = DamageEngine(pd.DataFrame({
+            'name': np.arange(grid_hp.size),
+            'hp': grid_hp.ravel(),
+            'defense': grid_bulk.ravel(),
+            'sp_defense': grid_bulk.ravel(),
+            'type_1': defender.get('type_1'),
+            'type_2': defender.get('type_2')
+        }), self.type_engine)
+
+        result = np.ones((len(threats), grid_hp.size))
+        hp_column = engine.hp[:, None]
+        for t, threat in enumerate(threats):
+            modifiers = dict(threat.get('modifiers') or {})
+            forced_crit = modifiers.pop('critical', False)
+            crit = damage_rolls(engine.base_damage(
+                threat['attacker'], threat['move'], {**modifiers, 'critical': True}
+            ))
+            p_ko_crit = (crit >= hp_column).mean(axis=1)
+            if forced_crit:
+                p_ko = p_ko_crit
+            else:
+                rolls = damage_rolls(engine.base_damage(threat['attacker'], threat['move'], modifiers))
+                p_ko = (1 - crit_chance) * (rolls >= hp_column).mean(axis=1) + crit_chance * p_ko_crit
+            result[t] = 1 - p_ko
+        return result.reshape(len(threats), len(hp), len(bulk))
+
+    def optimize(self, defender: Dict, threats: List[Dict], nature: Optional[str] = None,
+                 target: float = 0.9, ivs=MAX_IV, level: Optional[int] = None,
+                 crit_chance: float = DEFAULT_CRIT_CHANCE, top_n: int = 5) -> Dict:
+        """
+        Find the fewest HP/Def/SpD EVs that survive every threat
+
+        Args:
+            defender: Defender with base stats and types
+            threats: Dicts of attacker (final stats, types, level), move and
+                optional modifiers (as in DamageCalculator.calculate_damage)
+            nature: Defender nature (default: neutral)
+            target: Required probability of surviving each single hit
+            ivs: Defender IVs, scalar or stat dict
+            level: Defender level (default: defender['level'] or 100)
+            crit_chance: Critical hit chance of every threat
+            top_n: Number of alternative spreads returned
+
+        Returns:
+            dict: feasible, evs, total, remaining, stats, survival (per
+            threat), target and alternatives (next best spreads). When no
+            spread reaches the target, evs is the spread with the best
+            worst-case survival.
+        """
+        level = int(level if level is not None else defender.get('level', 100))
+        base = stat_vector({stat: defender[stat] for stat in STATS})
+        ivs = stat_vector(ivs, MAX_IV)
+        modifiers = self.stat_engine.nature_modifiers([nature])[0] if nature else np.ones(len(STATS))
+
+        hp_evs, hp = self._stat_axis(base, ivs, modifiers, level, 'hp')
+        def_evs, defense = self._stat_axis(base, ivs, modifiers, level, 'defense')
+        spd_evs, sp_defense = self._stat_axis(base, ivs, modifiers, level, 'sp_defense')
+
+        is_physical = [t['move'].get('category', 'Physical') == 'Physical' for t in threats]
+        physical = [t for t, p in zip(threats, is_physical) if p]
+        special = [t for t, p in zip(threats, is_physical) if not p]
+        # Row of each threat within its category's survival array
+        rows = np.cumsum(is_physical) - 1, np.cumsum(np.logical_not(is_physical)) - 1
+        phys_survival = self._survival(defender, hp, defense, physical, crit_chance)
+        spec_survival = self._survival(defender, hp, sp_defense, special, crit_chance)
+
+        # Worst case over threats, then over both categories for every (hp, def, spd)
+        phys_worst = phys_survival.min(axis=0, initial=1.0)
+        spec_worst = spec_survival.min(axis=0, initial=1.0)
+        worst = np.minimum(phys_worst[:, :, None], spec_worst[:, None, :])
+        total = hp_evs[:, None, None] + def_evs[None, :, None] + spd_evs[None, None, :]
+        legal = total <= MAX_SPREAD_EVS
+
+        feasible = legal & (worst >= target - 1e-9)
+        candidates = np.flatnonzero(feasible if feasible.any() else legal)
+        if feasible.any():
+            # Fewest EVs first, then the safest, then the most HP
+            order = np.lexsort((
+                -hp_evs[np.unravel_index(candidates, total.shape)[0]],
+                -worst.ravel()[candidates],
+                total.ravel()[candidates]
+            ))
+        else:
+            order = np.lexsort((total.ravel()[candidates], -worst.ravel()[candidates]))
+        ranked = candidates[order[:top_n + 1]]
+
+        spreads = []
+        for flat in ranked:
+            h, d, s = np.unravel_index(flat, total.shape)
+            spreads.append({
+                'evs': {'hp': int(hp_evs[h]), 'defense': int(def_evs[d]), 'sp_defense': int(spd_evs[s])},
+                'total': int(total[h, d, s]),
+                'remaining': MAX_SPREAD_EVS - int(total[h, d, s]),
+                'stats': {'hp': int(hp[h]), 'defense': int(defense[d]), 'sp_defense': int(sp_defense[s])},
+                'survival': [
+                    float(phys_survival[rows[0][t], h, d] if p else spec_survival[rows[1][t], h, s])
+                    for t, p in enumerate(is_physical)
+                ],
+                'worst': float(worst[h, d, s])
+            })
+
+        best = spreads[0]
+        return {
+            'feasible': bool(feasible.any()),
+            **best,
+            'target': target,
+            'alternatives': spreads[1:top_n + 1]
+        }
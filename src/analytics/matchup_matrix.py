@@ -0,0 +1,316 @@
+"""
+Tier Matchup Matrices
+All-pairs best damage, KO hits and speed comparison per competitive tier, built in chunks
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from data_catalog import DataCatalog, get_data_catalog
+from damage_engine import DamageEngine
+from stat_engine import STATS, MAX_IV, calculate_stats
+from type_engine import get_type_engine, NO_TYPE
+
+# Bump when the artifact layout or the matchup model changes so every tier rebuilds
+MATCHUP_VERSION = 1
+
+# Power of the stand-in STAB attacks used when a Pokemon has no damaging moves on record
+STAB_FALLBACK_POWER = 90
+
+# Everyone is compared at level 100 with 31 IVs, no EVs and a neutral nature
+MATCHUP_LEVEL = 100
+
+# ko_hits value for an attacker that cannot damage the defender
+NO_KO = 0
+
+DAMAGE_COLUMNS = ['name', 'type_1', 'type_2'] + STATS
+
+
+class MatchupMatrix:
+    """
+    N x N matchups of one tier, indexed [attacker, defender]
+
+    best_percent: average damage of the attacker's best move, % of defender HP
+    best_move: name of that move
+    ko_hits: hits of that move needed to KO (NO_KO when it does no damage)
+    speed: +1 when the attacker outspeeds, -1 when it is slower, 0 on a tie
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Wrap artifact arrays (see compute_matchups / load)
+
+        Args:
+            arrays: names, best_percent, best_move, ko_hits, speed, input_hash
+        """
+        self.arrays = arrays
+        self.names = arrays['names'].tolist()
+        self.best_percent = arrays['best_percent']
+        self.best_move = arrays['best_move']
+        self.ko_hits = arrays['ko_hits']
+        self.speed = arrays['speed']
+        self.input_hash = str(arrays['input_hash'])
+        self._rows = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def save(self, path: Path):
+        """Atomically write the matrix as a compressed .npz file"""
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp_path, **self.arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'MatchupMatrix':
+        """Read a matrix written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def lookup(self, attacker: str, defender: str) -> Optional[Dict]:
+        """One matchup as a dict, or None if either Pokemon is not in the tier"""
+        a, d = self._rows.get(attacker), self._rows.get(defender)
+        if a is None or d is None:
+            return None
+        return {
+            'attacker': attacker,
+            'defender': defender,
+            'best_percent': float(self.best_percent[a, d]),
+            'best_move': str(self.best_move[a, d]),
+            'ko_hits': int(self.ko_hits[a, d]),
+            'speed': int(self.speed[a, d])
+        }
+
+    def counters(self, defender: str, top_n: int = 10) -> pd.DataFrame:
+        """Tier members that hit a defender hardest, best first"""
+        d = self._rows.get(defender)
+        if d is None:
+            return pd.DataFrame(columns=['name', 'best_percent', 'best_move', 'ko_hits', 'speed'])
+        result = pd.DataFrame({
+            'name': self.names,
+            'best_percent': self.best_percent[:, d],
+            'best_move': self.best_move[:, d],
+            'ko_hits': self.ko_hits[:, d],
+            'speed': self.speed[:, d]
+        })
+        result = result[result['name'] != defender]
+        return result.nlargest(top_n, 'best_percent').reset_index(drop=True)
+
+
+def attack_moves(pokemon: Dict, moveset: Iterable[Dict]) -> List[Dict]:
+    """
+    Damaging moves an attacker is evaluated with
+
+    Falls back to a physical and a special STAB attack of STAB_FALLBACK_POWER
+    per type when the moveset has no damaging moves.
+    """
+    moves = [
+        {key: move.get(key) for key in ('name', 'type', 'category', 'power')}
+        for move in moveset
+        if (move.get('power') or 0) > 0 and move.get('category') != 'Status'
+    ]
+    if moves:
+        return moves
+
+    engine = get_type_engine()
+    types = [t for t in (pokemon.get('type_1'), pokemon.get('type_2'))
+             if isinstance(t, str) and engine.index(t) != NO_TYPE]
+    return [
+        {'name': f"{move_type} STAB ({category})", 'type': move_type,
+         'category': category, 'power': STAB_FALLBACK_POWER}
+        for move_type in types for category in ('Physical', 'Special')
+    ]
+
+
+def tier_pool(pokemon: pd.DataFrame, names: Iterable[str]) -> pd.DataFrame:
+    """Dex rows of a tier's members, first row per name, with final stats at MATCHUP_LEVEL"""
+    pool = pokemon[pokemon['name'].isin(list(names))].drop_duplicates('name')
+    pool = pool[DAMAGE_COLUMNS].sort_values('name', kind='stable').reset_index(drop=True)
+    pool[STATS] = calculate_stats(pool[STATS].to_numpy(dtype=np.int64), MAX_IV, 0, 1.0, MATCHUP_LEVEL)
+    return pool
+
+
+def input_hash(pool: pd.DataFrame, moves: List[List[Dict]]) -> str:
+    """Fingerprint of everything a tier's matrix depends on"""
+    digest = hashlib.sha256()
+    digest.update(f"v{MATCHUP_VERSION}:{STAB_FALLBACK_POWER}:{MATCHUP_LEVEL}".encode())
+    digest.update(pool.to_csv(index=False).encode())
+    digest.update(json.dumps(moves, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:16]
+
+
+def _matchup_rows(pool: pd.DataFrame, rows: List[int], moves: List[List[Dict]]) -> Dict:
+    """Matchup rows of some attackers against the whole pool (one process pool task)"""
+    engine = DamageEngine(pool)
+    hp = pool['hp'].to_numpy(dtype=np.int64)
+    best_percent = np.zeros((len(rows), len(pool)), dtype=np.float32)
+    best_damage = np.zeros((len(rows), len(pool)), dtype=np.int64)
+    best_move = np.full((len(rows), len(pool)), '', dtype=object)
+
+    for out, row in enumerate(rows):
+        attacker = {**pool.iloc[row].to_dict(), 'level': MATCHUP_LEVEL}
+        for move in moves[row]:
+            result = engine.sweep(attacker, move)
+            better = result['percent'] > best_percent[out]
+            best_percent[out][better] = result['percent'][better]
+            best_damage[out][better] = result['damage'][better]
+            best_move[out][better] = move['name']
+
+    ko_hits = np.where(best_damage > 0, -(-hp // np.maximum(best_damage, 1)), NO_KO)
+    return {
+        'rows': rows,
+        'best_percent': best_percent,
+        'best_move': best_move.astype(str),
+        'ko_hits': np.minimum(ko_hits, 255).astype(np.uint8)
+    }
+
+
+def compute_matchups(pools: Dict[str, pd.DataFrame], moves: Dict[str, List[List[Dict]]],
+                     max_workers: Optional[int] = None, chunk_size: int = 8) -> Dict[str, MatchupMatrix]:
+    """
+    Matchup matrices of several tiers
+
+    Attackers of every tier are split into chunks of chunk_size rows and
+    evaluated across a process pool; each chunk sweeps its attackers' moves
+    over the tier with the vectorized damage engine.
+
+    Args:
+        pools: Tier name -> pool from tier_pool()
+        moves: Tier name -> attack_moves() per pool row
+        max_workers: Processes (default: CPU count); 1 computes in-process
+        chunk_size: Attackers per task
+
+    Returns:
+        dict: tier name -> MatchupMatrix
+    """
+    tasks = [
+        (tier, list(range(start, min(start + chunk_size, len(pool)))))
+        for tier, pool in pools.items()
+        for start in range(0, len(pool), chunk_size)
+    ]
+
+    if max_workers == 1 or len(tasks) <= 1:
+        results = [_matchup_rows(pools[tier], rows, moves[tier]) for tier, rows in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                _matchup_rows,
+                [pools[tier] for tier, _ in tasks],
+                [rows for _, rows in tasks],
+                [moves[tier] for tier, _ in tasks]
+            ))
+
+    matrices = {}
+    for tier, pool in pools.items():
+        n = len(pool)
+        speed = pool['speed'].to_numpy(dtype=np.int64)
+        arrays = {
+            'names': pool['name'].to_numpy(dtype=str),
+            'best_percent': np.zeros((n, n), dtype=np.float32),
+            'best_move': np.full((n, n), '', dtype=object),
+            'ko_hits': np.zeros((n, n), dtype=np.uint8),
+            'speed': np.sign(speed[:, None] - speed[None, :]).astype(np.int8),
+            'input_hash': np.array(input_hash(pool, moves[tier]))
+        }
+        for (task_tier, rows), result in zip(tasks, results):
+            if task_tier == tier:
+                arrays['best_percent'][rows] = result['best_percent']
+                arrays['best_move'][rows] = result['best_move']
+                arrays['ko_hits'][rows] = result['ko_hits']
+        arrays['best_move'] = arrays['best_move'].astype(str)
+        matrices[tier] = MatchupMatrix(arrays)
+    return matrices
+
+
+def matchup_path(tier: str, data_dir: str = "data") -> Path:
+    """Artifact path of a tier's matrix"""
+    return Path(data_dir) / "competitive" / ".cache" / "matchups" / f"{tier}.npz"
+
+
+def build_matchups(data_dir: str = "data", tiers: Optional[Iterable[str]] = None,
+                   max_workers: Optional[int] = None, force: bool = False,
+                   catalog: Optional[DataCatalog] = None) -> Dict[str, str]:
+    """
+    Build the matchup artifacts of every tier whose inputs changed
+
+    A tier's inputs are its members' final stats, types and damaging moves;
+    their hash is stored in the artifact, so unchanged tiers are skipped.
+
+    Args:
+        data_dir: Data directory holding competitive/tier_data.csv
+        tiers: Tiers to consider (default: every tier in tier_data.csv)
+        max_workers: Processes for compute_matchups
+        force: Rebuild even when the inputs are unchanged
+        catalog: Data catalog (default: the shared catalog of data_dir)
+
+    Returns:
+        dict: tier -> 'built', 'unchanged' or 'empty'
+    """
+    catalog = catalog or get_data_catalog(data_dir)
+    pokemon = catalog.pokemon()
+    tier_data = catalog.tier_data()
+    try:
+        movesets = catalog.movesets()
+    except Exception as e:
+        print(f"Warning: Movesets unavailable, using STAB moves only: {e}")
+        movesets = None
+
+    wanted = sorted(tier_data['tier'].dropna().unique()) if tiers is None else list(tiers)
+    status, pools, moves = {}, {}, {}
+    for tier in wanted:
+        pool = tier_pool(pokemon, tier_data.loc[tier_data['tier'] == tier, 'name'])
+        if pool.empty:
+            status[tier] = 'empty'
+            continue
+
+        tier_moves = [
+            attack_moves(row, movesets.moveset(row['name']) if movesets is not None else [])
+            for row in pool.to_dict('records')
+        ]
+        path = matchup_path(tier, data_dir)
+        if not force and path.exists():
+            try:
+                with np.load(path, allow_pickle=False) as data:
+                    if str(data['input_hash']) == input_hash(pool, tier_moves):
+                        status[tier] = 'unchanged'
+                        continue
+            except Exception as e:
+                print(f"Warning: Matchup artifact for {tier} unreadable, rebuilding: {e}")
+
+        pools[tier], moves[tier] = pool, tier_moves
+
+    if pools:
+        matrices = compute_matchups(pools, moves, max_workers=max_workers)
+        for tier, matrix in matrices.items():
+            path = matchup_path(tier, data_dir)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            matrix.save(path)
+            status[tier] = 'built'
+
+    return status
+
+
+def load_matchups(tier: str, data_dir: str = "data") -> Optional[MatchupMatrix]:
+    """A tier's matchup matrix, or None if it has not been built"""
+    path = matchup_path(tier, data_dir)
+    if not path.exists():
+        return None
+    try:
+        return MatchupMatrix.load(path)
+    except Exception as e:
+        print(f"Warning: Could not read matchup matrix for {tier}: {e}")
+        return None
@@ -8,25 +8,34 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import streamlit as st
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 import numpy as np
 
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from data_catalog import DataCatalog, get_data_catalog
+
 class MetaAnalyticsDashboard:
     """Comprehensive analytics for competitive Pokemon meta"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", catalog: Optional[DataCatalog] = None):
         self.data_dir = Path(data_dir)
+        self.catalog = catalog or get_data_catalog(data_dir)
         self.load_data()
     
     def load_data(self):
         """Load all competitive data sources"""
         try:
-            self.tier_data = pd.read_csv(self.data_dir / "competitive" / "tier_data.csv")
-            self.usage_stats = pd.read_csv(self.data_dir / "competitive" / "usage_stats.csv")
-            self.move_usage = pd.read_csv(self.data_dir / "competitive" / "move_usage.csv")
-            self.ability_usage = pd.read_csv(self.data_dir / "competitive" / "ability_usage.csv")
-            self.pokemon_data = pd.read_csv(self.data_dir / "pokemon.csv")
+            self.tier_data = self.catalog.tier_data()
+            self.usage_stats = self.catalog.usage_stats()
+            self.move_usage = self.catalog.move_usage()
+            self.ability_usage = self.catalog.ability_usage()
+            self.pokemon_data = self.catalog.pokemon()
             print("✅ All data loaded successfully")
         except Exception as e:
             print(f"❌ Error loading data: {e}")
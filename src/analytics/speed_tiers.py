@@ -0,0 +1,169 @@
+"""
+Speed Tier Index
+Sorted final Speed arrays at common spreads and levels with binary-search outspeed queries
+"""
+
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from stat_engine import StatEngine, STATS, MAX_IV, MAX_EV, calculate_stats
+
+SPEED = STATS.index('speed')
+
+LEVELS = (50, 100)
+
+# Speed multipliers applied on top of the final stat
+SPEED_MODIFIERS = {
+    'scarf': 1.5,
+    'tailwind': 2.0,
+    'paralysis': 0.5,
+}
+
+
+class SpeedTierIndex:
+    """
+    Final Speed of every Pokemon at each (spread, level), kept sorted
+
+    Spreads:
+        max_plus: 252 EVs, 31 IVs, Speed-raising nature
+        max_neutral: 252 EVs, 31 IVs, neutral nature
+        min_minus: 0 EVs, 0 IVs, Speed-lowering nature
+
+    Every query is a binary search into a sorted array, and the names it
+    returns are a slice of the matching sorted name array. Queries are named
+    from the field's side: faster_than(x) lists the Pokemon faster than x.
+    Modifiers (Scarf, Tailwind, paralysis) scale a sorted array without
+    reordering it, so modified tables are derived once and cached.
+    """
+
+    def __init__(self, pokemon: pd.DataFrame, stat_engine: Optional[StatEngine] = None):
+        """
+        Build the sorted tables
+
+        Args:
+            pokemon: Dex rows with name and the six base stat columns
+            stat_engine: Stat engine providing the nature table (default:
+                one built from data/competitive/natures_reference.json)
+        """
+        stat_engine = stat_engine or StatEngine(pokemon)
+        table = dict(zip(stat_engine.nature_names, stat_engine.nature_table[:, SPEED]))
+        plus = max(table.values())
+        minus = min(table.values())
+
+        self.names = pokemon['name'].to_numpy()
+        self.spreads = {
+            'max_plus': (MAX_EV, MAX_IV, plus),
+            'max_neutral': (MAX_EV, MAX_IV, 1.0),
+            'min_minus': (0, 0, minus),
+        }
+        self._rows = {}
+        for row, name in enumerate(self.names):
+            self._rows.setdefault(name, row)
+
+        base = pokemon[STATS].to_numpy(dtype=np.int64)
+        # speeds[(spread, level)]: final Speed per dex row
+        self.speeds: Dict[Tuple[str, int], np.ndarray] = {}
+        self._order: Dict[Tuple[str, int], np.ndarray] = {}
+        self._sorted: Dict[Tuple[str, int, float], np.ndarray] = {}
+        self._sorted_names: Dict[Tuple[str, int], np.ndarray] = {}
+        for spread, (evs, ivs, nature) in self.spreads.items():
+            for level in LEVELS:
+                key = (spread, level)
+                speed = calculate_stats(base, ivs, evs, nature, level)[:, SPEED]
+                order = np.argsort(speed, kind='stable')
+                self.speeds[key] = speed
+                self._order[key] = order
+                self._sorted[(spread, level, 1.0)] = speed[order]
+                self._sorted_names[key] = self.names[order]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def multiplier(modifiers: Iterable[str] = ()) -> float:
+        """Combined multiplier of modifier names (see SPEED_MODIFIERS)"""
+        factor = 1.0
+        for modifier in modifiers:
+            factor *= SPEED_MODIFIERS[modifier]
+        return factor
+
+    def _table(self, spread: str, level: int, factor: float) -> np.ndarray:
+        """Sorted Speeds of a (spread, level) scaled by factor, cached"""
+        key = (spread, level, factor)
+        table = self._sorted.get(key)
+        if table is None:
+            table = np.floor(self._sorted[(spread, level, 1.0)] * factor).astype(np.int64)
+            self._sorted[key] = table
+        return table
+
+    def speed(self, name: str, spread: str = 'max_plus', level: int = 100,
+              modifiers: Iterable[str] = ()) -> int:
+        """Final Speed of one Pokemon"""
+        base = self.speeds[(spread, level)][self._rows[name]]
+        return int(base * self.multiplier(modifiers))
+
+    def _resolve(self, target: Union[str, int], spread: str, level: int,
+                 modifiers: Iterable[str]) -> int:
+        """A Speed value given a name (at spread/level/modifiers) or a number"""
+        if isinstance(target, str):
+            return self.speed(target, spread, level, modifiers)
+        return int(target)
+
+    def faster_than(self, target: Union[str, int], spread: str = 'max_plus', level: int = 100,
+                    modifiers: Iterable[str] = (), field_spread: Optional[str] = None,
+                    field_modifiers: Iterable[str] = ()) -> np.ndarray:
+        """
+        Pokemon strictly faster than a target, fastest last
+
+        Args:
+            target: Pokemon name or a Speed value
+            spread, level, modifiers: How the target is built
+            field_spread: Spread of every other Pokemon (default: spread)
+            field_modifiers: Modifiers applied to every other Pokemon
+
+        Returns:
+            Array of names (a view into the sorted table)
+        """
+        speed = self._resolve(target, spread, level, modifiers)
+        field = field_spread or spread
+        table = self._table(field, level, self.multiplier(field_modifiers))
+        return self._sorted_names[(field, level)][np.searchsorted(table, speed, side='right'):]
+
+    def slower_than(self, target: Union[str, int], spread: str = 'max_plus', level: int = 100,
+                    modifiers: Iterable[str] = (), field_spread: Optional[str] = None,
+                    field_modifiers: Iterable[str] = ()) -> np.ndarray:
+        """Pokemon strictly slower than a target, slowest first (see faster_than)"""
+        speed = self._resolve(target, spread, level, modifiers)
+        field = field_spread or spread
+        table = self._table(field, level, self.multiplier(field_modifiers))
+        return self._sorted_names[(field, level)][:np.searchsorted(table, speed, side='left')]
+
+    def ties(self, target: Union[str, int], spread: str = 'max_plus', level: int = 100,
+             modifiers: Iterable[str] = (), field_spread: Optional[str] = None,
+             field_modifiers: Iterable[str] = ()) -> np.ndarray:
+        """Pokemon with exactly the target's Speed (including the target itself)"""
+        speed = self._resolve(target, spread, level, modifiers)
+        field = field_spread or spread
+        table = self._table(field, level, self.multiplier(field_modifiers))
+        start, end = np.searchsorted(table, [speed, speed + 1])
+        return self._sorted_names[(field, level)][start:end]
+
+    def speed_counts(self, spread: str = 'max_plus', level: int = 100,
+                     modifiers: Iterable[str] = (), field_spread: Optional[str] = None,
+                     field_modifiers: Iterable[str] = ()) -> Dict[str, np.ndarray]:
+        """
+        For every Pokemon at once, len(faster_than(...)) and len(slower_than(...))
+
+        Returns:
+            dict of arrays aligned with self.names: speed, faster_than (count
+            of the field strictly faster) and slower_than (count strictly slower)
+        """
+        speeds = np.floor(self.speeds[(spread, level)] * self.multiplier(modifiers)).astype(np.int64)
+        table = self._table(field_spread or spread, level, self.multiplier(field_modifiers))
+        return {
+            'speed': speeds,
+            'faster_than': len(table) - np.searchsorted(table, speeds, side='right'),
+            'slower_than': np.searchsorted(table, speeds, side='left')
+        }
@@ -0,0 +1,167 @@
+"""
+Vectorized Stat Engine
+Final stats from base stats, IVs, EVs, nature and level over NumPy arrays
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Stat order of every trailing stat axis; HP is first
+STATS = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+HP = 0
+
+MAX_IV = 31
+MAX_EV = 252
+MAX_TOTAL_EVS = 510
+
+NATURE_BOOST = 1.1
+NATURE_DROP = 0.9
+
+DEFAULT_NATURES_PATH = (
+    Path(__file__).resolve().parent.parent.parent / "data" / "competitive" / "natures_reference.json"
+)
+
+
+def calculate_stats(base, ivs=MAX_IV, evs=0, natures=1.0, levels=100) -> np.ndarray:
+    """
+    Final stats for any broadcastable arrays of inputs
+
+    All arguments broadcast against each other with a trailing stat axis of
+    6 (STATS order), so e.g. base[:, None, :] with evs[None, :, :] gives every
+    Pokemon under every spread in one expression. HP uses its own formula and
+    ignores the nature.
+
+    Args:
+        base: Base stats, (..., 6)
+        ivs: IVs, scalar or (..., 6)
+        evs: EVs, scalar or (..., 6)
+        natures: Nature multipliers (see nature_modifiers), scalar or (..., 6)
+        levels: Levels, scalar or (...,) without the stat axis
+
+    Returns:
+        int64 array of final stats, (..., 6)
+    """
+    base = np.asarray(base, dtype=np.int64)
+    ivs = np.asarray(ivs, dtype=np.int64)
+    evs = np.asarray(evs, dtype=np.int64)
+    levels = np.asarray(levels, dtype=np.int64)[..., None]
+
+    core = (2 * base + ivs + evs // 4) * levels // 100
+    stats = np.trunc((core + 5) * np.asarray(natures, dtype=np.float64)).astype(np.int64)
+    stats[..., HP] = core[..., HP] + levels[..., 0] + 10
+    return stats
+
+
+def stat_vector(values, default: int = 0) -> np.ndarray:
+    """A stat dict (e.g. an EV spread) or scalar as a length-6 int array"""
+    if isinstance(values, dict):
+        return np.array([int(values.get(stat, default) or 0) for stat in STATS], dtype=np.int64)
+    return np.broadcast_to(np.asarray(values, dtype=np.int64), (len(STATS),)).copy()
+
+
+class StatEngine:
+    """
+    Base stats of a dex as a (pokemon, 6) array plus the 25 natures as a
+    (nature, 6) multiplier table
+    """
+
+    def __init__(self, pokemon: pd.DataFrame, natures: Optional[Dict] = None):
+        """
+        Initialize the engine
+
+        Args:
+            pokemon: Dex rows with name and the six base stat columns
+            natures: Nature reference {name: {'increases', 'decreases'}}
+                (default: data/competitive/natures_reference.json)
+        """
+        self.names = pokemon['name'].to_numpy()
+        self.base = pokemon[STATS].to_numpy(dtype=np.int64)
+
+        if natures is None:
+            natures = load_natures()
+        self.nature_names = list(natures)
+        self.nature_table = np.ones((len(self.nature_names), len(STATS)), dtype=np.float64)
+        for i, name in enumerate(self.nature_names):
+            effect = natures[name] or {}
+            if effect.get('increases') in STATS:
+                self.nature_table[i, STATS.index(effect['increases'])] = NATURE_BOOST
+            if effect.get('decreases') in STATS:
+                self.nature_table[i, STATS.index(effect['decreases'])] = NATURE_DROP
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def nature_modifiers(self, names: Iterable[str]) -> np.ndarray:
+        """Multiplier rows of the named natures, (len(names), 6); unknown names are neutral"""
+        index = {name: i for i, name in enumerate(self.nature_names)}
+        modifiers = [self.nature_table[index[n]] if n in index else np.ones(len(STATS)) for n in names]
+        return np.array(modifiers, dtype=np.float64).reshape(-1, len(STATS))
+
+    def sweep(self, evs, natures: Optional[Sequence[str]] = None, levels=(100,), ivs=MAX_IV) -> np.ndarray:
+        """
+        Final stats of every Pokemon under every spread, nature and level
+
+        Args:
+            evs: EV spreads, (spread, 6) or a single (6,) spread
+            natures: Nature names (default: all 25)
+            levels: Levels to evaluate
+            ivs: IVs, scalar, (6,) or (spread, 6) aligned with evs
+
+        Returns:
+            int64 array, (pokemon, spread, nature, level, 6)
+        """
+        evs = np.atleast_2d(np.asarray(evs, dtype=np.int64))
+        ivs = np.asarray(ivs, dtype=np.int64)
+        if ivs.ndim == 2:
+            ivs = ivs[None, :, None, None, :]
+        modifiers = self.nature_table if natures is None else self.nature_modifiers(natures)
+        levels = np.asarray(levels, dtype=np.int64)
+
+        return calculate_stats(
+            self.base[:, None, None, None, :],
+            ivs,
+            evs[None, :, None, None, :],
+            modifiers[None, None, :, None, :],
+            levels[None, None, None, :]
+        )
+
+    def apply(self, pokemon: Dict, evs=0, nature: Optional[str] = None, ivs=MAX_IV,
+              level: Optional[int] = None) -> Dict:
+        """
+        Copy of a Pokemon dict with its base stats replaced by final stats
+
+        The result keeps every other key and records the level, so it can be
+        passed straight to DamageCalculator.calculate_damage.
+        """
+        level = int(level if level is not None else pokemon.get('level', 100))
+        base = [pokemon[stat] for stat in STATS]
+        modifiers = self.nature_modifiers([nature])[0] if nature else 1.0
+        values = calculate_stats(base, stat_vector(ivs, MAX_IV), stat_vector(evs), modifiers, level)
+        result = dict(pokemon)
+        result.update(zip(STATS, values.tolist()))
+        result['level'] = level
+        return result
+
+    def frame(self, pokemon: pd.DataFrame, evs=0, nature: Optional[str] = None, ivs=MAX_IV,
+              level: int = 100) -> pd.DataFrame:
+        """Copy of dex rows with the stat columns replaced by final stats for one spread"""
+        modifiers = self.nature_modifiers([nature])[0] if nature else 1.0
+        values = calculate_stats(
+            pokemon[STATS].to_numpy(dtype=np.int64), stat_vector(ivs, MAX_IV), stat_vector(evs), modifiers, level
+        )
+        result = pokemon.copy()
+        result[STATS] = values
+        return result
+
+
+def load_natures(path: Path = DEFAULT_NATURES_PATH) -> Dict:
+    """Nature reference {name: {'increases', 'decreases'}}; neutral-only if missing"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'Hardy': {'increases': None, 'decreases': None}}
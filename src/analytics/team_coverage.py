@@ -0,0 +1,142 @@
+"""
+Incremental Team Coverage
+Team coverage kept as small arrays and scored against every candidate at once
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from type_engine import get_type_engine, TypeEngine
+
+# Relative weight of closing one unresolved defensive weakness vs one new
+# defending type hit super effectively
+DEFENSIVE_WEIGHT = 1.0
+OFFENSIVE_WEIGHT = 0.5
+
+
+class CoverageState:
+    """
+    Coverage of a team, updated per member in O(18)
+
+    Defensively, each attacking type has a count of members weak to it and a
+    count of members resisting (or immune to) it; their difference is the
+    team's exposure. Offensively, each defending type counts the members with
+    a STAB type that hits it super effectively.
+    """
+
+    def __init__(self, engine: Optional[TypeEngine] = None):
+        """
+        Initialize an empty team
+
+        Args:
+            engine: Type engine (default: the shared engine)
+        """
+        self.engine = engine or get_type_engine()
+        n = self.engine.n_types
+        self.weak = np.zeros(n, dtype=np.int16)
+        self.resist = np.zeros(n, dtype=np.int16)
+        self.hits = np.zeros(n, dtype=np.int16)
+        self.size = 0
+
+        # Per type combination: its weak / resisted attacking types and the
+        # defending types its STAB hits super effectively, shape (171, 18)
+        profiles = self.engine.combo_profiles
+        self._combo_weak = (profiles >= 2).astype(np.int16)
+        self._combo_resist = (profiles < 1).astype(np.int16)
+        attack = self.engine.combo_types[:, :, None]
+        stab = self.engine.multipliers(attack, np.arange(n)[None, None, :])
+        self._combo_hits = (stab == 2).any(axis=1).astype(np.int16)
+
+    @classmethod
+    def from_combo_ids(cls, combo_ids: Iterable[int],
+                       engine: Optional[TypeEngine] = None) -> 'CoverageState':
+        """Build the state of a team from its members' combo ids"""
+        state = cls(engine)
+        for combo_id in combo_ids:
+            state.add(combo_id)
+        return state
+
+    def _apply(self, combo_id: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) one member's rows"""
+        if combo_id < 0:
+            return
+        self.weak += sign * self._combo_weak[combo_id]
+        self.resist += sign * self._combo_resist[combo_id]
+        self.hits += sign * self._combo_hits[combo_id]
+        self.size += sign
+
+    def add(self, combo_id: int):
+        """Add a member by combo id"""
+        self._apply(combo_id, 1)
+
+    def remove(self, combo_id: int):
+        """Remove a member by combo id"""
+        self._apply(combo_id, -1)
+
+    @property
+    def exposure(self) -> np.ndarray:
+        """Members weak minus members resisting, per attacking type"""
+        return self.weak - self.resist
+
+    def deltas(self, combo_ids: np.ndarray):
+        """
+        Coverage change from adding each candidate, in one vectorized pass
+
+        Args:
+            combo_ids: Candidate combo ids, shape (n,)
+
+        Returns:
+            (defensive_delta, offensive_delta): reduction in unresolved
+            weaknesses and number of newly covered defending types, shape (n,)
+        """
+        combo_ids = np.asarray(combo_ids)
+        known = combo_ids >= 0
+        rows = np.where(known, combo_ids, 0)
+
+        exposure = self.exposure
+        unresolved = np.maximum(exposure, 0).sum()
+        after = exposure[None, :] + self._combo_weak[rows] - self._combo_resist[rows]
+        defensive = unresolved - np.maximum(after, 0).sum(axis=1)
+
+        uncovered = self.hits == 0
+        offensive = (self._combo_hits[rows].astype(bool) & uncovered[None, :]).sum(axis=1)
+
+        # Unknown type combinations change nothing
+        return np.where(known, defensive, 0), np.where(known, offensive, 0)
+
+
+def rank_candidates(candidates: pd.DataFrame, state: CoverageState,
+                    top_n: int = 10, exclude_numbers: Iterable[int] = ()) -> pd.DataFrame:
+    """
+    Rank candidate Pokemon by how much each would improve the team's coverage
+
+    Args:
+        candidates: Dex rows (with type_combo_id, or type_1/type_2)
+        state: Current team coverage
+        top_n: Number of suggestions to return
+        exclude_numbers: Pokedex numbers already on the team
+
+    Returns:
+        Top candidates with defensive_delta, offensive_delta and coverage_score,
+        ties broken by base stat total
+    """
+    if 'type_combo_id' in candidates.columns:
+        combo_ids = candidates['type_combo_id'].to_numpy()
+    else:
+        type_2 = candidates['type_2'] if 'type_2' in candidates.columns else [None] * len(candidates)
+        combo_ids = state.engine.combo_ids(candidates['type_1'], type_2)
+
+    defensive, offensive = state.deltas(combo_ids)
+    ranked = candidates.assign(
+        defensive_delta=defensive,
+        offensive_delta=offensive,
+        coverage_score=DEFENSIVE_WEIGHT * defensive + OFFENSIVE_WEIGHT * offensive
+    )
+    ranked = ranked[~ranked['pokedex_number'].isin(list(exclude_numbers))]
+
+    sort_columns = ['coverage_score']
+    if 'total_points' in ranked.columns:
+        sort_columns.append('total_points')
+    return ranked.nlargest(top_n, sort_columns)
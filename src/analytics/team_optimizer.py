@@ -0,0 +1,294 @@
+"""
+Team Optimizer
+Beam search and parallel multi-start swap search over whole teams within a time budget
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TEAM_SIZE = 6
+
+# Same weights as TeamRecommender._score_pokemon_for_team
+NEW_TYPE_BONUS = 50
+WEAKNESS_COVER_BONUS = 30
+
+DEFAULT_BUDGET = 1.0
+DEFAULT_BEAM_WIDTH = 16
+
+# Remaining budgets shorter than this run in-process unless workers is given;
+# starting worker processes would use up most of them
+POOL_MIN_BUDGET = 1.0
+
+# Never fork: the app runs inside the multi-threaded Streamlit server, and a
+# forked child can deadlock on locks held by its other threads
+POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+class TeamScorer:
+    """
+    Scores whole teams with the recommender's criteria, many teams per call
+
+    A team scores the sum of its members' base scores (BST / 10 + usage * 5),
+    NEW_TYPE_BONUS per distinct type and WEAKNESS_COVER_BONUS for each of a
+    member's types resisting a weakness of the rest of the team. This is the
+    greedy score made independent of the order members were added in.
+
+    Teams are arrays of dex row positions; type ids index a vocabulary whose
+    trailing entry (-1) is a neutral missing type.
+    """
+
+    def __init__(self, base_scores: np.ndarray, type_ids: np.ndarray,
+                 type_weak: np.ndarray, type_resists: np.ndarray):
+        """
+        Initialize the scorer
+
+        Args:
+            base_scores: Per dex row base score
+            type_ids: Per dex row (type_1, type_2) vocabulary ids, -1 if missing
+            type_weak: (vocab + 1, attacking types) weakness mask
+            type_resists: (vocab + 1, attacking types) resistance mask
+        """
+        self.base_scores = base_scores
+        self.type_ids = type_ids
+        self.type_weak = type_weak.astype(np.int64)
+        self.type_resists = type_resists.astype(np.int64)
+        self.n_vocab = len(type_weak) - 1
+
+    def score(self, teams: np.ndarray) -> np.ndarray:
+        """Scores of a (teams, members) array of dex rows"""
+        teams = np.atleast_2d(teams)
+        n = len(teams)
+        types = self.type_ids[teams]
+
+        present = np.zeros((n, self.n_vocab + 1), dtype=bool)
+        present[np.arange(n)[:, None], types.reshape(n, -1)] = True
+        distinct = present[:, :-1].sum(axis=1)
+
+        # Per member: attacking types its types are weak to / resist, (teams, members, attacks)
+        member_weak = self.type_weak[types].sum(axis=2)
+        member_resists = self.type_resists[types].sum(axis=2)
+        others_weak = (member_weak.sum(axis=1, keepdims=True) - member_weak) > 0
+        covered = (member_resists * others_weak).sum(axis=(1, 2))
+
+        return (
+            self.base_scores[teams].sum(axis=1)
+            + NEW_TYPE_BONUS * distinct
+            + WEAKNESS_COVER_BONUS * covered
+        )
+
+
+def beam_search(scorer: TeamScorer, pool: np.ndarray, fixed: Sequence[int] = (),
+                size: int = TEAM_SIZE, beam_width: int = DEFAULT_BEAM_WIDTH,
+                deadline: Optional[float] = None) -> Tuple[np.ndarray, float]:
+    """
+    Grow teams one member at a time, keeping the best beam_width partial teams
+
+    Once the deadline passes only the best partial team is kept and completed
+    greedily, so a wide beam over a large pool still returns a full team.
+
+    Args:
+        scorer: Team scorer
+        pool: Candidate dex rows (distinct Pokemon)
+        fixed: Rows every team starts with
+        size: Team size
+        beam_width: Partial teams kept per step
+        deadline: time.monotonic() value to stop widening at
+
+    Returns:
+        (best team rows, score)
+    """
+    beam = np.array([list(fixed)], dtype=np.int64).reshape(1, len(fixed))
+    while beam.shape[1] < size:
+        if deadline is not None and beam_width > 1 and time.monotonic() >= deadline:
+            beam, beam_width = beam[:1], 1
+        # Every beam team extended by every candidate it lacks
+        grown = np.concatenate([
+            np.repeat(beam, len(pool), axis=0),
+            np.tile(pool, len(beam))[:, None]
+        ], axis=1)
+        grown = grown[~(grown[:, :-1] == grown[:, -1:]).any(axis=1)]
+        if len(grown) == 0:
+            break
+        # The same members in another order are the same team
+        _, unique = np.unique(np.sort(grown, axis=1), axis=0, return_index=True)
+        grown = grown[np.sort(unique)]
+        scores = scorer.score(grown)
+        beam = grown[np.argsort(-scores, kind='stable')[:beam_width]]
+    return beam[0], float(scorer.score(beam[:1])[0])
+
+
+def local_search(scorer: TeamScorer, pool: np.ndarray, team: np.ndarray, n_fixed: int = 0,
+                 deadline: Optional[float] = None) -> Tuple[np.ndarray, float]:
+    """
+    Steepest-ascent swap search: replace one member with an outside candidate
+    while any swap improves the score (or until the deadline)
+
+    Args:
+        scorer: Team scorer
+        pool: Candidate dex rows
+        team: Starting team rows
+        n_fixed: Leading members that are never swapped out
+        deadline: time.monotonic() value to stop at
+
+    Returns:
+        (team rows, score)
+    """
+    team = np.asarray(team, dtype=np.int64).copy()
+    score = float(scorer.score(team[None])[0])
+    free = np.arange(n_fixed, len(team))
+    while len(free) and (deadline is None or time.monotonic() < deadline):
+        outside = pool[~np.isin(pool, team)]
+        if len(outside) == 0:
+            break
+        swaps = np.repeat(team[None], len(free) * len(outside), axis=0)
+        swaps[np.arange(len(swaps)), np.repeat(free, len(outside))] = np.tile(outside, len(free))
+        scores = scorer.score(swaps)
+        best = int(np.argmax(scores))
+        if scores[best] <= score + 1e-9:
+            break
+        team, score = swaps[best], float(scores[best])
+    return team, score
+
+
+def multi_start(scorer: TeamScorer, pool: np.ndarray, fixed: Sequence[int], size: int,
+                deadline: float, seed, starts: Optional[int] = None) -> Tuple[Optional[np.ndarray], float, int]:
+    """
+    Swap search from random teams until the deadline (or starts) runs out
+
+    The deadline is an absolute time.monotonic() value, which is shared by
+    every process on the host, so pool workers stop with the caller's budget.
+
+    Returns:
+        (best team rows or None, score, starts run)
+    """
+    rng = np.random.default_rng(seed)
+    fixed = np.asarray(fixed, dtype=np.int64)
+    others = pool[~np.isin(pool, fixed)]
+    best, best_score, runs = None, -np.inf, 0
+    while (starts is None or runs < starts) and time.monotonic() < deadline:
+        team = np.concatenate([fixed, rng.choice(others, size - len(fixed), replace=False)])
+        team, score = local_search(scorer, pool, team, len(fixed), deadline)
+        runs += 1
+        if score > best_score:
+            best, best_score = team, score
+    return best, best_score, runs
+
+
+def optimize_team(scorer: TeamScorer, pool: Sequence[int], fixed: Sequence[int] = (),
+                  size: int = TEAM_SIZE, budget: float = DEFAULT_BUDGET,
+                  beam_width: int = DEFAULT_BEAM_WIDTH, workers: Optional[int] = None,
+                  starts: Optional[int] = None, initial: Sequence[Sequence[int]] = (),
+                  random_state=None) -> Dict:
+    """
+    Best team found within a wall-clock budget
+
+    Initial teams (e.g. the greedy pick) and the beam search result are
+    polished with swap search, then random multi-start swap search runs on a
+    process pool for the rest of the budget.
+
+    Args:
+        scorer: Team scorer
+        pool: Candidate dex rows (distinct Pokemon)
+        fixed: Rows every team must keep (seed Pokemon)
+        size: Team size
+        budget: Seconds to search for
+        beam_width: Beam search width
+        workers: Worker processes for multi-start (default: CPU count, or
+            in-process when less than POOL_MIN_BUDGET remains); 1 runs
+            in-process
+        starts: Total random starts (default: as many as the budget allows)
+        initial: Teams to start from besides the beam
+        random_state: Seed for the random starts
+
+    Returns:
+        dict: team (rows), score, method (which search found it) and starts
+    """
+    deadline = time.monotonic() + budget
+    pool = np.asarray(pool, dtype=np.int64)
+    fixed = [int(row) for row in fixed][:size]
+    pool = np.unique(np.concatenate([pool, np.asarray(fixed, dtype=np.int64)]))
+    size = min(size, len(pool))
+    if len(pool) == size:
+        team = np.concatenate([fixed, pool[~np.isin(pool, fixed)]]).astype(np.int64)
+        return {'team': team, 'score': float(scorer.score(team[None])[0]), 'method': 'whole pool', 'starts': 0}
+
+    found = []
+    for team in initial:
+        if len(team) == size:
+            found.append((*local_search(scorer, pool, team, len(fixed), deadline), 'greedy'))
+    team, _ = beam_search(scorer, pool, fixed, size, beam_width, deadline)
+    found.append((*local_search(scorer, pool, team, len(fixed), deadline), 'beam search'))
+
+    runs = 0
+    remaining = deadline - time.monotonic()
+    if remaining > 0 and starts != 0:
+        if workers == 1 or (workers is None and remaining < POOL_MIN_BUDGET):
+            results = [multi_start(scorer, pool, fixed, size, deadline, random_state, starts)]
+        else:
+            results = _parallel_starts(scorer, pool, fixed, size, deadline, random_state, workers, starts)
+        for team, score, count in results:
+            runs += count
+            if team is not None:
+                found.append((team, score, 'multi-start'))
+
+    # Highest score; earlier sources win ties
+    team, score, method = max(found, key=lambda item: item[1])
+    return {'team': team, 'score': score, 'method': method, 'starts': runs}
+
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool reused across calls (recreated when the size changes)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context(POOL_START_METHOD)
+            )
+            _executor_workers = max_workers
+        return _executor
+
+
+def _reset_executor():
+    """Drop a broken pool so the next call starts a fresh one"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+
+
+def _parallel_starts(scorer: TeamScorer, pool: np.ndarray, fixed: List[int], size: int,
+                     deadline: float, random_state, workers: Optional[int],
+                     starts: Optional[int]) -> List[Tuple]:
+    """Run multi_start on a process pool, one task per worker, until the deadline"""
+    n_tasks = workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(random_state).spawn(n_tasks)
+    shares = [None] * n_tasks if starts is None else [
+        starts // n_tasks + (i < starts % n_tasks) for i in range(n_tasks)
+    ]
+    executor = _get_executor(n_tasks)
+    try:
+        # Workers stop at the caller's deadline, however long they took to start
+        futures = [
+            executor.submit(multi_start, scorer, pool, fixed, size, deadline, seed, share)
+            for seed, share in zip(seeds, shares) if share != 0
+        ]
+        wait(futures)
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        _reset_executor()
+        raise
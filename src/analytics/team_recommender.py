@@ -5,36 +5,54 @@ Suggests optimal Pokemon teams based on meta analysis
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
+import sys
 from pathlib import Path
-from typing import List, Dict, Set
-from collections import Counter
+from typing import List, Dict, Set, Optional
 import random
 
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from data_catalog import DataCatalog, get_data_catalog
+from type_engine import get_type_engine, NO_TYPE
+from team_optimizer import (
+    TeamScorer, optimize_team, TEAM_SIZE, NEW_TYPE_BONUS, WEAKNESS_COVER_BONUS,
+    DEFAULT_BUDGET, DEFAULT_BEAM_WIDTH
+)
+
+# Tier and usage tables name Pokemon in different columns
+NAME_COLUMNS = ('pokemon', 'name', 'pokemon_name')
+
+
+def _name_column(frame: pd.DataFrame) -> str:
+    """Column holding Pokemon names in a tier or usage table"""
+    return next((column for column in NAME_COLUMNS if column in frame.columns), 'name')
+
 
 class TeamRecommender:
     """Recommend optimal Pokemon teams"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", catalog: Optional[DataCatalog] = None):
         self.data_dir = Path(data_dir)
-        self.load_data()
+        self.catalog = catalog or get_data_catalog(data_dir)
         self.load_type_chart()
+        self.load_data()
     
     def load_data(self):
         """Load all necessary data"""
         try:
-            self.pokemon_data = pd.read_csv(self.data_dir / "pokemon.csv")
-            self.tier_data = pd.read_csv(
-                self.data_dir / "competitive" / "tier_data.csv"
-            )
-            self.usage_stats = pd.read_csv(
-                self.data_dir / "competitive" / "usage_stats.csv"
-            )
+            self.pokemon_data = self.catalog.pokemon()
+            self.pokemon_index = self.catalog.pokemon_index()
+            self.tier_data = self.catalog.tier_data()
+            self.usage_stats = self.catalog.usage_stats()
+            self._build_scoring_index()
             
             # Load movesets
-            moveset_path = self.data_dir / "moves" / "pokemon_movesets.json"
-            with open(moveset_path, 'r') as f:
-                self.movesets = json.load(f)
+            self.movesets = self.catalog.movesets()
             
             print("✅ All data loaded")
         except Exception as e:
@@ -43,49 +61,88 @@ class TeamRecommender:
     
     def load_type_chart(self):
         """Load type effectiveness for coverage analysis"""
+        self.type_engine = get_type_engine()
+        engine = self.type_engine
+        
+        # Per defending type: attacking types that are super effective / resisted
+        # (immunities are not counted as resistances)
         self.weaknesses = {
-            'Normal': ['Fighting'],
-            'Fire': ['Water', 'Ground', 'Rock'],
-            'Water': ['Electric', 'Grass'],
-            'Electric': ['Ground'],
-            'Grass': ['Fire', 'Ice', 'Poison', 'Flying', 'Bug'],
-            'Ice': ['Fire', 'Fighting', 'Rock', 'Steel'],
-            'Fighting': ['Flying', 'Psychic', 'Fairy'],
-            'Poison': ['Ground', 'Psychic'],
-            'Ground': ['Water', 'Grass', 'Ice'],
-            'Flying': ['Electric', 'Ice', 'Rock'],
-            'Psychic': ['Bug', 'Ghost', 'Dark'],
-            'Bug': ['Fire', 'Flying', 'Rock'],
-            'Rock': ['Water', 'Grass', 'Fighting', 'Ground', 'Steel'],
-            'Ghost': ['Ghost', 'Dark'],
-            'Dragon': ['Ice', 'Dragon', 'Fairy'],
-            'Dark': ['Fighting', 'Bug', 'Fairy'],
-            'Steel': ['Fire', 'Fighting', 'Ground'],
-            'Fairy': ['Poison', 'Steel']
+            defend: engine.names(engine.matrix[:, i] == 2)
+            for i, defend in enumerate(engine.types)
         }
-        
         self.resistances = {
-            'Normal': [],
-            'Fire': ['Fire', 'Grass', 'Ice', 'Bug', 'Steel', 'Fairy'],
-            'Water': ['Fire', 'Water', 'Ice', 'Steel'],
-            'Electric': ['Electric', 'Flying', 'Steel'],
-            'Grass': ['Water', 'Electric', 'Grass', 'Ground'],
-            'Ice': ['Ice'],
-            'Fighting': ['Bug', 'Rock', 'Dark'],
-            'Poison': ['Grass', 'Fighting', 'Poison', 'Bug', 'Fairy'],
-            'Ground': ['Poison', 'Rock'],
-            'Flying': ['Grass', 'Fighting', 'Bug'],
-            'Psychic': ['Fighting', 'Psychic'],
-            'Bug': ['Grass', 'Fighting', 'Ground'],
-            'Rock': ['Normal', 'Fire', 'Poison', 'Flying'],
-            'Ghost': ['Poison', 'Bug'],
-            'Dragon': ['Fire', 'Water', 'Electric', 'Grass'],
-            'Dark': ['Ghost', 'Dark'],
-            'Steel': ['Normal', 'Grass', 'Ice', 'Flying', 'Psychic', 
-                     'Bug', 'Rock', 'Dragon', 'Steel', 'Fairy'],
-            'Fairy': ['Fighting', 'Bug', 'Dark']
+            defend: engine.names(engine.matrix[:, i] == 0.5)
+            for i, defend in enumerate(engine.types)
         }
     
+    def _build_scoring_index(self):
+        """
+        Per-Pokemon scoring inputs as arrays aligned with pokemon_data rows
+
+        Types are ids into a vocabulary of the dex's type strings, so team
+        membership, weaknesses and resistances become array lookups. Id -1
+        (missing second type) indexes a trailing neutral entry.
+        """
+        dex = self.pokemon_data
+        engine = self.type_engine
+        self._names = dex['name'].to_numpy(dtype=object)
+        # First dex row of each name, as pokemon_index.row returns
+        self._row_by_name = {}
+        for row, name in enumerate(self._names):
+            self._row_by_name.setdefault(name, row)
+
+        codes, vocab = pd.factorize(dex[['type_1', 'type_2']].astype(object).to_numpy().ravel())
+        self._type_ids = codes.reshape(-1, 2)
+        self._type_vocab = list(vocab)
+
+        # Per vocabulary type: attacking types it is weak to / resists (plus a neutral row)
+        indices = engine.indices(self._type_vocab)
+        known = indices != NO_TYPE
+        self._type_weak = np.zeros((len(vocab) + 1, engine.n_types), dtype=bool)
+        self._type_resists = np.zeros((len(vocab) + 1, engine.n_types), dtype=np.int64)
+        self._type_weak[:-1][known] = (engine.matrix[:, indices[known]] == 2).T
+        self._type_resists[:-1][known] = (engine.matrix[:, indices[known]] == 0.5).T
+
+        usage = self.usage_stats
+        self.usage_means = usage.groupby(_name_column(usage))['usage_percent'].mean().dropna().to_dict()
+        self._base_scores = (
+            dex['total_points'].to_numpy(dtype=np.float64) / 10
+            + dex['name'].map(self.usage_means).fillna(0).to_numpy(dtype=np.float64) * 5
+        )
+        self.team_scorer = TeamScorer(self._base_scores, self._type_ids,
+                                      self._type_weak, self._type_resists)
+    
+    def _candidate_scores(self, candidates: np.ndarray, team: List[str]) -> np.ndarray:
+        """
+        Scores of many candidates for one team, as _score_pokemon_for_team
+        
+        Args:
+            candidates: pokemon_data row positions
+            team: Current team names
+        
+        Returns:
+            float64 array aligned with candidates
+        """
+        in_team = np.isin(self._names, team)
+        team_types = self._type_ids[in_team].ravel()
+        team_types = team_types[team_types >= 0]
+        
+        # Per vocabulary type: +50 if new to the team, +30 per team weakness it resists
+        new_type = np.ones(len(self._type_vocab) + 1, dtype=bool)
+        new_type[team_types] = False
+        new_type[-1] = False
+        team_weak = self._type_weak[team_types].any(axis=0)
+        covered = self._type_resists @ team_weak
+        
+        types = self._type_ids[candidates]
+        scores = (
+            self._base_scores[candidates]
+            + NEW_TYPE_BONUS * new_type[types].sum(axis=1)
+            + WEAKNESS_COVER_BONUS * covered[types].sum(axis=1)
+        )
+        scores[in_team[candidates]] = 0
+        return scores
+    
     def analyze_team_coverage(self, team: List[str]) -> Dict:
         """Analyze type coverage and weaknesses"""
         if not team:
@@ -95,35 +152,26 @@ class TeamRecommender:
         team_df = self.pokemon_data[self.pokemon_data['name'].isin(team)]
         
         # Collect all types
-        team_types = []
-        for _, pokemon in team_df.iterrows():
-            team_types.append(pokemon['type_1'])
-            if pd.notna(pokemon.get('type_2')):
-                team_types.append(pokemon['type_2'])
-        
-        # Analyze weaknesses
-        all_weaknesses = []
-        for _, pokemon in team_df.iterrows():
-            types = [pokemon['type_1']]
-            if pd.notna(pokemon.get('type_2')):
-                types.append(pokemon['type_2'])
-            
-            for ptype in types:
-                all_weaknesses.extend(self.weaknesses.get(ptype, []))
-        
-        weakness_counts = Counter(all_weaknesses)
-        
-        # Analyze resistances
-        all_resistances = []
-        for ptype in team_types:
-            all_resistances.extend(self.resistances.get(ptype, []))
+        team_types = [
+            ptype for ptype in team_df[['type_1', 'type_2']].to_numpy().ravel().tolist()
+            if pd.notna(ptype)
+        ]
         
-        resistance_counts = Counter(all_resistances)
+        # Count, per attacking type, how many team types it hits or is resisted by
+        engine = self.type_engine
+        indices = engine.indices(team_types)
+        columns = engine.matrix[:, indices[indices != NO_TYPE]]
+        weakness_counts = (columns == 2).sum(axis=1)
+        resistance_counts = (columns == 0.5).sum(axis=1)
         
         return {
             'team_types': team_types,
-            'weaknesses': dict(weakness_counts),
-            'resistances': dict(resistance_counts),
+            'weaknesses': {
+                attack: int(count) for attack, count in zip(engine.types, weakness_counts) if count
+            },
+            'resistances': {
+                attack: int(count) for attack, count in zip(engine.types, resistance_counts) if count
+            },
             'type_coverage': len(set(team_types))
         }
     
@@ -137,56 +185,76 @@ class TeamRecommender:
             role_balance: Balance roles (sweeper/tank/support)
             seed_pokemon: Start with these Pokemon
         """
-        team = []
-        
-        # Get Pokemon from specified tier
-        tier_pokemon = self.tier_data[self.tier_data['tier'] == tier]
+        available = self._tier_candidates(tier)
+        team = self._greedy_team(available, self._seed_names(available, seed_pokemon))
+        return self._team_details(team)
+    
+    def optimize_team(self, tier: str = 'OU', seed_pokemon: List[str] = None,
+                      budget: float = DEFAULT_BUDGET, workers: Optional[int] = None,
+                      beam_width: int = DEFAULT_BEAM_WIDTH, random_state=None) -> Dict:
+        """
+        Search for the best-scoring team within a time budget
         
-        if tier_pokemon.empty:
-            tier_pokemon = self.tier_data.head(100)
+        Starts from the greedy team and a beam search, then runs randomized
+        multi-start swap search on a process pool (see team_optimizer).
         
-        # Merge with full Pokemon data
-        available = self.pokemon_data[
-            self.pokemon_data['name'].isin(tier_pokemon['pokemon'])
-        ].copy()
-        
-        # Add seed Pokemon if provided
-        if seed_pokemon:
-            for pokemon in seed_pokemon:
-                if pokemon in available['name'].values:
-                    team.append(pokemon)
-        
-        # Build team to 6 Pokemon
-        while len(team) < 6 and len(available) > 0:
-            # Analyze current team
-            coverage = self.analyze_team_coverage(team)
-            
-            # Score remaining Pokemon
-            scores = []
-            for _, pokemon in available.iterrows():
-                if pokemon['name'] in team:
-                    continue
-                
-                score = self._score_pokemon_for_team(
-                    pokemon,
-                    team,
-                    coverage
-                )
-                scores.append((pokemon['name'], score))
-            
-            # Sort by score and pick best
-            scores.sort(key=lambda x: x[1], reverse=True)
+        Args:
+            tier: Competitive tier to build for
+            seed_pokemon: Pokemon the team must include
+            budget: Seconds to search for
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            beam_width: Beam search width
+            random_state: Seed for the random starts
+        
+        Returns:
+            dict: team (as recommend_team returns), score, method and starts
+        """
+        available = self._tier_candidates(tier)
+        seeds = self._seed_names(available, seed_pokemon)
+        greedy = self._greedy_team(available, seeds)
+        
+        pool = np.unique(self._rows(set(self._names[available])))
+        result = optimize_team(
+            self.team_scorer, pool, self._rows(seeds), budget=budget, beam_width=beam_width,
+            workers=workers, initial=[self._rows(greedy)], random_state=random_state
+        )
+        team = [str(self._names[row]) for row in result['team']]
+        return {**result, 'team': self._team_details(team)}
+    
+    def team_score(self, team: List[str]) -> float:
+        """Whole-team score the optimizer maximizes"""
+        rows = self._rows(name for name in team if name in self._row_by_name)
+        if not rows:
+            return 0.0
+        return float(self.team_scorer.score(np.array([rows]))[0])
+    
+    def _rows(self, names) -> List[int]:
+        """First pokemon_data row of each name"""
+        return [self._row_by_name[name] for name in names]
+    
+    def _seed_names(self, available: np.ndarray, seed_pokemon: Optional[List[str]]) -> List[str]:
+        """Seed Pokemon that are in the candidate pool"""
+        available_names = set(self._names[available])
+        return [pokemon for pokemon in dict.fromkeys(seed_pokemon or []) if pokemon in available_names]
+    
+    def _greedy_team(self, available: np.ndarray, seeds: List[str]) -> List[str]:
+        """Build team to 6 Pokemon, greedily taking the best-scoring candidate"""
+        team = list(seeds)
+        while len(team) < TEAM_SIZE:
+            remaining = available[~np.isin(self._names[available], team)]
+            if len(remaining) == 0:
+                break
             
-            if scores:
-                best_pokemon = scores[0][0]
-                team.append(best_pokemon)
-        
-        # Build detailed team info
+            scores = self._candidate_scores(remaining, team)
+            # argmax keeps the first of equal scores, in dex order
+            team.append(str(self._names[remaining[np.argmax(scores)]]))
+        return team
+    
+    def _team_details(self, team: List[str]) -> List[Dict]:
+        """Build detailed team info"""
         team_details = []
         for pokemon_name in team:
-            pokemon = self.pokemon_data[
-                self.pokemon_data['name'] == pokemon_name
-            ].iloc[0]
+            pokemon = self.pokemon_index.row(pokemon_name)
             
             details = {
                 'name': pokemon_name,
@@ -205,6 +273,16 @@ class TeamRecommender:
         
         return team_details
     
+    def _tier_candidates(self, tier: str) -> np.ndarray:
+        """pokemon_data row positions of a tier's Pokemon (first 100 tier rows if unknown)"""
+        tier_pokemon = self.tier_data[self.tier_data['tier'] == tier]
+        
+        if tier_pokemon.empty:
+            tier_pokemon = self.tier_data.head(100)
+        
+        names = tier_pokemon[_name_column(tier_pokemon)].unique()
+        return np.flatnonzero(np.isin(self._names, names))
+    
     def _score_pokemon_for_team(self, pokemon: pd.Series, 
                                 team: List[str], 
                                 coverage: Dict) -> float:
@@ -232,12 +310,7 @@ class TeamRecommender:
                     score += 30  # Covers team weakness
         
         # Usage bonus (popular Pokemon)
-        usage_data = self.usage_stats[
-            self.usage_stats['pokemon'] == pokemon['name']
-        ]
-        if not usage_data.empty:
-            avg_usage = usage_data['usage_percent'].mean()
-            score += avg_usage * 5
+        score += self.usage_means.get(pokemon['name'], 0) * 5
         
         # Avoid duplicates
         if pokemon['name'] in team:
@@ -247,6 +320,10 @@ class TeamRecommender:
     
     def _determine_role(self, pokemon: pd.Series) -> str:
         """Determine Pokemon's role based on stats"""
+        # Precomputed by the enrichment stage when available
+        if 'role' in pokemon.index and pd.notna(pokemon['role']):
+            return pokemon['role']
+        
         atk = pokemon['attack']
         sp_atk = pokemon['sp_attack']
         defense = pokemon['defense']
@@ -301,6 +378,23 @@ class TeamRecommender:
                 help="Ensure mix of sweepers, tanks, and support"
             )
         
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            search_mode = st.radio(
+                "Search Mode",
+                ["Greedy", "Optimizer"],
+                horizontal=True,
+                help="Optimizer: beam search plus parallel multi-start swap search"
+            )
+        
+        with col2:
+            budget = st.slider(
+                "Time Budget (s)",
+                0.5, 10.0, DEFAULT_BUDGET, 0.5,
+                disabled=search_mode != "Optimizer"
+            )
+        
         # Optional seed Pokemon
         st.subheader("🌱 Seed Pokemon (Optional)")
         st.markdown("*Start your team with specific Pokemon*")
@@ -317,11 +411,23 @@ class TeamRecommender:
         if st.button("🎲 Generate Team", type="primary", 
                      use_container_width=True):
             with st.spinner("Analyzing meta and building team..."):
-                team = self.recommend_team(
-                    tier=tier,
-                    role_balance=role_balance,
-                    seed_pokemon=seed_pokemon
-                )
+                if search_mode == "Optimizer":
+                    result = self.optimize_team(
+                        tier=tier,
+                        seed_pokemon=seed_pokemon,
+                        budget=budget
+                    )
+                    team = result['team']
+                    st.caption(
+                        f"Best of the greedy team, beam search and {result['starts']} "
+                        f"random starts in {budget:.1f}s (won by {result['method']})"
+                    )
+                else:
+                    team = self.recommend_team(
+                        tier=tier,
+                        role_balance=role_balance,
+                        seed_pokemon=seed_pokemon
+                    )
                 
                 if team:
                     st.session_state['recommended_team'] = team
@@ -339,7 +445,7 @@ class TeamRecommender:
         st.header("👥 Your Recommended Team")
         
         # Team overview
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             avg_bst = sum(p['total'] for p in team) / len(team)
@@ -357,6 +463,9 @@ class TeamRecommender:
             roles = set(p['role'] for p in team)
             st.metric("Unique Roles", len(roles))
         
+        with col4:
+            st.metric("Team Score", f"{self.team_score([p['name'] for p in team]):.0f}")
+        
         st.divider()
         
         # Display each Pokemon
@@ -438,7 +547,7 @@ class TeamRecommender:
             if st.button("📋 Copy Team (Text)"):
                 team_text = "\n".join([
                     f"{i}. {p['name']} ({p['type_1']}"
-                    f"{f'/{p["type_2"]}' if p['type_2'] else ''})"
+                    f"{('/' + p['type_2']) if p['type_2'] else ''})"
                     for i, p in enumerate(team, 1)
                 ])
                 st.code(team_text)
@@ -0,0 +1,202 @@
+"""
+Type Effectiveness Engine
+Single 18x18 type matrix with vectorized single and dual-type lookups
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from yaml_loader import load_yaml_cached
+
+
+# Canonical type order; matrix rows and columns follow it
+TYPES = [
+    'Normal', 'Fire', 'Water', 'Electric', 'Grass', 'Ice',
+    'Fighting', 'Poison', 'Ground', 'Flying', 'Psychic', 'Bug',
+    'Rock', 'Ghost', 'Dragon', 'Dark', 'Steel', 'Fairy'
+]
+
+# Index used for a missing second type (or an unknown type); always neutral
+NO_TYPE = -1
+
+# Combo id of a Pokemon whose primary type is unknown; its profile is neutral
+NO_COMBO = -1
+
+DEFAULT_CHART_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "type-chart.yaml"
+
+_CHART_MULTIPLIERS = {'super-effective': 2.0, 'not-very-effective': 0.5, 'no-effect': 0.0}
+
+
+class TypeEngine:
+    """
+    Type chart as a matrix: matrix[attack, defend] is the single-type multiplier
+
+    Every lookup also accepts NO_TYPE, which is treated as neutral, so dual-type
+    defenders are simply pairs of indices with NO_TYPE for mono-types.
+
+    Every defending type combination (18 single + 153 dual = 171) also has a
+    combo id and a precomputed row in combo_profiles, so defensive queries are
+    a single row lookup.
+    """
+
+    def __init__(self, matrix: np.ndarray, types: Sequence[str] = TYPES):
+        """
+        Initialize the engine
+
+        Args:
+            matrix: Square attack x defend multiplier matrix
+            types: Type names in matrix order
+        """
+        self.types = list(types)
+        self.n_types = len(self.types)
+        self.matrix = np.asarray(matrix, dtype=np.float32)
+        self._index = {name.lower(): i for i, name in enumerate(self.types)}
+
+        # Extra neutral row/column so NO_TYPE (-1) indexes straight into the matrix
+        self._padded = np.ones((self.n_types + 1, self.n_types + 1), dtype=np.float32)
+        self._padded[:self.n_types, :self.n_types] = self.matrix
+
+        self._build_combos()
+
+    @classmethod
+    def from_yaml(cls, path: Optional[Path] = None) -> 'TypeEngine':
+        """Build the matrix from a type-chart.yaml file"""
+        chart = load_yaml_cached(Path(path) if path else DEFAULT_CHART_PATH)
+
+        matrix = np.ones((len(TYPES), len(TYPES)), dtype=np.float32)
+        index = {name.lower(): i for i, name in enumerate(TYPES)}
+        for attack, relations in chart.items():
+            for relation, multiplier in _CHART_MULTIPLIERS.items():
+                for defend in relations.get(relation) or []:
+                    matrix[index[attack.lower()], index[defend.lower()]] = multiplier
+        return cls(matrix)
+
+    def _build_combos(self):
+        """Enumerate type combinations and their defensive profiles"""
+        n = self.n_types
+        first, second = np.triu_indices(n)
+        # Mono-types are stored as (type, NO_TYPE)
+        second = np.where(first == second, NO_TYPE, second)
+        self.combo_types = np.stack([first, second], axis=1).astype(np.int8)
+        self.n_combos = len(self.combo_types)
+
+        # combo id by (type_1, type_2) index pair, symmetric; row/column n is NO_TYPE
+        self._combo_lookup = np.full((n + 1, n + 1), NO_COMBO, dtype=np.int16)
+        combo_ids = np.arange(self.n_combos, dtype=np.int16)
+        self._combo_lookup[first, second] = combo_ids
+        self._combo_lookup[second, first] = combo_ids
+        # A repeated type is the mono-type
+        diagonal = np.arange(n)
+        self._combo_lookup[diagonal, diagonal] = self._combo_lookup[diagonal, NO_TYPE]
+
+        # Extra neutral last row so NO_COMBO (-1) indexes straight into the table
+        profiles = self.defensive_profiles(self.combo_types[:, 0], self.combo_types[:, 1])
+        self._combo_profiles = np.vstack([profiles, np.ones((1, n), dtype=np.float32)])
+
+    # ---------- name <-> index ----------
+
+    def index(self, type_name) -> int:
+        """Index of a type name (case-insensitive); NO_TYPE for missing or unknown"""
+        if not isinstance(type_name, str):
+            return NO_TYPE
+        return self._index.get(type_name.lower(), NO_TYPE)
+
+    def indices(self, type_names: Iterable) -> np.ndarray:
+        """Indices of many type names; NO_TYPE for missing or unknown"""
+        return np.array([self.index(name) for name in type_names], dtype=np.int8)
+
+    def names(self, mask: np.ndarray) -> List[str]:
+        """Type names selected by a boolean mask over the type axis"""
+        return [self.types[i] for i in np.flatnonzero(mask)]
+
+    # ---------- multipliers ----------
+
+    def multipliers(self, attack, defend_1, defend_2=NO_TYPE) -> np.ndarray:
+        """
+        Vectorized multipliers for attacking types against (dual-type) defenders
+
+        Arguments are type indices (scalars or arrays) and broadcast like NumPy
+        arrays, e.g. attack[:, None] against defend_1[None, :] yields a full grid.
+        """
+        attack = np.asarray(attack)
+        return self._padded[attack, np.asarray(defend_1)] * self._padded[attack, np.asarray(defend_2)]
+
+    def effectiveness(self, attack_type: str, defend_types: Sequence) -> float:
+        """Multiplier of one attacking type against a defender's type list"""
+        attack = self.index(attack_type)
+        multiplier = 1.0
+        for defend_type in defend_types:
+            multiplier *= float(self._padded[attack, self.index(defend_type)])
+        return multiplier
+
+    def defensive_profile(self, defend_types: Sequence) -> np.ndarray:
+        """Multiplier of every attacking type against a defender, shape (18,)"""
+        profile = np.ones(self.n_types, dtype=np.float32)
+        for defend_type in defend_types:
+            profile *= self._padded[:self.n_types, self.index(defend_type)]
+        return profile
+
+    def defensive_profiles(self, defend_1, defend_2) -> np.ndarray:
+        """Defensive profiles for arrays of defenders, shape (n, 18)"""
+        attack = np.arange(self.n_types)
+        return self.multipliers(
+            attack[None, :],
+            np.asarray(defend_1)[:, None],
+            np.asarray(defend_2)[:, None]
+        )
+
+    def offensive_profile(self, attack_types: Sequence) -> np.ndarray:
+        """Single-type multipliers of each attacking type, shape (len(attack_types), 18)"""
+        return self._padded[self.indices(attack_types), :self.n_types]
+
+    # ---------- type combinations ----------
+
+    @property
+    def combo_profiles(self) -> np.ndarray:
+        """Defensive profile of every type combination, shape (171, 18)"""
+        return self._combo_profiles[:self.n_combos]
+
+    def combo_id(self, defend_types: Sequence) -> int:
+        """Combo id of a defender's type list (order-insensitive)"""
+        indices = [self.index(t) for t in defend_types][:2] + [NO_TYPE, NO_TYPE]
+        return int(self._combo_lookup[indices[0], indices[1]])
+
+    def combo_ids(self, type_1: Iterable, type_2: Iterable) -> np.ndarray:
+        """Combo ids for parallel sequences of primary and secondary types"""
+        return self._combo_lookup[self.indices(type_1), self.indices(type_2)]
+
+    def combo_names(self, combo_id: int) -> List[str]:
+        """Type names of a combo id"""
+        if combo_id == NO_COMBO:
+            return []
+        return [self.types[i] for i in self.combo_types[combo_id] if i != NO_TYPE]
+
+    def combo_profile(self, combo_id) -> np.ndarray:
+        """Defensive profile row(s) of combo id(s); NO_COMBO is neutral"""
+        return self._combo_profiles[combo_id]
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Nested attack -> defend -> multiplier mapping"""
+        return {
+            attack: dict(zip(self.types, self.matrix[i].tolist()))
+            for i, attack in enumerate(self.types)
+        }
+
+
+_type_engine = None
+
+
+def get_type_engine() -> TypeEngine:
+    """Get the shared type engine, loaded from data/type-chart.yaml"""
+    global _type_engine
+    if _type_engine is None:
+        _type_engine = TypeEngine.from_yaml()
+    return _type_engine
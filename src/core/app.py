@@ -23,12 +23,28 @@ sys.path.insert(0, str(features_path))
 utils_path = Path(__file__).parent.parent / "utils"
 sys.path.insert(0, str(utils_path))
 
-# Import feature modules
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+sys.path.insert(0, str(data_loaders_path))
+
+# Add analytics directory to path
+analytics_path = Path(__file__).parent.parent / "analytics"
+sys.path.insert(0, str(analytics_path))
+
+# Import feature modules (section-specific features are imported by the router)
 from dark_mode import dark_mode_toggle, apply_dark_mode, get_theme_colors
-from type_calculator import display_type_calculator
-from team_builder import display_team_builder
-from advanced_search import create_advanced_filters, quick_search_bar, display_filter_summary
-from variant_stats import display_variant_statistics
+from dex_snapshot import load_dex_frame
+from dex_schema import prepare_dex, PREPARED_DEX_VERSION
+from dex_store import DexStore
+from dex_index import DexIndex
+from yaml_loader import load_yaml_cached
+from type_engine import get_type_engine
+
+# Copy-on-Write (the default from pandas 3.0) keeps the shallow per-session
+# frames handed out by DexStore and DataCatalog from writing through to the
+# shared data; enable it once here rather than as an import side effect
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
 
 # Import utility modules
 try:
@@ -36,6 +52,7 @@ try:
     from data_validator import DataValidator
     from backup_manager import BackupManager
     from performance_profiler import get_profiler, profile
+    from validation_cache import get_validation_cache
     UTILS_AVAILABLE = True
 except ImportError as e:
     UTILS_AVAILABLE = False
@@ -55,24 +72,43 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ==================== NAVIGATION ====================
+
+# Main sections (v5.4.2 - Added Admin Utilities)
+NAV_SECTIONS = [
+    "📊 Overview",
+    "🔍 Pokémon Search",
+    "⚔️ Competitive Analysis",
+    "📈 Statistics & Trends",
+    "🎨 Type Analysis",
+    "🧬 Evolution & Forms",
+    "🎮 By Game",
+    "🎨 Sprite Gallery",
+    "⚡ Type Calculator",
+    "👥 Team Builder",
+    "📊 Variant Statistics",
+    "🏆 Legacy Team Builder",
+    "📊 Meta Analytics",
+    "⚔️ Damage Calculator",
+    "🤖 Team Recommender",
+    "🔍 Sprite Comparison",
+    "📤 Advanced Export",
+    "🛠️ Admin Utilities"
+]
+
 # ==================== DATA LOADING ====================
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
 def load_main_dataset():
     """Load the enhanced National Dex CSV with variants - 1,130 entries (1,025 base + 105 variants)"""
     try:
         if UTILS_AVAILABLE:
             profiler.start_timer('load_main_dataset')
         
-        # Try new variant CSV first
+        # Try new variant CSV first (read through its enriched columnar snapshot)
         variant_csv_path = Path("data/national_dex_with_variants.csv")
         if variant_csv_path.exists():
-            df = pd.read_csv(variant_csv_path)
-            # Add variant support columns if missing
-            if 'variant_type' not in df.columns:
-                df['variant_type'] = 'base'
-            if 'base_pokemon_id' not in df.columns:
-                df['base_pokemon_id'] = df['pokedex_number']
+            df = load_dex_frame(variant_csv_path, transform=prepare_dex,
+                                transform_version=PREPARED_DEX_VERSION)
             
             if UTILS_AVAILABLE:
                 profiler.end_timer('load_main_dataset', {'rows': len(df)})
@@ -81,10 +117,9 @@ def load_main_dataset():
         # Fallback to original CSV
         csv_path = Path("data/national_dex.csv")
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            # Add variant columns for compatibility
-            df['variant_type'] = 'base'
-            df['base_pokemon_id'] = df['pokedex_number']
+            # prepare_dex adds the variant columns for compatibility
+            df = load_dex_frame(csv_path, transform=prepare_dex,
+                                transform_version=PREPARED_DEX_VERSION)
             if len(df) < 1025:
                 st.warning(f"⚠️ Data may be outdated. Expected 1025 Pokemon, found {len(df)}")
             
@@ -102,6 +137,53 @@ def load_main_dataset():
         st.error(f"Error loading dataset: {e}")
         return None
 
+@st.cache_resource(ttl=3600)  # Shared by all sessions, refreshed hourly
+def get_dex_store():
+    """Load the main dataset once per process into a shared read-only store"""
+    df = load_main_dataset()
+    if df is None:
+        return None
+    return DexStore(df)
+
+# Heavy section objects are built on first visit to their section and shared
+# by all sessions; none of them hold per-session state
+
+@st.cache_resource
+def get_meta_dashboard():
+    """Construct the meta analytics dashboard on first use"""
+    from meta_dashboard import MetaAnalyticsDashboard
+    return MetaAnalyticsDashboard(data_dir="data")
+
+@st.cache_resource
+def get_damage_calculator():
+    """Construct the damage calculator on first use"""
+    from damage_calculator import DamageCalculator
+    calculator = DamageCalculator(data_dir="data")
+    if UTILS_AVAILABLE:
+        for cache_name in calculator.cache_stats():
+            profiler.register_cache(
+                cache_name, lambda name=cache_name: calculator.cache_stats()[name]
+            )
+    return calculator
+
+@st.cache_resource
+def get_team_recommender():
+    """Construct the team recommender on first use"""
+    from team_recommender import TeamRecommender
+    return TeamRecommender(data_dir="data")
+
+@st.cache_resource
+def get_sprite_comparison():
+    """Construct the sprite comparison tool on first use"""
+    from sprite_comparison import SpriteComparison
+    return SpriteComparison(data_dir="data")
+
+@st.cache_resource
+def get_advanced_exporter():
+    """Construct the advanced exporter on first use"""
+    from advanced_export import AdvancedExporter
+    return AdvancedExporter()
+
 @st.cache_data
 def load_competitive_data():
     """Load competitive data (IVs, EVs, Natures)"""
@@ -111,6 +193,38 @@ def load_competitive_data():
             return pd.DataFrame(json.load(f))
     return None
 
+@st.cache_resource
+def get_competitive_index():
+    """Name index over the competitive data, built once"""
+    comp_df = load_competitive_data()
+    return DexIndex(comp_df if comp_df is not None else pd.DataFrame(columns=['name']))
+
+@st.cache_resource
+def get_stat_engine():
+    """Stat engine over the main dataset, built once"""
+    from stat_engine import StatEngine
+    dex_store = get_dex_store()
+    if dex_store is None:
+        return None
+    return StatEngine(dex_store.frame, load_natures())
+
+@st.cache_resource
+def get_speed_index():
+    """Speed tier index over the main dataset, built once"""
+    from speed_tiers import SpeedTierIndex
+    stat_engine = get_stat_engine()
+    if stat_engine is None:
+        return None
+    return SpeedTierIndex(get_dex_store().frame, stat_engine)
+
+@st.cache_data
+def load_games_yaml():
+    """Load game definitions from games.yaml"""
+    games_path = Path("data/games.yaml")
+    if games_path.exists():
+        return load_yaml_cached(games_path)
+    return None
+
 @st.cache_data
 def load_natures():
     """Load nature information"""
@@ -243,26 +357,9 @@ def display_sprite(sprite_data, width=None, use_container_width=False):
 
 # ==================== HELPER FUNCTIONS ====================
 
-def get_pokemon_variants(df, base_pokemon_id):
-    """Get all variant forms of a Pokemon"""
-    if 'base_pokemon_id' not in df.columns:
-        return []
-    
-    # Get all forms with matching base_pokemon_id (including base form)
-    variants = df[df['base_pokemon_id'] == base_pokemon_id].copy()
-    
-    # Sort: base first, then mega, then others
-    variant_order = {'base': 0, 'mega': 1, 'mega-x': 2, 'mega-y': 3, 
-                     'alolan': 4, 'galarian': 5, 'hisuian': 6, 
-                     'paldean': 7, 'gigantamax': 8}
-    
-    if 'variant_type' in variants.columns:
-        variants['sort_order'] = variants['variant_type'].map(
-            lambda x: variant_order.get(x, 99)
-        )
-        variants = variants.sort_values('sort_order')
-    
-    return variants.to_dict('records')
+def get_pokemon_variants(dex_index, base_pokemon_id):
+    """Get all variant forms of a Pokemon (base first, then mega, then others)"""
+    return dex_index.variants(base_pokemon_id).to_dict('records')
 
 
 @st.cache_data
@@ -353,24 +450,18 @@ def create_stat_distribution_chart(df, stat_name):
 
 def create_type_effectiveness_heatmap(pokemon):
     """Create type effectiveness heatmap for a Pokemon"""
-    types = [
-        'normal', 'fire', 'water', 'electric', 'grass', 'ice',
-        'fighting', 'poison', 'ground', 'flying', 'psychic', 'bug',
-        'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
-    ]
-    
-    effectiveness = []
-    for t in types:
-        col_name = f'against_{t}'
-        if col_name in pokemon:
-            effectiveness.append(pokemon[col_name])
-        else:
-            effectiveness.append(1.0)
+    # Precomputed defensive profile row of the Pokemon's type combination
+    engine = get_type_engine()
+    if 'type_combo_id' in pokemon:
+        combo_id = pokemon['type_combo_id']
+    else:
+        combo_id = engine.combo_id([pokemon['type_1'], pokemon.get('type_2')])
+    effectiveness = engine.combo_profile(combo_id).tolist()
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
         z=[effectiveness],
-        x=[t.title() for t in types],
+        x=engine.types,
         y=['Defensive'],
         colorscale=[
             [0, '#00ff00'],  # Immune (0x)
@@ -568,21 +659,27 @@ def main():
     st.markdown("### Version 5.4.2 - Enhanced System with Utilities & Admin Dashboard")
     st.caption("🔥 NEW: Admin Utilities | Error Logging | Backups | Performance Monitoring | Data Validation")
     
-    # Startup validation (non-blocking)
+    # Startup validation (non-blocking): changed files are validated by a
+    # background worker and only cached outcomes are shown
     if UTILS_AVAILABLE:
-        validator = DataValidator()
-        with st.spinner("� Validating data files..."):
-            validation_results = validator.validate_all_data_files()
-            
-            # Show warnings for any issues (non-blocking)
-            if 'files' in validation_results:
-                for result in validation_results['files']:
-                    if not result.get('valid', True):
-                        st.warning(f"⚠️ Data validation warning in {result.get('file', 'unknown')}: "
-                                 f"{result.get('error', 'Unknown issue')}")
+        validation_cache = get_validation_cache()
+        validation_cache.start_background_refresh()
+        validation_results = validation_cache.cached_results()
+        
+        # Show warnings for any issues (non-blocking)
+        for result in validation_results['files']:
+            if not result.get('is_valid', True):
+                errors = result.get('errors') or ['Unknown issue']
+                st.warning(f"⚠️ Data validation warning in {result.get('file', 'unknown')}: "
+                         f"{errors[0]}")
+        for failure in validation_results['failed']:
+            st.warning(f"⚠️ Could not validate {failure['file']}: {failure['error']}")
+        if validation_results['worker_error']:
+            st.warning(f"⚠️ Background data validation failed: {validation_results['worker_error']}")
     
     # Load data
-    df = load_main_dataset()
+    dex_store = get_dex_store()
+    df = dex_store.frame if dex_store is not None else None
     comp_df = load_competitive_data()
     natures = load_natures()
     
@@ -614,6 +711,7 @@ def main():
         # Cache management
         if st.button("🔄 Clear Cache & Reload Data", help="Clear cached data and reload from source"):
             st.cache_data.clear()
+            st.cache_resource.clear()
             st.rerun()
         
         # Animation toggle
@@ -662,65 +760,44 @@ def main():
         min_bst = st.slider("Min Base Stat Total", 0, 800, 0)
         max_bst = st.slider("Max Base Stat Total", 0, 800, 800)
         
-        # Apply filters
-        filtered_df = df.copy()
-        
-        # Apply variant filter (NEW!)
-        if selected_variants:
-            variant_filter = []
-            if "Base Forms" in selected_variants:
-                variant_filter.append('base')
-            if "Mega Evolution" in selected_variants:
-                variant_filter.extend(['mega', 'mega-x', 'mega-y'])
-            if "Regional Forms" in selected_variants:
-                variant_filter.extend(['alolan', 'galarian', 'hisuian', 'paldean'])
-            if "Gigantamax" in selected_variants:
-                variant_filter.append('gigantamax')
-            
-            if variant_filter and 'variant_type' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['variant_type'].isin(variant_filter)]
-        
-        if selected_gen != "All":
-            gen_num = int(selected_gen.split()[1])
-            filtered_df = filtered_df[filtered_df['generation'] == gen_num]
-        
-        if selected_types:
-            filtered_df = filtered_df[filtered_df['type_1'].isin(selected_types)]
-        
-        if selected_status != "All":
-            filtered_df = filtered_df[filtered_df['status'] == selected_status]
-        
-        filtered_df = filtered_df[
-            (filtered_df['total_points'] >= min_bst) &
-            (filtered_df['total_points'] <= max_bst)
-        ]
+        # Apply filters (row positions into the shared store, no full copy)
+        variant_filter = []
+        if "Base Forms" in selected_variants:
+            variant_filter.append('base')
+        if "Mega Evolution" in selected_variants:
+            variant_filter.extend(['mega', 'mega-x', 'mega-y'])
+        if "Regional Forms" in selected_variants:
+            variant_filter.extend(['alolan', 'galarian', 'hisuian', 'paldean'])
+        if "Gigantamax" in selected_variants:
+            variant_filter.append('gigantamax')
+        
+        gen_num = int(selected_gen.split()[1]) if selected_gen != "All" else None
+        
+        filtered_positions = dex_store.select(
+            variant_types=variant_filter,
+            generation=gen_num,
+            primary_types=selected_types,
+            status=selected_status if selected_status != "All" else None,
+            bst_range=(min_bst, max_bst)
+        )
+        filtered_df = dex_store.take(filtered_positions)
         
         st.markdown(f"**{len(filtered_df)}** Pokémon match filters")
     
-    # Main Tabs (v5.4.2 - Added Admin Utilities)
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11, tab12, tab13, tab14, tab15, tab16, tab17, tab18 = st.tabs([
-        "📊 Overview",
-        "🔍 Pokémon Search",
-        "⚔️ Competitive Analysis",
-        "📈 Statistics & Trends",
-        "🎨 Type Analysis",
-        "🧬 Evolution & Forms",
-        "🎮 By Game",
-        "🎨 Sprite Gallery",
-        "⚡ Type Calculator",
-        "👥 Team Builder",
-        "📊 Variant Statistics",
-        "🏆 Legacy Team Builder",
-        "📊 Meta Analytics",
-        "⚔️ Damage Calculator",
-        "🤖 Team Recommender",
-        "🔍 Sprite Comparison",
-        "📤 Advanced Export",
-        "🛠️ Admin Utilities"
-    ])
+    # Section navigation: only the active section is imported and executed per rerun
+    active_section = st.radio(
+        "Section",
+        NAV_SECTIONS,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_section"
+    )
+    st.markdown("---")
+    
+    stats_cols = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
     
     # ==================== TAB 1: OVERVIEW ====================
-    with tab1:
+    if active_section == NAV_SECTIONS[0]:
         # Hero Section with Gradient
         st.markdown("""
             <div style="background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 50%, #06b6d4 100%); 
@@ -1070,7 +1147,7 @@ def main():
                 st.plotly_chart(fig, use_container_width=True, key="overview_region_bar")
             else:
                 # Pokemon by Generation as fallback
-                gen_counts = df.groupby('generation').size().reset_index(name='count')
+                gen_counts = df.groupby('generation', observed=True).size().reset_index(name='count')
                 fig = px.bar(
                     gen_counts,
                     x='generation',
@@ -1092,7 +1169,8 @@ def main():
         
         with viz_col2:
             # Type Distribution - Pie Chart
-            type_counts = df['type_1'].value_counts()
+            # Categorical columns count every category; keep those present in the filtered frame
+            type_counts = df['type_1'].value_counts().loc[lambda counts: counts > 0]
             fig = px.pie(
                 values=type_counts.values,
                 names=type_counts.index,
@@ -1125,7 +1203,7 @@ def main():
         
         with viz_col3:
             # Generation Timeline with Cumulative Count
-            gen_counts = df.groupby('generation').size().reset_index(name='count')
+            gen_counts = df.groupby('generation', observed=True).size().reset_index(name='count')
             gen_counts['cumulative'] = gen_counts['count'].cumsum()
             
             fig = px.area(
@@ -1154,7 +1232,7 @@ def main():
         
         with viz_col4:
             # Top 10 Types - Horizontal Bar
-            type_counts_top = df['type_1'].value_counts().head(10)
+            type_counts_top = df['type_1'].value_counts().loc[lambda counts: counts > 0].head(10)
             fig = px.bar(
                 x=type_counts_top.values,
                 y=type_counts_top.index,
@@ -1236,7 +1314,9 @@ def main():
             """, unsafe_allow_html=True)
     
     # ==================== TAB 2: POKEMON SEARCH ====================
-    with tab2:
+    elif active_section == NAV_SECTIONS[1]:
+        from advanced_search import create_advanced_filters, quick_search_bar, display_filter_summary
+        
         st.header("🔍 Pokémon Search & Details")
         
         # Quick search bar (NEW v5.0.0)
@@ -1279,7 +1359,7 @@ def main():
             )
         
         # Display filtered Pokemon (use advanced filtered data)
-        display_df = search_filtered_df.copy()
+        display_df = search_filtered_df
         
         # Enhanced search: Support name, number, type, and generation
         if search_query:
@@ -1334,7 +1414,7 @@ def main():
             base_id = int(pokemon.get('base_pokemon_id', poke_num))
             
             # Get all variants of this Pokemon
-            variants = get_pokemon_variants(df, base_id)
+            variants = get_pokemon_variants(dex_store.index, base_id)
             
             # Create type text for expander title
             type1 = pokemon["type_1"]
@@ -1393,7 +1473,7 @@ def main():
                 st.plotly_chart(fig, use_container_width=True, key=f"type_eff_{idx}")
     
     # ==================== TAB 3: COMPETITIVE ANALYSIS ====================
-    with tab3:
+    elif active_section == NAV_SECTIONS[2]:
         st.header("⚔️ Competitive Battle Analysis")
         
         if comp_df is not None:
@@ -1433,93 +1513,202 @@ def main():
             )
             
             # Get Pokemon data
-            pokemon_base = df[df['name'] == selected_pokemon_name].iloc[0]
-            
-            # Safely get competitive data if available
-            comp_data = comp_df[comp_df['name'] == selected_pokemon_name]
-            if len(comp_data) > 0:
-                pokemon_comp = comp_data.iloc[0]
+            pokemon_base = dex_store.index.row(selected_pokemon_name)
+            if pokemon_base is None:
+                st.warning(f"⚠️ {selected_pokemon_name} was not found in the dex")
             else:
-                pokemon_comp = pokemon_base  # Fallback to base data
+                # Safely get competitive data if available
+                pokemon_comp = get_competitive_index().row(selected_pokemon_name)
+                if pokemon_comp is None:
+                    pokemon_comp = pokemon_base  # Fallback to base data
             
-            col1, col2, col3 = st.columns([1, 2, 2])
+                col1, col2, col3 = st.columns([1, 2, 2])
             
-            with col1:
-                pokemon_id = int(pokemon_base['pokedex_number'])
-                sprite_data = load_sprite(pokemon_id, use_animated=use_animations)
-                display_sprite(sprite_data, width=200)
-                st.markdown(f"### {pokemon_base['name']}")
+                with col1:
+                    pokemon_id = int(pokemon_base['pokedex_number'])
+                    sprite_data = load_sprite(pokemon_id, use_animated=use_animations)
+                    display_sprite(sprite_data, width=200)
+                    st.markdown(f"### {pokemon_base['name']}")
                 
-                # Safely display competitive info (may not be available for all Pokemon)
-                if 'competitive_tier' in pokemon_comp and pd.notna(pokemon_comp.get('competitive_tier')):
-                    st.markdown(f"**Tier:** {pokemon_comp['competitive_tier']}")
-                else:
-                    st.markdown("**Tier:** Not Ranked")
+                    # Safely display competitive info (may not be available for all Pokemon)
+                    if 'competitive_tier' in pokemon_comp and pd.notna(pokemon_comp.get('competitive_tier')):
+                        st.markdown(f"**Tier:** {pokemon_comp['competitive_tier']}")
+                    else:
+                        st.markdown("**Tier:** Not Ranked")
                 
-                if 'optimal_role' in pokemon_comp and pd.notna(pokemon_comp.get('optimal_role')):
-                    st.markdown(f"**Role:** {pokemon_comp['optimal_role']}")
-                else:
-                    st.markdown("**Role:** N/A")
+                    if 'optimal_role' in pokemon_comp and pd.notna(pokemon_comp.get('optimal_role')):
+                        st.markdown(f"**Role:** {pokemon_comp['optimal_role']}")
+                    else:
+                        st.markdown("**Role:** N/A")
                 
-                if 'optimal_nature' in pokemon_comp and pd.notna(pokemon_comp.get('optimal_nature')):
-                    st.markdown(f"**Nature:** {pokemon_comp['optimal_nature']}")
-                else:
-                    st.markdown("**Nature:** N/A")
+                    if 'optimal_nature' in pokemon_comp and pd.notna(pokemon_comp.get('optimal_nature')):
+                        st.markdown(f"**Nature:** {pokemon_comp['optimal_nature']}")
+                    else:
+                        st.markdown("**Nature:** N/A")
             
-            with col2:
-                st.subheader("Optimal EV Spread")
+                with col2:
+                    st.subheader("Optimal EV Spread")
                 
-                # Check if competitive data has EV spread info
-                if 'optimal_ev_spread' in pokemon_comp and pokemon_comp['optimal_ev_spread'] is not None:
-                    ev_spread = pokemon_comp['optimal_ev_spread']
-                    ev_df = pd.DataFrame({
-                        'Stat': ['HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed'],
-                        'EVs': [
-                            ev_spread['hp'],
-                            ev_spread['attack'],
-                            ev_spread['defense'],
-                            ev_spread['sp_attack'],
-                            ev_spread['sp_defense'],
-                            ev_spread['speed']
-                        ]
-                    })
+                    # Check if competitive data has EV spread info
+                    if 'optimal_ev_spread' in pokemon_comp and pokemon_comp['optimal_ev_spread'] is not None:
+                        ev_spread = pokemon_comp['optimal_ev_spread']
+                        ev_df = pd.DataFrame({
+                            'Stat': ['HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed'],
+                            'EVs': [
+                                ev_spread['hp'],
+                                ev_spread['attack'],
+                                ev_spread['defense'],
+                                ev_spread['sp_attack'],
+                                ev_spread['sp_defense'],
+                                ev_spread['speed']
+                            ]
+                        })
                     
-                    fig = px.bar(
-                        ev_df,
-                        x='Stat',
-                        y='EVs',
-                        title='Recommended EV Distribution',
-                        color='EVs',
-                        color_continuous_scale='blues'
-                    )
-                    fig.update_layout(showlegend=False, height=300)
-                    st.plotly_chart(fig, use_container_width=True, key="comp_ev_bar")
-                else:
-                    st.info("No competitive EV spread data available for this Pokémon.")
+                        fig = px.bar(
+                            ev_df,
+                            x='Stat',
+                            y='EVs',
+                            title='Recommended EV Distribution',
+                            color='EVs',
+                            color_continuous_scale='blues'
+                        )
+                        fig.update_layout(showlegend=False, height=300)
+                        st.plotly_chart(fig, use_container_width=True, key="comp_ev_bar")
+                    else:
+                        st.info("No competitive EV spread data available for this Pokémon.")
             
-            with col3:
-                st.subheader("Stats at Level 100")
+                with col3:
+                    st.subheader("Stats at Level 100")
                 
-                # Check if competitive data has optimal stats
-                if 'optimal_stats_lv100' in pokemon_comp and pokemon_comp['optimal_stats_lv100'] is not None:
-                    optimal_stats = pokemon_comp['optimal_stats_lv100']
-                    stats_df = pd.DataFrame({
-                        'Stat': list(optimal_stats.keys()),
-                        'Value': list(optimal_stats.values())
-                    })
+                    # Check if competitive data has optimal stats
+                    if 'optimal_stats_lv100' in pokemon_comp and pokemon_comp['optimal_stats_lv100'] is not None:
+                        optimal_stats = pokemon_comp['optimal_stats_lv100']
+                        stats_df = pd.DataFrame({
+                            'Stat': list(optimal_stats.keys()),
+                            'Value': list(optimal_stats.values())
+                        })
                     
-                    fig = px.bar(
-                        stats_df,
-                        x='Stat',
-                        y='Value',
-                        title='Optimal Stats (31 IVs, Optimal EVs & Nature)',
-                        color='Value',
-                        color_continuous_scale='reds'
-                    )
-                    fig.update_layout(showlegend=False, height=300)
-                    st.plotly_chart(fig, use_container_width=True, key="comp_stats_bar")
-                else:
-                    st.info("No competitive stats data available for this Pokémon.")
+                        fig = px.bar(
+                            stats_df,
+                            x='Stat',
+                            y='Value',
+                            title='Optimal Stats (31 IVs, Optimal EVs & Nature)',
+                            color='Value',
+                            color_continuous_scale='reds'
+                        )
+                        fig.update_layout(showlegend=False, height=300)
+                        st.plotly_chart(fig, use_container_width=True, key="comp_stats_bar")
+                    else:
+                        st.info("No competitive stats data available for this Pokémon.")
+            
+                # Final stats for any spread, nature and level
+                stat_engine = get_stat_engine()
+                if stat_engine is not None:
+                    with st.expander("🧮 Stat Calculator", expanded=False):
+                        from stat_engine import STATS, MAX_IV, MAX_EV, MAX_TOTAL_EVS
+                    
+                        default_nature = pokemon_comp.get('optimal_nature')
+                        nature_options = stat_engine.nature_names
+                        calc_col1, calc_col2 = st.columns(2)
+                        with calc_col1:
+                            calc_nature = st.selectbox(
+                                "Nature",
+                                nature_options,
+                                index=nature_options.index(default_nature) if default_nature in nature_options else 0,
+                                key="comp_calc_nature"
+                            )
+                        with calc_col2:
+                            calc_level = st.slider("Level", 1, 100, 100, key="comp_calc_level")
+                    
+                        default_evs = pokemon_comp.get('optimal_ev_spread')
+                        if not isinstance(default_evs, dict):
+                            default_evs = {}
+                        stat_labels = ['HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed']
+                        ev_cols = st.columns(len(STATS))
+                        calc_evs, calc_ivs = {}, {}
+                        for col, stat, label in zip(ev_cols, STATS, stat_labels):
+                            with col:
+                                calc_evs[stat] = st.number_input(
+                                    f"{label} EVs", 0, MAX_EV, int(default_evs.get(stat, 0) or 0),
+                                    step=4, key=f"comp_calc_ev_{stat}"
+                                )
+                                calc_ivs[stat] = st.number_input(
+                                    f"{label} IVs", 0, MAX_IV, MAX_IV, key=f"comp_calc_iv_{stat}"
+                                )
+                    
+                        total_evs = sum(calc_evs.values())
+                        if total_evs > MAX_TOTAL_EVS:
+                            st.warning(f"⚠️ {total_evs} EVs assigned; the limit is {MAX_TOTAL_EVS}.")
+                    
+                        final_stats = stat_engine.apply(
+                            {stat: pokemon_base[stat] for stat in STATS},
+                            calc_evs, calc_nature, calc_ivs, calc_level
+                        )
+                        calc_df = pd.DataFrame({
+                            'Stat': stat_labels,
+                            'Base': [int(pokemon_base[stat]) for stat in STATS],
+                            'EVs': [calc_evs[stat] for stat in STATS],
+                            'IVs': [calc_ivs[stat] for stat in STATS],
+                            'Nature': stat_engine.nature_modifiers([calc_nature])[0],
+                            'Final': [final_stats[stat] for stat in STATS]
+                        })
+                        st.dataframe(calc_df, use_container_width=True, hide_index=True)
+            
+                # Where this Pokemon sits among every other Pokemon's Speed
+                speed_index = get_speed_index()
+                if speed_index is not None:
+                    with st.expander("⚡ Speed Tiers", expanded=False):
+                        from speed_tiers import LEVELS, SPEED_MODIFIERS
+                    
+                        spread_labels = {
+                            'max_plus': "Max Speed, + nature",
+                            'max_neutral': "Max Speed, neutral",
+                            'min_minus': "0 IV / 0 EV, - nature"
+                        }
+                        tier_col1, tier_col2, tier_col3 = st.columns(3)
+                        with tier_col1:
+                            tier_level = st.selectbox("Level", LEVELS[::-1], key="speed_level")
+                        with tier_col2:
+                            own_spread = st.selectbox(
+                                f"{selected_pokemon_name} Spread", list(spread_labels),
+                                format_func=spread_labels.get, key="speed_own_spread"
+                            )
+                            own_modifiers = st.multiselect(
+                                f"{selected_pokemon_name} Modifiers", list(SPEED_MODIFIERS),
+                                format_func=str.title, key="speed_own_modifiers"
+                            )
+                        with tier_col3:
+                            field_spread = st.selectbox(
+                                "Opponents' Spread", list(spread_labels),
+                                format_func=spread_labels.get, key="speed_field_spread"
+                            )
+                            field_modifiers = st.multiselect(
+                                "Opponents' Modifiers", list(SPEED_MODIFIERS),
+                                format_func=str.title, key="speed_field_modifiers"
+                            )
+                    
+                        query = dict(spread=own_spread, level=tier_level, modifiers=own_modifiers,
+                                     field_spread=field_spread, field_modifiers=field_modifiers)
+                        faster, slower, tied = (
+                            [n for n in found(selected_pokemon_name, **query) if n != selected_pokemon_name]
+                            for found in (speed_index.faster_than, speed_index.slower_than, speed_index.ties)
+                        )
+                    
+                        metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+                        metric_col1.metric("Speed", speed_index.speed(
+                            selected_pokemon_name, own_spread, tier_level, own_modifiers))
+                        metric_col2.metric("Outspeeds", len(slower))
+                        metric_col3.metric("Outsped By", len(faster))
+                        metric_col4.metric("Speed Ties", len(tied))
+                    
+                        # Closest faster Pokemon are the ones worth investing to beat
+                        if len(faster):
+                            st.markdown("**Closest faster Pokémon**")
+                            st.dataframe(pd.DataFrame({
+                                'Pokémon': faster[:15],
+                                'Speed': [speed_index.speed(n, field_spread, tier_level, field_modifiers)
+                                          for n in faster[:15]]
+                            }), use_container_width=True, hide_index=True)
             
             # Nature information
             if natures:
@@ -1543,12 +1732,11 @@ def main():
             st.warning("⚠️ Competitive data not yet loaded. Run `python scripts/fetch_competitive_data.py` to generate competitive analysis.")
     
     # ==================== TAB 4: STATISTICS & TRENDS ====================
-    with tab4:
+    elif active_section == NAV_SECTIONS[3]:
         st.header("📈 Statistics & Trends Analysis")
         
         # Stat correlations
         st.subheader("Stat Correlations")
-        stats_cols = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
         corr_matrix = df[stats_cols].corr()
         
         fig = px.imshow(
@@ -1597,7 +1785,7 @@ def main():
         
         # Average stats by generation
         st.subheader("Average Stats by Generation")
-        gen_stats = df.groupby('generation')[stats_cols].mean().reset_index()
+        gen_stats = df.groupby('generation', observed=True)[stats_cols].mean().reset_index()
         gen_stats_melted = gen_stats.melt(id_vars='generation', var_name='Stat', value_name='Average')
         
         fig = px.line(
@@ -1612,18 +1800,13 @@ def main():
         st.plotly_chart(fig, use_container_width=True, key="stats_gen_trend_line")
     
     # ==================== TAB 5: TYPE ANALYSIS ====================
-    with tab5:
+    elif active_section == NAV_SECTIONS[4]:
         st.header("🎨 Type Analysis & Matchups")
         
         # Type combination analysis
         st.subheader("Type Combinations")
         
-        df['type_combo'] = df.apply(
-            lambda x: f"{x['type_1']}/{x['type_2']}" if pd.notna(x.get('type_2')) and x.get('type_2') else x['type_1'],
-            axis=1
-        )
-        
-        type_combo_counts = df['type_combo'].value_counts().head(20)
+        type_combo_counts = df['type_combo'].value_counts().loc[lambda counts: counts > 0].head(20)
         
         fig = px.bar(
             x=type_combo_counts.index,
@@ -1638,7 +1821,7 @@ def main():
         
         # Average stats by type
         st.subheader("Average Stats by Primary Type")
-        type_stats = df.groupby('type_1')[stats_cols + ['total_points']].mean().round(1)
+        type_stats = df.groupby('type_1', observed=True)[stats_cols + ['total_points']].mean().round(1)
         type_stats = type_stats.sort_values('total_points', ascending=False)
         
         st.dataframe(
@@ -1648,7 +1831,7 @@ def main():
         )
     
     # ==================== TAB 6: EVOLUTION & FORMS ====================
-    with tab6:
+    elif active_section == NAV_SECTIONS[5]:
         st.header("🧬 Evolution & Forms")
         
         # Load main data with all forms
@@ -1765,18 +1948,13 @@ def main():
             st.error("⏳ Data not loaded. Please check the data files.")
     
     # ==================== TAB 7: BY GAME ====================
-    with tab7:
+    elif active_section == NAV_SECTIONS[6]:
         st.header("🎮 Pokémon by Game")
         st.subheader("Filter Pokémon by their game of origin and availability")
         
-        import yaml
-        
         # Load games data
-        games_path = Path("data/games.yaml")
-        if games_path.exists():
-            with open(games_path, 'r', encoding='utf-8') as f:
-                games_data = yaml.safe_load(f)
-            
+        games_data = load_games_yaml()
+        if games_data is not None:
             # Create game selector
             game_list = [(k, v['name']) for k, v in games_data.items()]
             game_names = [g[1] for g in game_list]
@@ -1839,7 +2017,7 @@ def main():
                     
                     # Type distribution in this game
                     st.subheader(f"Type Distribution in {game_info['name']}")
-                    type_counts = game_pokemon['type_1'].value_counts().head(10)
+                    type_counts = game_pokemon['type_1'].value_counts().loc[lambda counts: counts > 0].head(10)
                     
                     fig = px.bar(
                         x=type_counts.index,
@@ -1860,7 +2038,7 @@ def main():
                         placeholder="Search by name or number..."
                     )
                     
-                    display_game_df = game_pokemon.copy()
+                    display_game_df = game_pokemon
                     if game_search:
                         display_game_df = display_game_df[
                             display_game_df['name'].str.contains(game_search, case=False, na=False) |
@@ -1888,7 +2066,7 @@ def main():
             st.error("❌ Games data file not found. Please ensure data/games.yaml exists.")
     
     # ==================== TAB 8: SPRITE GALLERY ====================
-    with tab8:
+    elif active_section == NAV_SECTIONS[7]:
         st.header("🎨 Sprite Gallery")
         st.caption("Browse all Pokemon sprites with filters applied from sidebar")
         
@@ -1963,25 +2141,28 @@ def main():
                                 )
     
     # ==================== TAB 9: TYPE CALCULATOR (NEW v5.0.0) ====================
-    with tab9:
+    elif active_section == NAV_SECTIONS[8]:
         st.header("⚡ Type Effectiveness Calculator")
         st.markdown("Calculate damage multipliers and analyze type matchups")
+        from type_calculator import display_type_calculator
         display_type_calculator()
     
     # ==================== TAB 10: TEAM BUILDER (NEW v5.0.0) ====================
-    with tab10:
+    elif active_section == NAV_SECTIONS[9]:
         st.header("👥 Advanced Team Builder")
         st.markdown("Build and analyze 6-Pokémon teams with coverage analysis")
+        from team_builder import display_team_builder
         display_team_builder(filtered_df)
     
     # ==================== TAB 11: VARIANT STATISTICS (NEW v5.0.0) ====================
-    with tab11:
+    elif active_section == NAV_SECTIONS[10]:
         st.header("📊 Variant Statistics Dashboard")
         st.markdown("Comprehensive analysis of Pokemon variants and special forms")
+        from variant_stats import display_variant_statistics
         display_variant_statistics(filtered_df)
     
     # ==================== TAB 12: LEGACY TEAM BUILDER ====================
-    with tab12:
+    elif active_section == NAV_SECTIONS[11]:
         st.header("🏆 Team Builder")
         st.subheader("Build your competitive team")
         
@@ -2018,15 +2199,18 @@ def main():
             team_cols = st.columns(6)
             for idx, pokemon_name in enumerate(st.session_state.team):
                 with team_cols[idx]:
-                    pokemon = df[df['name'] == pokemon_name].iloc[0]
-                    pokemon_id = int(pokemon['pokedex_number'])
-                    sprite_data = load_sprite(
-                        pokemon_id,
-                        use_animated=use_animations
-                    )
-                    display_sprite(sprite_data, use_container_width=True)
-                    st.markdown(f"**{pokemon_name}**")
-                    st.markdown(f"{pokemon['type_1']}")
+                    pokemon = dex_store.index.row(pokemon_name)
+                    if pokemon is None:
+                        st.warning(f"⚠️ {pokemon_name} was not found in the dex")
+                    else:
+                        pokemon_id = int(pokemon['pokedex_number'])
+                        sprite_data = load_sprite(
+                            pokemon_id,
+                            use_animated=use_animations
+                        )
+                        display_sprite(sprite_data, use_container_width=True)
+                        st.markdown(f"**{pokemon_name}**")
+                        st.markdown(f"{pokemon['type_1']}")
                     
                     if st.button("❌", key=f"remove_{idx}"):
                         st.session_state.team.pop(idx)
@@ -2036,100 +2220,82 @@ def main():
             st.subheader("Team Analysis")
             
             team_pokemon = df[df['name'].isin(st.session_state.team)]
+            if team_pokemon.empty:
+                st.info("None of the team members are in the current dex")
+            else:
+                # Type coverage
+                col1, col2 = st.columns(2)
             
-            # Type coverage
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("**Type Coverage:**")
-                all_team_types = list(team_pokemon['type_1']) + list(team_pokemon['type_2'].dropna())
-                type_coverage = pd.Series(all_team_types).value_counts()
+                with col1:
+                    st.markdown("**Type Coverage:**")
+                    all_team_types = list(team_pokemon['type_1']) + list(team_pokemon['type_2'].dropna())
+                    type_coverage = pd.Series(all_team_types).value_counts()
                 
-                fig = px.bar(
-                    x=type_coverage.index,
-                    y=type_coverage.values,
-                    title='Type Distribution in Team',
-                    labels={'x': 'Type', 'y': 'Count'}
-                )
-                st.plotly_chart(fig, use_container_width=True, key="team_type_dist")
+                    fig = px.bar(
+                        x=type_coverage.index,
+                        y=type_coverage.values,
+                        title='Type Distribution in Team',
+                        labels={'x': 'Type', 'y': 'Count'}
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="team_type_dist")
             
-            with col2:
-                st.markdown("**Average Stats:**")
-                avg_stats = team_pokemon[stats_cols].mean().round(1)
+                with col2:
+                    st.markdown("**Average Stats:**")
+                    avg_stats = team_pokemon[stats_cols].mean().round(1)
                 
-                fig = px.bar(
-                    x=avg_stats.index,
-                    y=avg_stats.values,
-                    title='Team Average Stats',
-                    labels={'x': 'Stat', 'y': 'Average Value'}
-                )
-                st.plotly_chart(fig, use_container_width=True, key="team_avg_stats")
+                    fig = px.bar(
+                        x=avg_stats.index,
+                        y=avg_stats.values,
+                        title='Team Average Stats',
+                        labels={'x': 'Stat', 'y': 'Average Value'}
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="team_avg_stats")
         else:
             st.info("👆 Select Pokémon above to build your team!")
     
     # ==================== TAB 13: META ANALYTICS ====================
-    with tab13:
+    elif active_section == NAV_SECTIONS[12]:
         try:
-            # Import analytics module
-            import sys
-            analytics_path = Path(__file__).parent.parent / "analytics"
-            if str(analytics_path) not in sys.path:
-                sys.path.insert(0, str(analytics_path))
-            
-            from meta_dashboard import MetaAnalyticsDashboard
-            
-            dashboard = MetaAnalyticsDashboard(data_dir="data")
+            dashboard = get_meta_dashboard()
             dashboard.render_dashboard()
         except Exception as e:
             st.error(f"Error loading Meta Analytics: {e}")
             st.info("This feature requires competitive data files.")
     
     # ==================== TAB 14: DAMAGE CALCULATOR ====================
-    with tab14:
+    elif active_section == NAV_SECTIONS[13]:
         try:
-            from damage_calculator import DamageCalculator
-            
-            calculator = DamageCalculator(data_dir="data")
+            calculator = get_damage_calculator()
             calculator.render_calculator()
         except Exception as e:
             st.error(f"Error loading Damage Calculator: {e}")
             st.info("This feature requires moveset database.")
     
     # ==================== TAB 15: TEAM RECOMMENDER ====================
-    with tab15:
+    elif active_section == NAV_SECTIONS[14]:
         try:
-            from team_recommender import TeamRecommender
-            
-            recommender = TeamRecommender(data_dir="data")
+            recommender = get_team_recommender()
             recommender.render_recommender()
         except Exception as e:
             st.error(f"Error loading Team Recommender: {e}")
             st.info("This feature requires competitive data and moveset database.")
     
     # ==================== TAB 16: SPRITE COMPARISON ====================
-    with tab16:
+    elif active_section == NAV_SECTIONS[15]:
         try:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "features"))
-            from sprite_comparison import SpriteComparison
-            
-            comparison = SpriteComparison(data_dir="data")
+            comparison = get_sprite_comparison()
             comparison.render_comparison_tool()
         except Exception as e:
             st.error(f"Error loading Sprite Comparison: {e}")
             st.info("This feature compares Pokemon sprites and stats side-by-side.")
     
     # ==================== TAB 17: ADVANCED EXPORT ====================
-    with tab17:
+    elif active_section == NAV_SECTIONS[16]:
         try:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "features"))
-            from advanced_export import AdvancedExporter
-            
             st.title("📤 Advanced Export System")
             st.markdown("Export Pokemon data in multiple formats with customization options")
             
-            exporter = AdvancedExporter()
+            exporter = get_advanced_exporter()
             
             # Single dataset export
             st.markdown("---")
@@ -2153,10 +2319,8 @@ def main():
             st.info("This feature provides advanced export capabilities.")
     
     # ==================== TAB 18: ADMIN UTILITIES ====================
-    with tab18:
+    elif active_section == NAV_SECTIONS[17]:
         try:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "features"))
             from admin_utilities import render_admin_dashboard
             
             render_admin_dashboard()
@@ -0,0 +1,123 @@
+"""
+Shared Data Catalog
+Loads each dataset once per file version and hands it to the analytics engines
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from dex_snapshot import load_dex_frame
+from dex_schema import prepare_dex, PREPARED_DEX_VERSION
+from dex_index import DexIndex
+from moveset_store import MovesetStore, load_moveset_store
+
+
+class DataCatalog:
+    """
+    Process-wide cache of the Pokemon, competitive and moveset datasets
+
+    Each dataset is parsed on first access and kept until its source file's
+    mtime or size changes. Frames are returned as shallow copy-on-write
+    views (Copy-on-Write is the default from pandas 3.0 and is enabled by the
+    app on pandas 2.x), so callers may filter or add columns without
+    affecting others; the moveset store is shared and must be treated as
+    read-only.
+    """
+
+    def __init__(self, data_dir: str = "data"):
+        """
+        Initialize the catalog
+
+        Args:
+            data_dir: Root data directory
+        """
+        self.data_dir = Path(data_dir)
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _version(path: Path) -> Tuple[int, int]:
+        """File version used to detect changes (mtime, size)"""
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get(self, relative_path: str, loader: Callable[[Path], Any], key: Optional[str] = None) -> Any:
+        """
+        Return the cached dataset for a file, reloading it if the file changed
+
+        Args:
+            relative_path: Source file relative to the data directory
+            loader: Builds the dataset from the source path
+            key: Cache key for datasets derived from the same file (default: the path)
+        """
+        path = self.data_dir / relative_path
+        version = self._version(path)
+        key = key or relative_path
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+
+            value = loader(path)
+            self._entries[key] = (version, value)
+            return value
+
+    @staticmethod
+    def _read_dex(path: Path) -> pd.DataFrame:
+        """Read a dex CSV through its enriched, compactly typed snapshot"""
+        return load_dex_frame(path, transform=prepare_dex, transform_version=PREPARED_DEX_VERSION)
+
+    def pokemon(self) -> pd.DataFrame:
+        """Enriched pokemon.csv"""
+        return self._get("pokemon.csv", self._read_dex).copy(deep=False)
+
+    def pokemon_index(self) -> DexIndex:
+        """Lookup indexes over pokemon.csv"""
+        return self._get(
+            "pokemon.csv",
+            lambda path: DexIndex(self._get("pokemon.csv", self._read_dex)),
+            key="pokemon.csv#index"
+        )
+
+    def tier_data(self) -> pd.DataFrame:
+        """Competitive tier assignments"""
+        return self._get("competitive/tier_data.csv", pd.read_csv).copy(deep=False)
+
+    def usage_stats(self) -> pd.DataFrame:
+        """Monthly competitive usage statistics"""
+        return self._get("competitive/usage_stats.csv", pd.read_csv).copy(deep=False)
+
+    def move_usage(self) -> pd.DataFrame:
+        """Competitive move usage"""
+        return self._get("competitive/move_usage.csv", pd.read_csv).copy(deep=False)
+
+    def ability_usage(self) -> pd.DataFrame:
+        """Competitive ability usage"""
+        return self._get("competitive/ability_usage.csv", pd.read_csv).copy(deep=False)
+
+    def movesets(self) -> MovesetStore:
+        """Compact moveset database, looked up by Pokemon name or id (read-only)"""
+        return self._get("moves/pokemon_movesets.json", load_moveset_store)
+
+    def clear(self):
+        """Drop every cached dataset"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global catalogs, one per data directory
+_catalogs: Dict[str, DataCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_data_catalog(data_dir: str = "data") -> DataCatalog:
+    """Get the shared catalog for a data directory"""
+    key = str(Path(data_dir).resolve())
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = DataCatalog(data_dir)
+        return _catalogs[key]
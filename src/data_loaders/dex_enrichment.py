@@ -0,0 +1,176 @@
+"""
+Dex Enrichment Stage
+Computes derived dex columns once per dataset version with vectorized operations
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add analytics directory to path
+analytics_path = Path(__file__).parent.parent / "analytics"
+if str(analytics_path) not in sys.path:
+    sys.path.insert(0, str(analytics_path))
+
+from type_engine import get_type_engine
+
+
+# Bump when a derived column changes so cached snapshots are re-enriched
+ENRICHMENT_VERSION = 3
+
+STAT_COLUMNS = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+
+# Highest possible base stat, used to scale stats into [0, 1]
+MAX_BASE_STAT = 255
+
+# Display order for variant forms: base first, then mega, then regional forms
+VARIANT_ORDER = {
+    'base': 0, 'mega': 1, 'mega-x': 2, 'mega-y': 3,
+    'alolan': 4, 'galarian': 5, 'hisuian': 6,
+    'paldean': 7, 'gigantamax': 8
+}
+UNKNOWN_VARIANT_ORDER = 99
+
+# Defensive multiplier columns in type engine order (the dataset spells Fighting 'fight')
+AGAINST_COLUMNS = [
+    'against_normal', 'against_fire', 'against_water', 'against_electric',
+    'against_grass', 'against_ice', 'against_fight', 'against_poison',
+    'against_ground', 'against_flying', 'against_psychic', 'against_bug',
+    'against_rock', 'against_ghost', 'against_dragon', 'against_dark',
+    'against_steel', 'against_fairy'
+]
+
+
+def add_type_combo(df: pd.DataFrame) -> pd.DataFrame:
+    """Add 'Type1/Type2' (or 'Type1') as type_combo"""
+    type_1 = df['type_1'].astype(object)
+    if 'type_2' in df.columns:
+        type_2 = df['type_2'].astype(object)
+        has_second = type_2.notna() & (type_2 != '')
+        df['type_combo'] = np.where(has_second, type_1 + '/' + type_2.where(has_second, ''), type_1)
+    else:
+        df['type_combo'] = type_1
+    return df
+
+
+def _combo_ids(df: pd.DataFrame) -> np.ndarray:
+    """Type engine combo id of every row"""
+    type_2 = df['type_2'] if 'type_2' in df.columns else [None] * len(df)
+    return get_type_engine().combo_ids(df['type_1'], type_2)
+
+
+def add_type_combo_id(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the type engine's combo id (row of its defensive profile table) as type_combo_id"""
+    df['type_combo_id'] = _combo_ids(df)
+    return df
+
+
+def add_type_effectiveness(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive all against_<type> columns from the type matrix
+
+    Every row, variants with changed types included, gets its combination's
+    defensive profile in a single gather from the engine's combo table,
+    replacing whatever the source CSV held.
+    """
+    df[AGAINST_COLUMNS] = get_type_engine().combo_profile(_combo_ids(df))
+    return df
+
+
+def add_roles(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add competitive role and stat archetype columns
+
+    role mirrors the team recommender's classification and archetype the
+    similar Pokemon finder's, evaluated in the same priority order.
+    """
+    hp = df['hp']
+    atk = df['attack']
+    defense = df['defense']
+    sp_atk = df['sp_attack']
+    sp_def = df['sp_defense']
+    speed = df['speed']
+
+    df['role'] = np.select(
+        [
+            (atk >= 110) & (speed >= 90),
+            (sp_atk >= 110) & (speed >= 90),
+            (hp >= 90) & (defense >= 90),
+            (hp >= 90) & (sp_def >= 90),
+            (speed >= 80) & ((defense + sp_def) >= 150)
+        ],
+        ['Physical Sweeper', 'Special Sweeper', 'Physical Tank', 'Special Tank', 'Support'],
+        default='Balanced'
+    )
+
+    df['archetype'] = np.select(
+        [
+            (atk > sp_atk) & (atk > defense),
+            (sp_atk > atk) & (sp_atk > sp_def),
+            (defense > atk) & (defense > hp),
+            (sp_def > sp_atk) & (sp_def > hp),
+            hp > 100,
+            speed > 100
+        ],
+        ['physical_attacker', 'special_attacker', 'physical_wall',
+         'special_wall', 'tank', 'speedster'],
+        default='balanced'
+    )
+    return df
+
+
+def add_variant_sort_order(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the display order of each variant form as variant_sort_order"""
+    df['variant_sort_order'] = (
+        df['variant_type'].map(VARIANT_ORDER)
+        .fillna(UNKNOWN_VARIANT_ORDER)
+        .astype('int16')
+    )
+    return df
+
+
+def add_stat_vectors(df: pd.DataFrame) -> pd.DataFrame:
+    """Add base stats scaled to [0, 1] as <stat>_norm columns"""
+    scaled = df[STAT_COLUMNS].to_numpy(dtype='float32') / MAX_BASE_STAT
+    for i, stat in enumerate(STAT_COLUMNS):
+        df[f'{stat}_norm'] = scaled[:, i]
+    return df
+
+
+def add_total_rank(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the base stat total rank (1 = highest) as bst_rank"""
+    df['bst_rank'] = df['total_points'].rank(method='min', ascending=False).astype('int32')
+    return df
+
+
+def enrich_dex(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Run the full enrichment stage on a freshly loaded dex
+
+    Args:
+        df: Dex frame as parsed from CSV
+
+    Returns:
+        The same frame with derived columns added
+    """
+    # Variant support columns for datasets built before variants existed
+    if 'variant_type' not in df.columns:
+        df['variant_type'] = 'base'
+    if 'base_pokemon_id' not in df.columns:
+        df['base_pokemon_id'] = df['pokedex_number']
+
+    add_type_combo(df)
+    add_type_combo_id(df)
+    add_type_effectiveness(df)
+    add_variant_sort_order(df)
+
+    if all(stat in df.columns for stat in STAT_COLUMNS):
+        add_roles(df)
+        add_stat_vectors(df)
+
+    if 'total_points' in df.columns:
+        add_total_rank(df)
+
+    return df
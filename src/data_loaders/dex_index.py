@@ -0,0 +1,81 @@
+"""
+Dex Lookup Indexes
+Hash indexes over a loaded dex frame for O(1) name, number and variant lookups
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+class DexIndex:
+    """
+    Key indexes built once per dataset version
+
+    Maps name to row position, pokedex_number to row positions and
+    base_pokemon_id to the positions of its variant group (base form first).
+    Positions refer to the frame the index was built from.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Build the indexes for a dex frame"""
+        self._frame = df.reset_index(drop=True)
+
+        # First occurrence wins for duplicate names
+        names = self._frame['name'].tolist() if 'name' in self._frame.columns else []
+        self._by_name: Dict[str, int] = {}
+        for position, name in enumerate(names):
+            self._by_name.setdefault(name, position)
+
+        self._by_number = self._group_positions('pokedex_number')
+        self._by_base = self._group_positions('base_pokemon_id', order_by='variant_sort_order')
+
+    def _group_positions(self, column: str, order_by: Optional[str] = None) -> Dict:
+        """Map each value of a column to the row positions holding it"""
+        if column not in self._frame.columns:
+            return {}
+
+        frame = self._frame
+        if order_by is not None and order_by in frame.columns:
+            frame = frame.sort_values(order_by, kind='stable')
+
+        groups = frame.groupby(column, sort=False).indices
+        if frame is self._frame:
+            return groups
+
+        # Positions are relative to the sorted frame; translate them back
+        original = frame.index.to_numpy()
+        return {key: original[positions] for key, positions in groups.items()}
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def position(self, name: str) -> Optional[int]:
+        """Row position of a Pokemon by name, None if unknown"""
+        return self._by_name.get(name)
+
+    def row(self, name: str) -> Optional[pd.Series]:
+        """Row of a Pokemon by name, None if unknown"""
+        position = self._by_name.get(name)
+        if position is None:
+            return None
+        return self._frame.iloc[position]
+
+    def number_positions(self, pokedex_number: int) -> np.ndarray:
+        """Row positions of every entry with a pokedex number"""
+        return self._by_number.get(pokedex_number, _EMPTY)
+
+    def variant_positions(self, base_pokemon_id: int) -> np.ndarray:
+        """Row positions of a variant group, in display order"""
+        return self._by_base.get(base_pokemon_id, _EMPTY)
+
+    def variants(self, base_pokemon_id: int) -> pd.DataFrame:
+        """Rows of a variant group, in display order"""
+        return self._frame.take(self.variant_positions(base_pokemon_id))
@@ -0,0 +1,173 @@
+"""
+Dex Dtype Schema
+Compact column dtypes for the dex, seeded from the national dex data dictionary
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from dex_enrichment import enrich_dex, ENRICHMENT_VERSION
+
+
+# Bump when a column's target dtype changes so cached snapshots are rebuilt
+SCHEMA_VERSION = 2
+
+# Version of the full load pipeline (enrichment + schema), stored in snapshot manifests
+PREPARED_DEX_VERSION = f"{ENRICHMENT_VERSION}.{SCHEMA_VERSION}"
+
+DEFAULT_DICTIONARY_PATH = (
+    Path(__file__).resolve().parent.parent.parent / "data" / "national_dex_dictionary.json"
+)
+
+# Explicit dtypes that win over what the dictionary suggests. Stats and totals
+# share one signed type so sums and differences between them cannot wrap.
+COLUMN_OVERRIDES: Dict[str, Union[str, CategoricalDtype]] = {
+    'pokedex_number': 'int16',
+    'base_pokemon_id': 'int16',
+    'generation': 'int8',
+    'hp': 'int16',
+    'attack': 'int16',
+    'defense': 'int16',
+    'sp_attack': 'int16',
+    'sp_defense': 'int16',
+    'speed': 'int16',
+    'total_points': 'int16',
+    'variant_type': 'category',
+    # Derived by the enrichment stage
+    'type_combo': 'category',
+    'type_combo_id': 'int16',
+    'role': 'category',
+    'archetype': 'category',
+}
+
+# Integer-valued columns that the CSV stores as float only because of gaps
+NULLABLE_INT_COLUMNS = [
+    'catch_rate', 'base_friendship', 'base_experience', 'egg_cycles',
+    'evolution_chain', 'alt_id', 'alt_hp', 'alt_attack', 'alt_defense',
+    'alt_sp_attack', 'alt_sp_defense', 'alt_speed'
+]
+
+
+def _nullable(dtype: str) -> str:
+    """pandas nullable name of a NumPy integer dtype (uint8 -> UInt8)"""
+    if dtype.startswith('uint'):
+        return 'UInt' + dtype[4:]
+    return 'Int' + dtype[3:]
+
+
+def _int_dtype(low: float, high: float, nullable: bool = False) -> str:
+    """Smallest integer dtype holding [low, high]"""
+    for name in ('uint8', 'int16', 'int32'):
+        info = np.iinfo(name)
+        if info.min <= low and high <= info.max:
+            break
+    else:
+        name = 'int64'
+    return _nullable(name) if nullable else name
+
+
+class DexSchema:
+    """Target dtype per dex column, applied after parsing"""
+
+    def __init__(self, dtypes: Dict[str, Union[str, CategoricalDtype]]):
+        """
+        Initialize the schema
+
+        Args:
+            dtypes: Column name to pandas dtype
+        """
+        self.dtypes = dtypes
+
+    @classmethod
+    def from_dictionary(cls, dictionary_path: Optional[Path] = None) -> 'DexSchema':
+        """
+        Derive the schema from the data dictionary's per-column summaries
+
+        Integer columns get the smallest type covering their min/max, float
+        columns become float32 (or nullable ints when integer-valued), and
+        string columns with a small set of unique values become categories.
+        COLUMN_OVERRIDES is applied on top; a missing dictionary leaves only the overrides.
+        """
+        path = Path(dictionary_path) if dictionary_path else DEFAULT_DICTIONARY_PATH
+        columns = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                columns = json.load(f).get('columns', {})
+
+        dtypes = {}
+        for name, info in columns.items():
+            dtype = info.get('dtype')
+            if dtype == 'int64' and 'min' in info and 'max' in info:
+                dtypes[name] = _int_dtype(info['min'], info['max'])
+            elif dtype == 'float64':
+                if name in NULLABLE_INT_COLUMNS and 'min' in info and 'max' in info:
+                    dtypes[name] = _int_dtype(info['min'], info['max'], nullable=True)
+                else:
+                    dtypes[name] = 'float32'
+            elif dtype == 'object' and 'unique_values' in info:
+                dtypes[name] = 'category'
+
+        dtypes.update(COLUMN_OVERRIDES)
+        return cls(dtypes)
+
+    @staticmethod
+    def _cast(series: pd.Series, dtype: Union[str, CategoricalDtype]) -> pd.Series:
+        """Cast one column, keeping it unchanged if the data does not fit"""
+        if isinstance(dtype, CategoricalDtype) and dtype.categories is not None:
+            # Keep values outside the fixed categories instead of turning them into NaN
+            extra = pd.Index(series.dropna().unique()).difference(dtype.categories)
+            if len(extra):
+                dtype = CategoricalDtype(dtype.categories.append(extra).sort_values(),
+                                         ordered=dtype.ordered)
+            return series.astype(dtype)
+
+        if dtype == 'category' or dtype.startswith('float'):
+            return series.astype(dtype)
+
+        # Integer targets: only integral values, and nullable types for gaps
+        values = pd.to_numeric(series, errors='coerce')
+        if values.isna().sum() != series.isna().sum():
+            return series
+        present = values.dropna()
+        if not np.array_equal(present, np.round(present)):
+            return series
+        if len(present):
+            info = np.iinfo(dtype.lower())
+            if present.min() < info.min or present.max() > info.max:
+                return series
+        if values.isna().any() and dtype[0].islower():
+            dtype = _nullable(dtype)
+        return values.astype(dtype)
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast every schema column present in the frame"""
+        for name, dtype in self.dtypes.items():
+            if name in df.columns:
+                df[name] = self._cast(df[name], dtype)
+        return df
+
+
+_dex_schema = None
+
+
+def get_dex_schema() -> DexSchema:
+    """Get the shared dex schema"""
+    global _dex_schema
+    if _dex_schema is None:
+        _dex_schema = DexSchema.from_dictionary()
+    return _dex_schema
+
+
+def apply_dex_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast a dex frame to the shared compact schema"""
+    return get_dex_schema().apply(df)
+
+
+def prepare_dex(df: pd.DataFrame) -> pd.DataFrame:
+    """Full load pipeline for a parsed dex CSV: enrichment, then compact dtypes"""
+    return apply_dex_schema(enrich_dex(df))
@@ -0,0 +1,195 @@
+"""
+National Dex Columnar Snapshot
+Caches the main dex CSV as an Arrow/Feather file guarded by a source manifest
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+# Optional pyarrow import
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    print("Warning: pyarrow not installed. Dex snapshots disabled, falling back to CSV.")
+
+
+# Bump when the on-disk snapshot layout changes so old snapshots are rebuilt
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Hash a file's contents in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DexSnapshot:
+    """Binary snapshot of a dex CSV that is rebuilt only when the CSV changes"""
+
+    def __init__(
+        self,
+        csv_path: str,
+        cache_dir: Optional[str] = None,
+        transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        transform_version: Optional[int] = None
+    ):
+        """
+        Initialize the snapshot for a source CSV
+
+        Args:
+            csv_path: Path to the source CSV
+            cache_dir: Directory for snapshot files (default: <csv dir>/.cache)
+            transform: Optional stage applied to the parsed CSV before it is stored
+            transform_version: Version of the transform; a change forces a rebuild
+        """
+        self.csv_path = Path(csv_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.csv_path.parent / ".cache"
+        self.transform = transform
+        self.transform_version = transform_version
+        self.snapshot_path = self.cache_dir / f"{self.csv_path.stem}.feather"
+        self.manifest_path = self.cache_dir / f"{self.csv_path.stem}.manifest.json"
+
+    def _read_manifest(self) -> Dict:
+        """Read the snapshot manifest, empty if missing or unreadable"""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _write_manifest(self, manifest: Dict):
+        """Atomically write the snapshot manifest"""
+        tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the snapshot matches the current source CSV
+
+        mtime and size are compared first; the content hash is only computed
+        when they differ, so a touched-but-unchanged CSV is not rebuilt.
+        """
+        if not self.snapshot_path.exists():
+            return False
+
+        manifest = self._read_manifest()
+        if manifest.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+            return False
+        if manifest.get('transform_version') != self.transform_version:
+            return False
+
+        stat = self.csv_path.stat()
+        if (manifest.get('source_mtime_ns') == stat.st_mtime_ns and
+                manifest.get('source_size') == stat.st_size):
+            return True
+
+        if manifest.get('source_size') != stat.st_size:
+            return False
+
+        if manifest.get('source_sha256') != file_sha256(self.csv_path):
+            return False
+
+        # Same content, new mtime: refresh the manifest so the hash is skipped next time
+        manifest['source_mtime_ns'] = stat.st_mtime_ns
+        try:
+            self._write_manifest(manifest)
+        except OSError:
+            pass
+        return True
+
+    def _read_source(self) -> pd.DataFrame:
+        """Parse the source CSV and apply the transform stage"""
+        df = pd.read_csv(self.csv_path)
+        if self.transform is not None:
+            df = self.transform(df)
+        return df
+
+    def build(self) -> pd.DataFrame:
+        """Parse the source CSV and write a fresh snapshot"""
+        df = self._read_source()
+
+        if not HAS_PYARROW:
+            return df
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            stat = self.csv_path.stat()
+
+            # Write to a temp file first so concurrent workers never read a partial snapshot
+            tmp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            df.to_feather(tmp_path)
+            os.replace(tmp_path, self.snapshot_path)
+
+            self._write_manifest({
+                'format_version': SNAPSHOT_FORMAT_VERSION,
+                'transform_version': self.transform_version,
+                'source': str(self.csv_path),
+                'source_mtime_ns': stat.st_mtime_ns,
+                'source_size': stat.st_size,
+                'source_sha256': file_sha256(self.csv_path),
+                'rows': len(df),
+                'columns': len(df.columns),
+                'built_at': datetime.now().isoformat()
+            })
+        except Exception as e:
+            print(f"Warning: Could not write dex snapshot: {e}")
+
+        return df
+
+    def load(self) -> pd.DataFrame:
+        """Load the dex from the snapshot, rebuilding it if the CSV changed"""
+        if not HAS_PYARROW:
+            return self._read_source()
+
+        if self.is_fresh():
+            try:
+                return pd.read_feather(self.snapshot_path)
+            except Exception as e:
+                print(f"Warning: Dex snapshot unreadable, rebuilding: {e}")
+
+        return self.build()
+
+
+def load_dex_frame(
+    csv_path: str,
+    cache_dir: Optional[str] = None,
+    transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    transform_version: Optional[int] = None
+) -> pd.DataFrame:
+    """Load a dex CSV through its columnar snapshot"""
+    return DexSnapshot(csv_path, cache_dir, transform, transform_version).load()
+
+
+if __name__ == "__main__":
+    # Build or refresh the prepared snapshot for the main dataset
+    from dex_schema import prepare_dex, PREPARED_DEX_VERSION
+
+    snapshot = DexSnapshot(
+        "data/national_dex_with_variants.csv",
+        transform=prepare_dex,
+        transform_version=PREPARED_DEX_VERSION
+    )
+
+    print("="*60)
+    print("DEX SNAPSHOT")
+    print("="*60)
+
+    fresh = snapshot.is_fresh()
+    df = snapshot.load()
+    print(f"\n✅ Loaded {len(df)} rows x {len(df.columns)} columns")
+    print(f"   Snapshot: {snapshot.snapshot_path} ({'reused' if fresh else 'rebuilt'})")
@@ -0,0 +1,130 @@
+"""
+Shared Dex Store
+Process-wide, read-only holder for the National Dex frame
+"""
+
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dex_index import DexIndex
+
+
+class DexStore:
+    """
+    Immutable dex holder shared by every session
+
+    Sessions read the frame through shallow copies and filter it into
+    integer row positions, so the underlying column data is never duplicated
+    per session or per rerun.
+
+    Isolation relies on Copy-on-Write, the default from pandas 3.0; on
+    pandas 2.x the app entry point enables it before building the store.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Wrap a loaded dex frame"""
+        self._frame = df.reset_index(drop=True)
+        self._columns = {}
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Shallow, copy-on-write view of the shared frame"""
+        return self._frame.copy(deep=False)
+
+    @property
+    def index(self) -> DexIndex:
+        """Name, number and variant group lookups, built on first use"""
+        if self._index is None:
+            self._index = DexIndex(self._frame)
+        return self._index
+
+    def _column(self, name: str) -> Optional[np.ndarray]:
+        """
+        Cached NumPy view of a column, None if the column is missing
+
+        Categorical columns are returned as their integer codes.
+        """
+        if name not in self._frame.columns:
+            return None
+        if name not in self._columns:
+            column = self._frame[name]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                self._columns[name] = column.cat.codes.to_numpy()
+            else:
+                self._columns[name] = column.to_numpy()
+        return self._columns[name]
+
+    def _match(self, name: str, values: Iterable) -> Optional[np.ndarray]:
+        """Mask of rows whose column value is in values, None if the column is missing"""
+        column = self._column(name)
+        if column is None:
+            return None
+        dtype = self._frame[name].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Compare integer codes instead of decoded values
+            codes = dtype.categories.get_indexer(list(values))
+            return np.isin(column, codes[codes >= 0])
+        return np.isin(column, list(values))
+
+    def select(
+        self,
+        variant_types: Optional[Iterable[str]] = None,
+        generation: Optional[int] = None,
+        primary_types: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+        bst_range: Optional[Tuple[int, int]] = None
+    ) -> np.ndarray:
+        """
+        Apply the sidebar filters and return matching row positions
+
+        Args:
+            variant_types: Allowed variant_type values
+            generation: Generation number to keep
+            primary_types: Allowed type_1 values
+            status: Status value to keep (e.g. 'Legendary')
+            bst_range: Inclusive (min, max) total_points range
+
+        Returns:
+            Sorted array of row positions into the shared frame
+        """
+        mask = np.ones(len(self._frame), dtype=bool)
+
+        if variant_types:
+            matches = self._match('variant_type', variant_types)
+            if matches is not None:
+                mask &= matches
+
+        if generation is not None:
+            matches = self._match('generation', [generation])
+            if matches is not None:
+                mask &= matches
+
+        if primary_types:
+            matches = self._match('type_1', primary_types)
+            if matches is not None:
+                mask &= matches
+
+        if status is not None:
+            matches = self._match('status', [status])
+            if matches is not None:
+                mask &= matches
+
+        if bst_range is not None:
+            column = self._column('total_points')
+            if column is not None:
+                low, high = bst_range
+                mask &= (column >= low) & (column <= high)
+
+        return np.flatnonzero(mask)
+
+    def take(self, positions: np.ndarray) -> pd.DataFrame:
+        """Materialize the rows at the given positions"""
+        if len(positions) == len(self._frame):
+            return self.frame
+        return self._frame.take(positions)
@@ -0,0 +1,267 @@
+"""
+Compact Moveset Store
+Interned move table with per-Pokemon integer move arrays, compiled from the movesets JSON
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+
+# Bump when the compiled .npz layout changes so old stores are rebuilt
+MOVESET_STORE_VERSION = 1
+
+# Stored in place of a missing power/accuracy (e.g. moves that never miss)
+MISSING_VALUE = -1
+
+MOVE_FIELDS = ('name', 'type', 'category', 'power', 'accuracy')
+
+
+class MovesetStore:
+    """
+    Read-only moveset database
+
+    Every distinct move is stored once in a move table. Each Pokemon's moveset
+    is a slice of two flat arrays (move ids and learn method ids) addressed
+    through an offsets array, and is only decoded into dicts when requested.
+    Pokemon can be looked up by name or by pokedex id.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Wrap compiled arrays (see from_json / load)
+
+        Args:
+            arrays: move_* table columns, learn_methods, pokemon_* columns,
+                offsets, move_ids and method_ids
+        """
+        self.arrays = arrays
+        self.offsets = arrays['offsets']
+        self.flat_move_ids = arrays['move_ids']
+        self.flat_method_ids = arrays['method_ids']
+
+        self.learn_methods = arrays['learn_methods'].tolist()
+        self.pokemon_names = arrays['pokemon_names'].tolist()
+        pokemon_ids = arrays['pokemon_ids'].tolist()
+
+        self._row_by_name = {name: row for row, name in enumerate(self.pokemon_names)}
+        self._row_by_id = {pokemon_id: row for row, pokemon_id in enumerate(pokemon_ids)}
+        self._move_by_name = {name: i for i, name in enumerate(arrays['move_name'].tolist())}
+        self._decoded_moves: Optional[List[Dict]] = None
+        self._decoded: Dict[int, List[Dict]] = {}
+
+    # ---------- construction ----------
+
+    @classmethod
+    def from_json(cls, movesets: Dict[str, Dict]) -> 'MovesetStore':
+        """
+        Convert the parsed pokemon_movesets.json structure
+
+        Args:
+            movesets: Dict keyed by pokedex id string, each value holding
+                pokemon_id, name, types and a moveset list of move dicts
+        """
+        move_index: Dict[tuple, int] = {}
+        moves: List[tuple] = []
+        method_index: Dict[str, int] = {}
+
+        pokemon_ids, pokemon_names, pokemon_types = [], [], []
+        offsets = [0]
+        move_ids, method_ids = [], []
+
+        for key, entry in movesets.items():
+            pokemon_ids.append(int(entry.get('pokemon_id', key)))
+            pokemon_names.append(entry.get('name', str(key)))
+            pokemon_types.append('/'.join(entry.get('types', [])))
+
+            for move in entry.get('moveset', []):
+                move_key = tuple(move.get(field) for field in MOVE_FIELDS)
+                if move_key not in move_index:
+                    move_index[move_key] = len(moves)
+                    moves.append(move_key)
+                method = move.get('learn_method', '')
+                if method not in method_index:
+                    method_index[method] = len(method_index)
+
+                move_ids.append(move_index[move_key])
+                method_ids.append(method_index[method])
+
+            offsets.append(len(move_ids))
+
+        def numeric(values):
+            return np.array(
+                [MISSING_VALUE if v is None else v for v in values], dtype=np.int16
+            )
+
+        columns = list(zip(*moves)) if moves else [()] * len(MOVE_FIELDS)
+        arrays = {
+            'move_name': np.array(columns[0], dtype=str),
+            'move_type': np.array(columns[1], dtype=str),
+            'move_category': np.array(columns[2], dtype=str),
+            'move_power': numeric(columns[3]),
+            'move_accuracy': numeric(columns[4]),
+            'learn_methods': np.array(list(method_index), dtype=str),
+            'pokemon_ids': np.array(pokemon_ids, dtype=np.int32),
+            'pokemon_names': np.array(pokemon_names, dtype=str),
+            'pokemon_types': np.array(pokemon_types, dtype=str),
+            'offsets': np.array(offsets, dtype=np.int32),
+            'move_ids': np.array(move_ids, dtype=np.int16),
+            'method_ids': np.array(method_ids, dtype=np.uint8),
+        }
+        return cls(arrays)
+
+    def save(self, path: Path):
+        """Atomically write the store as an .npz file"""
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp_path, **self.arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'MovesetStore':
+        """Read a store written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls({name: data[name] for name in data.files})
+
+    # ---------- lookups ----------
+
+    def __len__(self) -> int:
+        return len(self.pokemon_names)
+
+    def _row(self, pokemon: Union[str, int]) -> Optional[int]:
+        """Row of a Pokemon given its name, id or id string"""
+        if isinstance(pokemon, str):
+            row = self._row_by_name.get(pokemon)
+            if row is not None or not pokemon.isdigit():
+                return row
+            pokemon = int(pokemon)
+        return self._row_by_id.get(int(pokemon))
+
+    def __contains__(self, pokemon: Union[str, int]) -> bool:
+        return self._row(pokemon) is not None
+
+    @property
+    def moves(self) -> List[Dict]:
+        """The interned move table, decoded once"""
+        if self._decoded_moves is None:
+            a = self.arrays
+            self._decoded_moves = [
+                {
+                    'name': str(name),
+                    'type': str(move_type),
+                    'category': str(category),
+                    'power': None if power == MISSING_VALUE else int(power),
+                    'accuracy': None if accuracy == MISSING_VALUE else int(accuracy),
+                }
+                for name, move_type, category, power, accuracy in zip(
+                    a['move_name'], a['move_type'], a['move_category'],
+                    a['move_power'], a['move_accuracy']
+                )
+            ]
+        return self._decoded_moves
+
+    def move_ids(self, pokemon: Union[str, int]) -> np.ndarray:
+        """Move table ids in a Pokemon's moveset (empty if unknown)"""
+        row = self._row(pokemon)
+        if row is None:
+            return self.flat_move_ids[:0]
+        return self.flat_move_ids[self.offsets[row]:self.offsets[row + 1]]
+
+    def _decode(self, row: int) -> List[Dict]:
+        """Decode one row's moveset, memoized"""
+        if row not in self._decoded:
+            start, end = self.offsets[row], self.offsets[row + 1]
+            moves = self.moves
+            self._decoded[row] = [
+                {**moves[move_id], 'learn_method': self.learn_methods[method_id]}
+                for move_id, method_id in zip(
+                    self.flat_move_ids[start:end].tolist(),
+                    self.flat_method_ids[start:end].tolist()
+                )
+            ]
+        # Copies, so callers cannot alter the shared decoded moves
+        return [dict(move) for move in self._decoded[row]]
+
+    def moveset(self, pokemon: Union[str, int]) -> List[Dict]:
+        """Decoded moveset of a Pokemon, as in the source JSON (empty if unknown)"""
+        row = self._row(pokemon)
+        if row is None:
+            return []
+        return self._decode(row)
+
+    def entry(self, pokemon: Union[str, int]) -> Optional[Dict]:
+        """Full record of a Pokemon in the source JSON shape"""
+        row = self._row(pokemon)
+        if row is None:
+            return None
+        types = str(self.arrays['pokemon_types'][row])
+        return {
+            'pokemon_id': int(self.arrays['pokemon_ids'][row]),
+            'name': self.pokemon_names[row],
+            'types': types.split('/') if types else [],
+            'moveset': self._decode(row),
+        }
+
+    def learners(self, move_name: str) -> List[str]:
+        """Names of every Pokemon that learns a move"""
+        move_id = self._move_by_name.get(move_name)
+        if move_id is None:
+            return []
+        positions = np.flatnonzero(self.flat_move_ids == move_id)
+        rows = np.unique(np.searchsorted(self.offsets, positions, side='right') - 1)
+        return [self.pokemon_names[row] for row in rows]
+
+
+def load_moveset_store(json_path: Path, cache_dir: Optional[Path] = None) -> MovesetStore:
+    """
+    Load the moveset store, compiling it from JSON only when the JSON changes
+
+    Args:
+        json_path: Source pokemon_movesets.json
+        cache_dir: Directory for compiled stores (default: <json dir>/.cache)
+    """
+    json_path = Path(json_path)
+    cache_dir = Path(cache_dir) if cache_dir else json_path.parent / ".cache"
+
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    source_hash = hashlib.sha256(raw).hexdigest()[:16]
+    store_path = cache_dir / f"{json_path.stem}.{source_hash}.v{MOVESET_STORE_VERSION}.npz"
+    # Exactly <stem>.<hash>.v<version>.npz: never another source's store or an in-flight .tmp.npz
+    store_pattern = re.compile(rf"{re.escape(json_path.stem)}\.[0-9a-f]{{16}}\.v\d+\.npz")
+
+    if store_path.exists():
+        try:
+            return MovesetStore.load(store_path)
+        except Exception as e:
+            print(f"Warning: Moveset store unreadable, rebuilding: {e}")
+
+    store = MovesetStore.from_json(json.loads(raw))
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Drop stores compiled from older versions of the JSON
+        for stale in cache_dir.glob(f"{json_path.stem}.*.npz"):
+            if store_pattern.fullmatch(stale.name):
+                stale.unlink(missing_ok=True)
+        store.save(store_path)
+    except Exception as e:
+        print(f"Warning: Could not write moveset store: {e}")
+
+    return store
+
+
+if __name__ == "__main__":
+    # Compile the moveset JSON and report the result
+    store = load_moveset_store(Path("data/moves/pokemon_movesets.json"))
+
+    print("="*60)
+    print("MOVESET STORE")
+    print("="*60)
+    print(f"\n✅ {len(store)} Pokemon, {len(store.moves)} distinct moves, "
+          f"{len(store.flat_move_ids)} moveset entries")
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, Any, List
 import json
 
+from dex_enrichment import add_type_effectiveness
+
 
 class NationalDexBuilder:
     """Builds a comprehensive National Pokedex from multiple data sources."""
@@ -151,6 +153,9 @@ class NationalDexBuilder:
             labels=['Very Low', 'Low', 'Average', 'High', 'Legendary']
         )
         
+        # Defensive multipliers for every row, derived from the type matrix
+        df = add_type_effectiveness(df)
+        
         # Type effectiveness summary
         type_effectiveness_cols = [col for col in df.columns if col.startswith('against_')]
         if type_effectiveness_cols:
@@ -6,10 +6,71 @@ Loads and merges data from CSV files and YAML structured data
 import pandas as pd
 import yaml
 import os
+import re
 import sys
+import hashlib
+import pickle
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+# libyaml's C loader is several times faster; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+    HAS_LIBYAML = False
+
+
+# Bump when the pickled cache layout changes so old caches are ignored
+YAML_CACHE_VERSION = 1
+
+
+def load_yaml_cached(filepath: Path, cache_dir: Optional[Path] = None) -> Any:
+    """
+    Load a YAML file through a pickle cache keyed by the file's content hash
+
+    Args:
+        filepath: YAML file to load
+        cache_dir: Directory for compiled caches (default: <yaml dir>/.cache)
+
+    Returns:
+        The parsed YAML document
+    """
+    filepath = Path(filepath)
+    cache_dir = Path(cache_dir) if cache_dir else filepath.parent / ".cache"
+
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    source_hash = hashlib.sha256(raw).hexdigest()[:16]
+    cache_path = cache_dir / f"{filepath.stem}.{source_hash}.v{YAML_CACHE_VERSION}.pickle"
+    # Exactly <stem>.<hash>.v<version>.pickle, so games.yaml never matches games.extra.yaml's caches
+    cache_pattern = re.compile(rf"{re.escape(filepath.stem)}\.[0-9a-f]{{16}}\.v\d+\.pickle")
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Warning: YAML cache unreadable, re-parsing {filepath.name}: {e}")
+
+    data = yaml.load(raw, Loader=YamlSafeLoader)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Drop caches for older versions of this file
+        for stale in cache_dir.glob(f"{filepath.stem}.*.pickle"):
+            if cache_pattern.fullmatch(stale.name):
+                stale.unlink(missing_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Could not write YAML cache for {filepath.name}: {e}")
+
+    return data
+
 
 class PokemonDataLoader:
     """Centralized data loader for all Pokemon data sources."""
@@ -21,10 +82,13 @@ class PokemonDataLoader:
         
     def load_yaml_file(self, filename: str) -> Dict[str, Any]:
         """Load a YAML file from pokemondbgit folder."""
+        if filename in self.cache:
+            return self.cache[filename]
+        
         filepath = self.yaml_path / filename
         if filepath.exists():
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            self.cache[filename] = load_yaml_cached(filepath)
+            return self.cache[filename]
         return {}
     
     def load_all_yaml_data(self) -> Dict[str, Any]:
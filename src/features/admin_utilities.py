@@ -4,6 +4,7 @@ Provides access to error logs, backups, validation, and performance monitoring
 """
 
 import streamlit as st
+import pandas as pd
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -367,6 +368,24 @@ def render_performance():
         with col3:
             st.metric("Threads", sys_info['num_threads'])
         
+        # Cache hit rates
+        cache_stats = profiler.get_cache_stats()
+        if cache_stats:
+            st.markdown("---")
+            st.subheader("Caches")
+            
+            cache_df = pd.DataFrame([
+                {
+                    'Cache': name,
+                    'Hits': info.get('hits', 0),
+                    'Misses': info.get('misses', 0),
+                    'Hit Rate': f"{info['hit_rate']:.1%}",
+                    'Size': f"{info.get('size', 0)} / {info.get('maxsize', '')}"
+                }
+                for name, info in cache_stats.items()
+            ])
+            st.dataframe(cache_df, use_container_width=True, hide_index=True)
+        
         # Performance summary
         st.markdown("---")
         st.subheader("Performance Summary")
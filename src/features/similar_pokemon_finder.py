@@ -25,8 +25,8 @@ def calculate_stat_similarity(pokemon1: pd.Series, pokemon2: pd.Series) -> float
     stat_cols = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
     
     # Get stats for both Pokemon
-    stats1 = [pokemon1[col] for col in stat_cols if col in pokemon1.index]
-    stats2 = [pokemon2[col] for col in stat_cols if col in pokemon2.index]
+    stats1 = [float(pokemon1[col]) for col in stat_cols if col in pokemon1.index]
+    stats2 = [float(pokemon2[col]) for col in stat_cols if col in pokemon2.index]
     
     if len(stats1) != 6 or len(stats2) != 6:
         return 0.0
@@ -108,8 +108,13 @@ def calculate_role_similarity(pokemon1: pd.Series, pokemon2: pd.Series) -> float
         else:
             return "balanced"
     
-    role1 = get_role(pokemon1)
-    role2 = get_role(pokemon2)
+    # Prefer the archetype precomputed by the enrichment stage
+    if 'archetype' in pokemon1.index and 'archetype' in pokemon2.index:
+        role1 = pokemon1['archetype']
+        role2 = pokemon2['archetype']
+    else:
+        role1 = get_role(pokemon1)
+        role2 = get_role(pokemon2)
     
     return 100.0 if role1 == role2 else 50.0
 
@@ -5,26 +5,38 @@ Provides side-by-side comparison of Pokemon sprites and stats
 
 import streamlit as st
 import pandas as pd
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import plotly.graph_objects as go
 
+# Add data loaders directory to path
+data_loaders_path = Path(__file__).parent.parent / "data_loaders"
+if str(data_loaders_path) not in sys.path:
+    sys.path.insert(0, str(data_loaders_path))
+
+from data_catalog import DataCatalog, get_data_catalog
+
 
 class SpriteComparison:
     """Tool for comparing Pokemon sprites and stats side-by-side"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", catalog: Optional[DataCatalog] = None):
         """Initialize the sprite comparison tool"""
         self.data_dir = Path(data_dir)
+        self.catalog = catalog or get_data_catalog(data_dir)
         self.pokemon_data = None
         self.sprite_base_path = Path("assets/sprites")
         
     def load_data(self) -> bool:
-        """Load Pokemon data"""
+        """Load Pokemon data (once per instance)"""
+        if self.pokemon_data is not None:
+            return True
         try:
             csv_path = self.data_dir / "pokemon.csv"
             if csv_path.exists():
-                self.pokemon_data = pd.read_csv(csv_path)
+                self.pokemon_data = self.catalog.pokemon()
+                self.pokemon_index = self.catalog.pokemon_index()
                 return True
             else:
                 st.error(f"Pokemon data not found at {csv_path}")
@@ -271,9 +283,7 @@ class SpriteComparison:
             display_cols = st.columns(num_pokemon)
             
             for idx, name in enumerate(selected_pokemon):
-                pokemon_row = self.pokemon_data[
-                    self.pokemon_data['name'] == name
-                ].iloc[0]
+                pokemon_row = self.pokemon_index.row(name)
                 pokemon_list.append(pokemon_row)
                 
                 with display_cols[idx]:
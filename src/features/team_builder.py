@@ -5,9 +5,17 @@ Build Pokemon teams with type coverage analysis and stat tracking
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from typing import List, Dict
-from type_calculator import get_pokemon_weaknesses, get_offensive_coverage
+from type_calculator import get_offensive_coverage
+from type_engine import get_type_engine
+from team_coverage import CoverageState, rank_candidates, DEFENSIVE_WEIGHT, OFFENSIVE_WEIGHT
+
+
+def _count_by_type(types: List[str], mask: np.ndarray) -> Dict[str, int]:
+    """Non-zero column counts of a (members x types) mask, keyed by type"""
+    return {t: int(count) for t, count in zip(types, mask.sum(axis=0)) if count}
 
 
 class PokemonTeam:
@@ -58,11 +66,6 @@ class PokemonTeam:
         offensive_hits = set()
         offensive_weak = set()
         
-        # Defensive weaknesses (what types the team is weak to)
-        defensive_weak = {}  # type -> count
-        defensive_resist = {}  # type -> count
-        defensive_immune = {}  # type -> count
-        
         for pokemon in self.team:
             types = [pokemon['type_1']]
             if pd.notna(pokemon.get('type_2')):
@@ -72,15 +75,15 @@ class PokemonTeam:
             coverage = get_offensive_coverage(types)
             offensive_hits.update(coverage['super_effective'])
             offensive_weak.update(coverage['not_effective'] + coverage['no_effect'])
-            
-            # Defensive coverage
-            weaknesses = get_pokemon_weaknesses(types)
-            for wtype in weaknesses['weak'] + weaknesses['very_weak']:
-                defensive_weak[wtype] = defensive_weak.get(wtype, 0) + 1
-            for rtype in weaknesses['resistant'] + weaknesses['very_resistant']:
-                defensive_resist[rtype] = defensive_resist.get(rtype, 0) + 1
-            for itype in weaknesses['immune']:
-                defensive_immune[itype] = defensive_immune.get(itype, 0) + 1
+        
+        # Defensive coverage: one precomputed profile row per team member
+        engine = get_type_engine()
+        profiles = engine.combo_profile(self.combo_ids())
+        
+        # Per attacking type: how many members are weak to / resist / are immune to it
+        defensive_weak = _count_by_type(engine.types, profiles >= 2)
+        defensive_resist = _count_by_type(engine.types, (profiles > 0) & (profiles < 1))
+        defensive_immune = _count_by_type(engine.types, profiles == 0)
         
         return {
             'offensive_coverage': list(offensive_hits),
@@ -93,6 +96,28 @@ class PokemonTeam:
             'total_resistances': sum(defensive_resist.values())
         }
     
+    def combo_ids(self) -> np.ndarray:
+        """Type combination id of each team member"""
+        engine = get_type_engine()
+        return np.array([
+            pokemon['type_combo_id'] if 'type_combo_id' in pokemon
+            else engine.combo_id([pokemon['type_1'], pokemon.get('type_2')])
+            for pokemon in self.team
+        ], dtype=np.int16)
+    
+    def coverage_state(self) -> CoverageState:
+        """Incremental coverage state of the current team"""
+        return CoverageState.from_combo_ids(self.combo_ids())
+    
+    def suggest_pokemon(self, candidates: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+        """Candidates ranked by how much they would improve the team's coverage"""
+        return rank_candidates(
+            candidates,
+            self.coverage_state(),
+            top_n=top_n,
+            exclude_numbers=[p['pokedex_number'] for p in self.team]
+        )
+    
     def get_team_stats(self) -> Dict:
         """Calculate average team stats"""
         if not self.team:
@@ -156,7 +181,7 @@ def display_team_builder(df: pd.DataFrame):
         )
     
     # Filter Pokemon
-    filtered_df = df.copy()
+    filtered_df = df
     if search_query:
         filtered_df = filtered_df[
             filtered_df['name'].str.contains(search_query, case=False, na=False) |
@@ -282,6 +307,49 @@ def display_team_builder(df: pd.DataFrame):
     st.markdown("---")
     st.markdown("#### 🔥 Coverage Heatmap")
     display_coverage_heatmap(team)
+    
+    # Suggested additions
+    if not team.is_full():
+        st.markdown("---")
+        st.markdown("#### 💡 Suggested Additions")
+        display_suggestions(df, team)
+
+
+def display_suggestions(df: pd.DataFrame, team: PokemonTeam, top_n: int = 10):
+    """Display the candidates that would improve the team's coverage the most"""
+    suggestions = team.suggest_pokemon(df, top_n=top_n)
+    if suggestions.empty:
+        st.info("No candidates available")
+        return
+    
+    st.caption(
+        f"Ranked by coverage score ({DEFENSIVE_WEIGHT:g} × weaknesses covered + "
+        f"{OFFENSIVE_WEIGHT:g} × new types hit super effectively), then BST"
+    )
+    display_df = pd.DataFrame({
+        'Pokemon': suggestions['name'],
+        'Type': suggestions['type_1'].astype(str) + suggestions['type_2'].astype(object).map(
+            lambda t: f"/{t}" if pd.notna(t) and t not in ('', '-') else ''
+        ),
+        'Weaknesses Covered': suggestions['defensive_delta'],
+        'New Types Hit': suggestions['offensive_delta'],
+        'BST': suggestions['total_points']
+    })
+    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    
+    add_col, button_col = st.columns([3, 1])
+    with add_col:
+        choice = st.selectbox(
+            "Add a suggestion",
+            options=suggestions.index,
+            format_func=lambda x: suggestions.loc[x, 'name'],
+            label_visibility="collapsed",
+            key="suggestion_choice"
+        )
+    with button_col:
+        if st.button("➕ Add Suggestion", use_container_width=True):
+            if team.add_pokemon(suggestions.loc[choice, df.columns].to_dict()):
+                st.rerun()
 
 
 def display_team_pokemon_card(pokemon: dict, index: int, team: PokemonTeam):
@@ -5,155 +5,17 @@ Calculate type matchups, weaknesses, resistances, and immunities
 
 import streamlit as st
 import pandas as pd
+import sys
+from pathlib import Path
 from typing import List, Dict, Tuple
 
-# Complete type effectiveness chart
-TYPE_CHART = {
-    'Normal': {
-        'weak_to': ['Fighting'],
-        'resistant_to': [],
-        'immune_to': ['Ghost'],
-        'super_effective': [],
-        'not_effective': ['Rock', 'Steel'],
-        'no_effect': ['Ghost']
-    },
-    'Fire': {
-        'weak_to': ['Water', 'Ground', 'Rock'],
-        'resistant_to': ['Fire', 'Grass', 'Ice', 'Bug', 'Steel', 'Fairy'],
-        'immune_to': [],
-        'super_effective': ['Grass', 'Ice', 'Bug', 'Steel'],
-        'not_effective': ['Fire', 'Water', 'Rock', 'Dragon'],
-        'no_effect': []
-    },
-    'Water': {
-        'weak_to': ['Electric', 'Grass'],
-        'resistant_to': ['Fire', 'Water', 'Ice', 'Steel'],
-        'immune_to': [],
-        'super_effective': ['Fire', 'Ground', 'Rock'],
-        'not_effective': ['Water', 'Grass', 'Dragon'],
-        'no_effect': []
-    },
-    'Electric': {
-        'weak_to': ['Ground'],
-        'resistant_to': ['Electric', 'Flying', 'Steel'],
-        'immune_to': [],
-        'super_effective': ['Water', 'Flying'],
-        'not_effective': ['Electric', 'Grass', 'Dragon'],
-        'no_effect': ['Ground']
-    },
-    'Grass': {
-        'weak_to': ['Fire', 'Ice', 'Poison', 'Flying', 'Bug'],
-        'resistant_to': ['Water', 'Electric', 'Grass', 'Ground'],
-        'immune_to': [],
-        'super_effective': ['Water', 'Ground', 'Rock'],
-        'not_effective': ['Fire', 'Grass', 'Poison', 'Flying', 'Bug', 'Dragon', 'Steel'],
-        'no_effect': []
-    },
-    'Ice': {
-        'weak_to': ['Fire', 'Fighting', 'Rock', 'Steel'],
-        'resistant_to': ['Ice'],
-        'immune_to': [],
-        'super_effective': ['Grass', 'Ground', 'Flying', 'Dragon'],
-        'not_effective': ['Fire', 'Water', 'Ice', 'Steel'],
-        'no_effect': []
-    },
-    'Fighting': {
-        'weak_to': ['Flying', 'Psychic', 'Fairy'],
-        'resistant_to': ['Bug', 'Rock', 'Dark'],
-        'immune_to': [],
-        'super_effective': ['Normal', 'Ice', 'Rock', 'Dark', 'Steel'],
-        'not_effective': ['Poison', 'Flying', 'Psychic', 'Bug', 'Fairy'],
-        'no_effect': ['Ghost']
-    },
-    'Poison': {
-        'weak_to': ['Ground', 'Psychic'],
-        'resistant_to': ['Grass', 'Fighting', 'Poison', 'Bug', 'Fairy'],
-        'immune_to': [],
-        'super_effective': ['Grass', 'Fairy'],
-        'not_effective': ['Poison', 'Ground', 'Rock', 'Ghost'],
-        'no_effect': ['Steel']
-    },
-    'Ground': {
-        'weak_to': ['Water', 'Grass', 'Ice'],
-        'resistant_to': ['Poison', 'Rock'],
-        'immune_to': ['Electric'],
-        'super_effective': ['Fire', 'Electric', 'Poison', 'Rock', 'Steel'],
-        'not_effective': ['Grass', 'Bug'],
-        'no_effect': ['Flying']
-    },
-    'Flying': {
-        'weak_to': ['Electric', 'Ice', 'Rock'],
-        'resistant_to': ['Grass', 'Fighting', 'Bug'],
-        'immune_to': ['Ground'],
-        'super_effective': ['Grass', 'Fighting', 'Bug'],
-        'not_effective': ['Electric', 'Rock', 'Steel'],
-        'no_effect': []
-    },
-    'Psychic': {
-        'weak_to': ['Bug', 'Ghost', 'Dark'],
-        'resistant_to': ['Fighting', 'Psychic'],
-        'immune_to': [],
-        'super_effective': ['Fighting', 'Poison'],
-        'not_effective': ['Psychic', 'Steel'],
-        'no_effect': ['Dark']
-    },
-    'Bug': {
-        'weak_to': ['Fire', 'Flying', 'Rock'],
-        'resistant_to': ['Grass', 'Fighting', 'Ground'],
-        'immune_to': [],
-        'super_effective': ['Grass', 'Psychic', 'Dark'],
-        'not_effective': ['Fire', 'Fighting', 'Poison', 'Flying', 'Ghost', 'Steel', 'Fairy'],
-        'no_effect': []
-    },
-    'Rock': {
-        'weak_to': ['Water', 'Grass', 'Fighting', 'Ground', 'Steel'],
-        'resistant_to': ['Normal', 'Fire', 'Poison', 'Flying'],
-        'immune_to': [],
-        'super_effective': ['Fire', 'Ice', 'Flying', 'Bug'],
-        'not_effective': ['Fighting', 'Ground', 'Steel'],
-        'no_effect': []
-    },
-    'Ghost': {
-        'weak_to': ['Ghost', 'Dark'],
-        'resistant_to': ['Poison', 'Bug'],
-        'immune_to': ['Normal', 'Fighting'],
-        'super_effective': ['Psychic', 'Ghost'],
-        'not_effective': ['Dark'],
-        'no_effect': ['Normal']
-    },
-    'Dragon': {
-        'weak_to': ['Ice', 'Dragon', 'Fairy'],
-        'resistant_to': ['Fire', 'Water', 'Electric', 'Grass'],
-        'immune_to': [],
-        'super_effective': ['Dragon'],
-        'not_effective': ['Steel'],
-        'no_effect': ['Fairy']
-    },
-    'Dark': {
-        'weak_to': ['Fighting', 'Bug', 'Fairy'],
-        'resistant_to': ['Ghost', 'Dark'],
-        'immune_to': ['Psychic'],
-        'super_effective': ['Psychic', 'Ghost'],
-        'not_effective': ['Fighting', 'Dark', 'Fairy'],
-        'no_effect': []
-    },
-    'Steel': {
-        'weak_to': ['Fire', 'Fighting', 'Ground'],
-        'resistant_to': ['Normal', 'Grass', 'Ice', 'Flying', 'Psychic', 'Bug', 'Rock', 'Dragon', 'Steel', 'Fairy'],
-        'immune_to': ['Poison'],
-        'super_effective': ['Ice', 'Rock', 'Fairy'],
-        'not_effective': ['Fire', 'Water', 'Electric', 'Steel'],
-        'no_effect': []
-    },
-    'Fairy': {
-        'weak_to': ['Poison', 'Steel'],
-        'resistant_to': ['Fighting', 'Bug', 'Dark'],
-        'immune_to': ['Dragon'],
-        'super_effective': ['Fighting', 'Dragon', 'Dark'],
-        'not_effective': ['Fire', 'Poison', 'Steel'],
-        'no_effect': []
-    }
-}
+# Add analytics directory to path
+analytics_path = Path(__file__).parent.parent / "analytics"
+if str(analytics_path) not in sys.path:
+    sys.path.insert(0, str(analytics_path))
+
+from type_engine import get_type_engine, NO_TYPE
+from coverage_solver import get_coverage_solver
 
 
 def calculate_type_effectiveness(attacking_type: str, defending_types: List[str]) -> float:
@@ -167,21 +29,26 @@ def calculate_type_effectiveness(attacking_type: str, defending_types: List[str]
     Returns:
         float: Damage multiplier (0.0, 0.25, 0.5, 1.0, 2.0, or 4.0)
     """
-    if attacking_type not in TYPE_CHART:
-        return 1.0
-    
-    multiplier = 1.0
-    attack_data = TYPE_CHART[attacking_type]
+    return get_type_engine().effectiveness(attacking_type, defending_types)
+
+
+def get_attack_matchups(attacking_type: str) -> Dict[str, List[str]]:
+    """
+    Defending types an attacking type hits at each non-neutral multiplier
     
-    for def_type in defending_types:
-        if def_type in attack_data['no_effect']:
-            multiplier *= 0.0
-        elif def_type in attack_data['super_effective']:
-            multiplier *= 2.0
-        elif def_type in attack_data['not_effective']:
-            multiplier *= 0.5
+    Args:
+        attacking_type: The type of the attacking move
     
-    return multiplier
+    Returns:
+        dict: super_effective, not_effective and no_effect type lists
+    """
+    engine = get_type_engine()
+    row = engine.offensive_profile([attacking_type])[0]
+    return {
+        'super_effective': engine.names(row == 2.0),
+        'not_effective': engine.names(row == 0.5),
+        'no_effect': engine.names(row == 0.0)
+    }
 
 
 def get_pokemon_weaknesses(types: List[str]) -> Dict[str, List[str]]:
@@ -194,36 +61,19 @@ def get_pokemon_weaknesses(types: List[str]) -> Dict[str, List[str]]:
     Returns:
         dict: Dictionary with multipliers and lists of types
     """
-    # Calculate multipliers for all types
-    multipliers = {}
-    for attack_type in TYPE_CHART.keys():
-        multipliers[attack_type] = calculate_type_effectiveness(attack_type, types)
+    # Precomputed multipliers of all attacking types for this type combination
+    engine = get_type_engine()
+    profile = engine.combo_profile(engine.combo_id(types))
     
     # Categorize by multiplier
-    result = {
-        'immune': [],        # 0x
-        'very_resistant': [], # 0.25x
-        'resistant': [],     # 0.5x
-        'neutral': [],       # 1x
-        'weak': [],          # 2x
-        'very_weak': []      # 4x
+    return {
+        'immune': engine.names(profile == 0.0),           # 0x
+        'very_resistant': engine.names(profile == 0.25),  # 0.25x
+        'resistant': engine.names(profile == 0.5),        # 0.5x
+        'neutral': engine.names(profile == 1.0),          # 1x
+        'weak': engine.names(profile == 2.0),             # 2x
+        'very_weak': engine.names(profile == 4.0)         # 4x
     }
-    
-    for type_name, mult in multipliers.items():
-        if mult == 0.0:
-            result['immune'].append(type_name)
-        elif mult == 0.25:
-            result['very_resistant'].append(type_name)
-        elif mult == 0.5:
-            result['resistant'].append(type_name)
-        elif mult == 1.0:
-            result['neutral'].append(type_name)
-        elif mult == 2.0:
-            result['weak'].append(type_name)
-        elif mult == 4.0:
-            result['very_weak'].append(type_name)
-    
-    return result
 
 
 def display_type_calculator():
@@ -231,18 +81,19 @@ def display_type_calculator():
     st.markdown("### ⚔️ Type Effectiveness Calculator")
     st.markdown("Calculate damage multipliers and analyze type matchups")
     
+    all_types = get_type_engine().types
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### Attacking Type")
         attacking_type = st.selectbox(
             "Select attacking move type",
-            options=list(TYPE_CHART.keys()),
+            options=all_types,
             help="Choose the type of the move being used"
         )
         
         st.markdown(f"**{attacking_type} Type Moves:**")
-        attack_data = TYPE_CHART[attacking_type]
+        attack_data = get_attack_matchups(attacking_type)
         
         if attack_data['super_effective']:
             st.success(f"✅ **Super Effective (2x):** {', '.join(attack_data['super_effective'])}")
@@ -257,7 +108,7 @@ def display_type_calculator():
         st.markdown("#### Defending Pokemon")
         defending_type1 = st.selectbox(
             "Primary Type",
-            options=list(TYPE_CHART.keys()),
+            options=all_types,
             help="Choose the defending Pokemon's primary type"
         )
         
@@ -267,7 +118,7 @@ def display_type_calculator():
         if has_second_type:
             defending_type2 = st.selectbox(
                 "Secondary Type",
-                options=[t for t in TYPE_CHART.keys() if t != defending_type1],
+                options=[t for t in all_types if t != defending_type1],
                 help="Choose the defending Pokemon's secondary type"
             )
         
@@ -334,20 +185,13 @@ def display_type_calculator():
     st.markdown("---")
     st.markdown("#### 🔥 Type Coverage Heatmap")
     
-    # Create matrix data
-    all_types = list(TYPE_CHART.keys())
-    matrix_data = []
-    
-    for def_type in all_types:
-        row = []
-        for atk_type in all_types:
-            mult = calculate_type_effectiveness(atk_type, [def_type])
-            row.append(mult)
-        matrix_data.append(row)
+    # Create matrix data (rows: defending type, columns: attacking type)
+    engine = get_type_engine()
+    all_types = engine.types
     
     # Create DataFrame
     coverage_df = pd.DataFrame(
-        matrix_data,
+        engine.matrix.T,
         index=all_types,
         columns=all_types
     )
@@ -378,6 +222,55 @@ def display_type_calculator():
     )
     
     st.plotly_chart(fig, use_container_width=True)
+    
+    # Move coverage planner
+    st.markdown("---")
+    display_coverage_planner()
+
+
+def display_coverage_planner():
+    """Find the fewest move types hitting every type combination super effectively"""
+    st.markdown("#### 🎯 Move Coverage Planner")
+    st.markdown("Smallest sets of move types that hit all 171 single and dual type combinations super effectively")
+    
+    solver = get_coverage_solver()
+    all_types = solver.engine.types
+    
+    planner_cols = st.columns([2, 1])
+    with planner_cols[0]:
+        required = st.multiselect(
+            "Move types you already have",
+            options=all_types,
+            help="Every suggested set will include these types"
+        )
+    with planner_cols[1]:
+        target_pct = st.slider(
+            "Combinations to cover (%)",
+            min_value=50,
+            max_value=100,
+            value=90,
+            step=5
+        )
+    
+    result = solver.solve(target=target_pct / 100, required=required, max_solutions=10)
+    if not result['solutions']:
+        st.warning("No set of move types reaches this target")
+        return
+    
+    st.success(
+        f"**{result['size']} move types** reach {result['target']}/{result['total']} combinations"
+    )
+    planner_df = pd.DataFrame({
+        'Move Types': [', '.join(s) for s in result['solutions']],
+        'Combinations Hit': result['covered']
+    })
+    st.dataframe(planner_df, use_container_width=True, hide_index=True)
+    
+    if required:
+        additions = solver.best_additions(required, top_n=5)
+        st.info("**Best single additions:** " + ', '.join(
+            f"{a['type']} (+{a['added']})" for a in additions
+        ))
 
 
 def get_offensive_coverage(types: List[str]) -> Dict[str, int]:
@@ -390,23 +283,20 @@ def get_offensive_coverage(types: List[str]) -> Dict[str, int]:
     Returns:
         dict: Counts of types that can be hit at each multiplier
     """
+    # Rows of the type matrix for each of the Pokemon's types
+    engine = get_type_engine()
+    known = [t for t in types if engine.index(t) != NO_TYPE]
+    rows = engine.offensive_profile(known)
+    
     coverage = {
-        'super_effective': set(),
-        'neutral': set(),
-        'not_effective': set(),
-        'no_effect': set()
+        'super_effective': engine.names((rows == 2.0).any(axis=0)),
+        'not_effective': engine.names((rows == 0.5).any(axis=0)),
+        'no_effect': engine.names((rows == 0.0).any(axis=0))
     }
     
-    for poke_type in types:
-        if poke_type in TYPE_CHART:
-            data = TYPE_CHART[poke_type]
-            coverage['super_effective'].update(data['super_effective'])
-            coverage['not_effective'].update(data['not_effective'])
-            coverage['no_effect'].update(data['no_effect'])
-    
     # Calculate neutral (types not in other categories)
-    all_types = set(TYPE_CHART.keys())
-    coverage['neutral'] = all_types - coverage['super_effective'] - coverage['not_effective'] - coverage['no_effect']
+    covered = set(coverage['super_effective']) | set(coverage['not_effective']) | set(coverage['no_effect'])
+    coverage['neutral'] = [t for t in engine.types if t not in covered]
     
     # Convert sets to lists and return counts
     return {
@@ -59,7 +59,8 @@ def display_variant_statistics(df: pd.DataFrame):
     with tab1:
         st.markdown("#### Variant Type Distribution")
         
-        variant_counts = df['variant_type'].value_counts()
+        # variant_type is categorical; drop categories absent from the frame
+        variant_counts = df['variant_type'].value_counts().loc[lambda counts: counts > 0]
         
         col1, col2 = st.columns(2)
         
@@ -347,7 +348,7 @@ def display_variant_statistics(df: pd.DataFrame):
         with col1:
             st.markdown("##### Regional Forms")
             if len(regional_forms) > 0:
-                regional_counts = regional_forms['variant_type'].value_counts()
+                regional_counts = regional_forms['variant_type'].value_counts().loc[lambda counts: counts > 0]
                 
                 fig_regional = px.pie(
                     values=regional_counts.values,
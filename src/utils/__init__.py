@@ -7,6 +7,7 @@ from .error_logger import ErrorLogger, get_error_logger, log_error
 from .data_validator import DataValidator
 from .backup_manager import BackupManager
 from .performance_profiler import PerformanceProfiler, get_profiler, profile
+from .validation_cache import ValidationCache, get_validation_cache
 
 __all__ = [
     'ErrorLogger',
@@ -16,7 +17,9 @@ __all__ = [
     'BackupManager',
     'PerformanceProfiler',
     'get_profiler',
-    'profile'
+    'profile',
+    'ValidationCache',
+    'get_validation_cache'
 ]
 
 __version__ = '1.0.0'
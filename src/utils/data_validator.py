@@ -6,7 +6,7 @@ Validates CSV files, JSON data, and ensures data integrity
 import pandas as pd
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Callable
 from datetime import datetime
 
 
@@ -289,9 +289,26 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
         return output_file
     
+    def data_file_checks(self, data_dir: str = "data") -> List[Tuple[Path, Callable[[str], Tuple[bool, Dict]]]]:
+        """
+        List the project data files and the check that validates each one
+
+        Returns:
+            List of (file path, check) pairs; each check takes the path as a string
+        """
+        data_path = Path(data_dir)
+        return [
+            # Pokemon CSV
+            (data_path / "pokemon.csv", self.validate_pokemon_csv),
+            # national_dex CSV
+            (data_path / "national_dex.csv",
+             lambda path: self.validate_csv(path, ['pokedex_number', 'name', 'type_1'])),
+            # Competitive data
+            (data_path / "competitive" / "competitive_data.json", self.validate_competitive_json),
+        ]
+    
     def validate_all_data_files(self, data_dir: str = "data") -> Dict:
         """Validate all data files in the project"""
-        data_path = Path(data_dir)
         results = {
             'total': 0,
             'valid': 0,
@@ -299,30 +316,12 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             'files': []
         }
         
-        # Validate Pokemon CSV
-        pokemon_csv = data_path / "pokemon.csv"
-        if pokemon_csv.exists():
-            is_valid, report = self.validate_pokemon_csv(str(pokemon_csv))
-            results['total'] += 1
-            results['valid' if is_valid else 'invalid'] += 1
-            results['files'].append(report)
-        
-        # Validate national_dex CSV
-        national_dex = data_path / "national_dex.csv"
-        if national_dex.exists():
-            required_cols = ['pokedex_number', 'name', 'type_1']
-            is_valid, report = self.validate_csv(str(national_dex), required_cols)
-            results['total'] += 1
-            results['valid' if is_valid else 'invalid'] += 1
-            results['files'].append(report)
-        
-        # Validate competitive data
-        comp_json = data_path / "competitive" / "competitive_data.json"
-        if comp_json.exists():
-            is_valid, report = self.validate_competitive_json(str(comp_json))
-            results['total'] += 1
-            results['valid' if is_valid else 'invalid'] += 1
-            results['files'].append(report)
+        for file_path, check in self.data_file_checks(data_dir):
+            if file_path.exists():
+                is_valid, report = check(str(file_path))
+                results['total'] += 1
+                results['valid' if is_valid else 'invalid'] += 1
+                results['files'].append(report)
         
         return results
 
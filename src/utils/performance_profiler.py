@@ -29,6 +29,7 @@ class PerformanceProfiler:
         self.profile_log = self.log_dir / f"profile_{datetime.now().strftime('%Y%m%d')}.json"
         self.profiles = self._load_profiles()
         self.current_timers = {}
+        self.caches = {}
     
     def _load_profiles(self) -> List[Dict]:
         """Load existing performance profiles"""
@@ -103,6 +104,30 @@ class PerformanceProfiler:
         
         return wrapper
     
+    def register_cache(self, name: str, stats_func: Callable[[], Dict]):
+        """
+        Register a cache whose counters appear in cache stats and reports
+        
+        Args:
+            name: Display name of the cache
+            stats_func: Returns a dict with hits, misses, size and maxsize
+        """
+        self.caches[name] = stats_func
+    
+    def get_cache_stats(self) -> Dict[str, Dict]:
+        """Current hit/miss counters and hit rate of every registered cache"""
+        stats = {}
+        for name, stats_func in self.caches.items():
+            try:
+                info = dict(stats_func())
+            except Exception as e:
+                print(f"Warning: Could not read cache stats for {name}: {e}")
+                continue
+            lookups = info.get('hits', 0) + info.get('misses', 0)
+            info['hit_rate'] = round(info.get('hits', 0) / lookups, 4) if lookups else 0.0
+            stats[name] = info
+        return stats
+    
     def get_system_info(self) -> Dict:
         """Get current system resource usage"""
         info = {'timestamp': datetime.now().isoformat()}
@@ -247,6 +272,17 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             report += f"| {profile['operation']} | {profile['duration_seconds']}s | "
             report += f"{profile['memory_delta_mb']} MB |\n"
         
+        # Cache statistics
+        cache_stats = self.get_cache_stats()
+        if cache_stats:
+            report += "\n## Cache Statistics\n\n"
+            report += "| Cache | Hits | Misses | Hit Rate | Size | Max Size |\n"
+            report += "|-------|------|--------|----------|------|----------|\n"
+            
+            for name, info in cache_stats.items():
+                report += f"| {name} | {info.get('hits', 0)} | {info.get('misses', 0)} | "
+                report += f"{info['hit_rate']:.1%} | {info.get('size', 0)} | {info.get('maxsize', '')} |\n"
+        
         # Operation statistics
         report += "\n## Operation Statistics\n\n"
         report += "| Operation | Calls | Avg Time | Min | Max | Total Time |\n"
@@ -0,0 +1,214 @@
+"""
+Validation Result Cache
+Validates each data file version once, off the request path, and persists the outcome
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from .data_validator import DataValidator
+except ImportError:
+    from data_validator import DataValidator
+
+
+def _file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Hash a file's contents in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    Persistent validation results keyed by file fingerprint
+
+    A file's cached report is reused while its mtime and size are unchanged;
+    if only the mtime moved, the content hash decides. Stale files are
+    validated by a background worker, and readers only ever see cached results.
+    A validation that raises is cached with its error (and retried once the
+    file changes), so failures are reported rather than left pending.
+    """
+
+    def __init__(self, cache_file: str = "data/.cache/validation_cache.json",
+                 data_dir: str = "data"):
+        """Initialize the validation cache"""
+        self.cache_file = Path(cache_file)
+        self.data_dir = data_dir
+        self.validator = DataValidator()
+        self.entries = self._load_entries()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self.worker_error: Optional[str] = None
+
+    def _load_entries(self) -> Dict[str, Dict]:
+        """Load persisted results"""
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def _save_entries(self):
+        """Atomically persist results"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f, indent=2, default=str)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            print(f"Warning: Could not save validation cache: {e}")
+
+    def _is_current(self, file_path: Path) -> bool:
+        """Check a cached entry against the file's mtime and size (caller holds the lock)"""
+        entry = self.entries.get(str(file_path))
+        if entry is None:
+            return False
+        stat = file_path.stat()
+        return entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size
+
+    def stale_files(self) -> List[Path]:
+        """Existing data files without a current cached result"""
+        with self._lock:
+            return [
+                file_path
+                for file_path, _ in self.validator.data_file_checks(self.data_dir)
+                if file_path.exists() and not self._is_current(file_path)
+            ]
+
+    def cached_results(self) -> Dict:
+        """
+        Summarize cached outcomes without validating anything
+
+        Returns:
+            Dict shaped like DataValidator.validate_all_data_files(), plus a
+            'pending' list of files whose current version is not validated yet,
+            a 'failed' list of {'file', 'error'} for validations that raised and
+            'worker_error' if the background refresh itself failed
+        """
+        results = {'total': 0, 'valid': 0, 'invalid': 0, 'files': [], 'pending': [],
+                   'failed': [], 'worker_error': None}
+
+        with self._lock:
+            for file_path, _ in self.validator.data_file_checks(self.data_dir):
+                if not file_path.exists():
+                    continue
+                if not self._is_current(file_path):
+                    results['pending'].append(str(file_path))
+                    continue
+
+                entry = self.entries[str(file_path)]
+                if entry.get('error'):
+                    results['failed'].append({'file': str(file_path), 'error': entry['error']})
+                    continue
+
+                report = entry['report']
+                results['total'] += 1
+                results['valid' if report['is_valid'] else 'invalid'] += 1
+                results['files'].append(report)
+            results['worker_error'] = self.worker_error
+
+        return results
+
+    def refresh(self) -> int:
+        """
+        Validate every stale file and persist the results
+
+        Returns:
+            Number of files that were actually re-validated
+        """
+        validated = 0
+
+        for file_path, check in self.validator.data_file_checks(self.data_dir):
+            if not file_path.exists():
+                continue
+            with self._lock:
+                if self._is_current(file_path):
+                    continue
+                entry = self.entries.get(str(file_path))
+
+            stat = file_path.stat()
+            report, error = None, None
+            try:
+                sha256 = _file_sha256(file_path)
+                if entry is not None and entry['sha256'] == sha256 and not entry.get('error'):
+                    # Touched but unchanged: keep the report, refresh the fingerprint
+                    report = entry['report']
+                else:
+                    validated += 1
+                    _, report = check(str(file_path))
+            except Exception as e:
+                sha256 = None
+                error = f"{type(e).__name__}: {e}"
+
+            with self._lock:
+                self.entries[str(file_path)] = {
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'sha256': sha256,
+                    'validated_at': datetime.now().isoformat(),
+                    'report': report,
+                    'error': error
+                }
+
+        with self._lock:
+            self._save_entries()
+
+        return validated
+
+    def start_background_refresh(self) -> bool:
+        """
+        Validate stale files on a daemon thread if needed
+
+        Returns:
+            True if a worker is running after the call
+        """
+        with self._worker_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return True
+            if not self.stale_files():
+                return False
+
+            self._worker = threading.Thread(
+                target=self._refresh_in_background, name="validation-cache", daemon=True
+            )
+            self._worker.start()
+            return True
+
+    def _refresh_in_background(self):
+        """Worker target: refresh, keeping any failure for cached_results()"""
+        try:
+            self.refresh()
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        with self._lock:
+            self.worker_error = error
+
+    def wait(self, timeout: Optional[float] = None):
+        """Block until the background worker finishes"""
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+
+# Global validation cache instance
+_validation_cache = None
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get global validation cache instance"""
+    global _validation_cache
+    if _validation_cache is None:
+        _validation_cache = ValidationCache()
+    return _validation_cache
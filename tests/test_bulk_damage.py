@@ -0,0 +1,198 @@
+"""
+Test Suite for Bulk Damage Scenarios
+Tests scenario parsing, agreement with DamageCalculator and streamed output
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from bulk_damage import ScenarioEvaluator, parse_stats, parse_modifiers, run_scenarios, HAS_PYARROW
+from damage_calculator import DamageCalculator
+
+
+DEX = [
+    {'name': 'Garchomp', 'pokedex_number': 445, 'type_1': 'Dragon', 'type_2': 'Ground',
+     'hp': 108, 'attack': 130, 'defense': 95, 'sp_attack': 80, 'sp_defense': 85, 'speed': 102},
+    {'name': 'Snorlax', 'pokedex_number': 143, 'type_1': 'Normal', 'type_2': None,
+     'hp': 160, 'attack': 110, 'defense': 65, 'sp_attack': 65, 'sp_defense': 110, 'speed': 30},
+    {'name': 'Charizard', 'pokedex_number': 6, 'type_1': 'Fire', 'type_2': 'Flying',
+     'hp': 78, 'attack': 84, 'defense': 78, 'sp_attack': 109, 'sp_defense': 85, 'speed': 100},
+]
+
+MOVES = {
+    'Earthquake': {'move_type': 'Ground', 'move_category': 'Physical', 'move_power': 100},
+    'Flamethrower': {'move_type': 'Fire', 'move_category': 'Special', 'move_power': 90},
+    'Ice Beam': {'move_type': 'Ice', 'move_category': 'Special', 'move_power': 90},
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Data directory with a three-Pokemon dex"""
+    pd.DataFrame(DEX).to_csv(tmp_path / "pokemon.csv", index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def calculator(data_dir):
+    """Damage calculator over the test dex"""
+    return DamageCalculator(data_dir=str(data_dir), cache_size=0)
+
+
+@pytest.fixture
+def evaluator(calculator):
+    """Scenario evaluator over the same dex"""
+    return ScenarioEvaluator(calculator.pokemon_data)
+
+
+def record(calculator, name):
+    """A dex row as the dashboard passes it to the calculator"""
+    dex = calculator.pokemon_data
+    return dex[dex['name'] == name].iloc[0].to_dict()
+
+
+def scenarios(n=60, seed=3):
+    """Random scenarios, some with spreads and modifiers"""
+    rng = np.random.default_rng(seed)
+    names = [p['name'] for p in DEX]
+    rows = []
+    for _ in range(n):
+        move = rng.choice(list(MOVES))
+        row = {'attacker': rng.choice(names), 'defender': rng.choice(names), 'move': move, **MOVES[move]}
+        if rng.random() < 0.5:
+            row['attacker_evs'] = '0/252/0/252/4/0'
+            row['attacker_nature'] = rng.choice(['Adamant', 'Modest', 'Hardy'])
+        if rng.random() < 0.5:
+            row['defender_evs'] = '252/0/252/0/4/0'
+            row['defender_level'] = 50
+        if rng.random() < 0.3:
+            row['modifiers'] = json.dumps({'weather': 1.5, 'attack_boost': 1})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+class TestParsing:
+    """Test scenario cell parsing"""
+
+    def test_stat_forms(self):
+        """Test slash strings, lists, dicts, JSON and missing values"""
+        expected = [252, 0, 0, 0, 4, 252]
+        assert parse_stats('252/0/0/0/4/252', 0).tolist() == expected
+        assert parse_stats(expected, 0).tolist() == expected
+        assert parse_stats({'hp': 252, 'sp_defense': 4, 'speed': 252}, 0).tolist() == expected
+        assert parse_stats(json.dumps(expected), 0).tolist() == expected
+        assert parse_stats(float('nan'), 31).tolist() == [31] * 6
+        with pytest.raises(ValueError):
+            parse_stats('252/0', 0)
+
+    def test_modifier_columns_override(self):
+        """Test individual columns overlay the JSON modifiers"""
+        row = {'modifiers': '{"weather": 1.5, "critical": true}', 'weather': 0.5, 'attack_boost': 2.0}
+        assert parse_modifiers(row) == {'weather': 0.5, 'critical': True, 'attack_boost': 2}
+
+
+class TestEvaluation:
+    """Test evaluated results"""
+
+    def test_matches_calculator(self, evaluator, calculator):
+        """Test every row equals the single calculation with applied spreads"""
+        frame = scenarios()
+        result = evaluator.evaluate(frame)
+        engine = calculator.stat_engine
+        for row, out in zip(frame.to_dict('records'), result.to_dict('records')):
+            attacker = record(calculator, row['attacker'])
+            defender = record(calculator, row['defender'])
+            if isinstance(row.get('attacker_evs'), str):
+                evs = [int(v) for v in row['attacker_evs'].split('/')]
+                attacker = engine.apply(attacker, evs=evs, nature=row['attacker_nature'])
+            if isinstance(row.get('defender_evs'), str):
+                evs = [int(v) for v in row['defender_evs'].split('/')]
+                defender = engine.apply(defender, evs=evs, level=50)
+            move = {'name': row['move'], 'type': row['move_type'],
+                    'category': row['move_category'], 'power': row['move_power']}
+            modifiers = json.loads(row['modifiers']) if isinstance(row.get('modifiers'), str) else {}
+
+            expected = calculator.calculate_damage(attacker, defender, move, modifiers)
+            assert out['error'] is None
+            for key in ('min_damage', 'max_damage', 'damage', 'ohko', 'twoko', 'type_multiplier'):
+                assert out[key] == expected[key], key
+
+    def test_ko_chances(self, evaluator, calculator):
+        """Test ko_n columns equal damage_distribution"""
+        frame = scenarios(n=10)
+        result = evaluator.evaluate(frame, ko_hits=3)
+        for row, out in zip(frame.to_dict('records'), result.to_dict('records')):
+            move = {'name': row['move'], 'type': row['move_type'],
+                    'category': row['move_category'], 'power': row['move_power']}
+            attacker = record(calculator, row['attacker'])
+            defender = record(calculator, row['defender'])
+            if isinstance(row.get('attacker_evs'), str) or isinstance(row.get('defender_evs'), str):
+                continue
+            modifiers = json.loads(row['modifiers']) if isinstance(row.get('modifiers'), str) else {}
+            chances = calculator.damage_distribution(attacker, defender, move, modifiers, max_hits=3)['ko_chances']
+            assert [out['ko_1'], out['ko_2'], out['ko_3']] == pytest.approx(chances)
+
+    def test_invalid_rows(self, evaluator):
+        """Test bad rows report an error without failing the chunk"""
+        frame = pd.DataFrame([
+            {'attacker': 'Missingno', 'defender': 'Snorlax', 'move': 'Earthquake', **MOVES['Earthquake']},
+            {'attacker': 'Garchomp', 'defender': 'Snorlax', 'move': 'Unknown'},
+            {'attacker': 'Garchomp', 'defender': 'Snorlax', 'move': 'Earthquake',
+             'attacker_nature': 'Grumpy', **MOVES['Earthquake']},
+            {'attacker': 'Garchomp', 'defender': 'Snorlax', 'move': 'Earthquake', **MOVES['Earthquake']},
+        ])
+        result = evaluator.evaluate(frame, start=10)
+        assert result['scenario'].tolist() == [10, 11, 12, 13]
+        assert result['error'].notna().tolist() == [True, True, True, False]
+        assert result['min_damage'].isna().tolist() == [True, True, True, False]
+
+
+class TestRunScenarios:
+    """Test file processing"""
+
+    def test_pool_matches_inline(self, data_dir, tmp_path):
+        """Test pooled JSONL chunks equal an inline CSV run, in input order"""
+        frame = scenarios(n=45)
+        frame.to_csv(tmp_path / "in.csv", index=False)
+        frame.to_json(tmp_path / "in.jsonl", orient='records', lines=True)
+
+        inline = run_scenarios(tmp_path / "in.csv", tmp_path / "inline.csv",
+                               data_dir=str(data_dir), workers=1, chunk_size=7)
+        pooled = run_scenarios(tmp_path / "in.jsonl", tmp_path / "pooled.csv",
+                               data_dir=str(data_dir), workers=2, chunk_size=7)
+        assert inline == pooled == {'scenarios': 45, 'errors': 0, 'chunks': 7}
+
+        first = pd.read_csv(tmp_path / "inline.csv")
+        second = pd.read_csv(tmp_path / "pooled.csv")
+        assert first['scenario'].tolist() == list(range(45))
+        pd.testing.assert_frame_equal(first, second)
+
+    @pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+    @pytest.mark.parametrize('bad_row', [3, 10])
+    def test_parquet_output(self, data_dir, tmp_path, bad_row):
+        """Test streamed Parquet output equals CSV output, with the error in the first or a later chunk"""
+        frame = scenarios(n=20)
+        frame.loc[bad_row, 'attacker'] = 'Missingno'
+        frame.to_csv(tmp_path / "in.csv", index=False)
+
+        options = dict(data_dir=str(data_dir), workers=1, chunk_size=6, ko_hits=2)
+        run_scenarios(tmp_path / "in.csv", tmp_path / "out.csv", **options)
+        run_scenarios(tmp_path / "in.csv", tmp_path / "out.parquet", **options)
+        parquet = pd.read_parquet(tmp_path / "out.parquet")
+        csv = pd.read_csv(tmp_path / "out.csv")
+        assert len(parquet) == 20 and parquet['error'].notna().tolist() == (csv.index == bad_row).tolist()
+        assert parquet['damage'].astype('float64').equals(csv['damage'].astype('float64'))
+        np.testing.assert_allclose(parquet['ko_2'], csv['ko_2'])
+
+    def test_unsupported_format(self, data_dir, tmp_path):
+        """Test unknown input extensions are rejected"""
+        (tmp_path / "in.txt").write_text("attacker,defender,move\n")
+        with pytest.raises(ValueError):
+            run_scenarios(tmp_path / "in.txt", tmp_path / "out.csv", data_dir=str(data_dir), workers=1)
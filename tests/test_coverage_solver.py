@@ -0,0 +1,82 @@
+"""
+Test Suite for Coverage Solver
+Tests bitmask coverage and minimal set search
+"""
+
+import pytest
+import sys
+from itertools import combinations
+from pathlib import Path
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from coverage_solver import get_coverage_solver
+
+
+@pytest.fixture
+def solver():
+    """Shared coverage solver"""
+    return get_coverage_solver()
+
+
+class TestCoverage:
+    """Test bitmask evaluation"""
+
+    def test_masks_match_profiles(self, solver):
+        """Test each mask bit agrees with the combo profile table"""
+        engine = solver.engine
+        for attack in range(engine.n_types):
+            for combo_id in range(engine.n_combos):
+                hit = engine.combo_profiles[combo_id, attack] >= 2
+                assert bool(solver.masks[attack] >> combo_id & 1) == hit
+
+    def test_coverage_counts(self, solver):
+        """Test union counts and uncovered names"""
+        assert solver.coverage([]) == 0
+        assert solver.coverage(['Ground']) == solver.masks[solver.engine.index('Ground')].bit_count()
+        uncovered = solver.uncovered(['Ice', 'Ground'])
+        assert 'Normal' in uncovered
+        assert 'Dragon/Flying' not in uncovered and 'Flying/Dragon' not in uncovered
+
+
+class TestSolve:
+    """Test minimal set search"""
+
+    def test_full_cover(self, solver):
+        """Test solutions cover everything and no smaller set exists"""
+        result = solver.solve(1.0, max_solutions=3)
+        assert result['target'] == result['coverable']
+        for types in result['solutions']:
+            assert len(types) == result['size']
+            assert solver.coverage(types) == result['coverable']
+
+    def test_partial_cover_is_minimal(self, solver):
+        """Test a partial target's size against brute force"""
+        result = solver.solve(0.8)
+        size = result['size']
+        assert all(c >= result['target'] for c in result['covered'])
+
+        types = solver.engine.types
+        smaller = [
+            combo for combo in combinations(types, size - 1)
+            if solver.coverage(combo) >= result['target']
+        ]
+        assert smaller == []
+
+    def test_required_types_included(self, solver):
+        """Test required types appear in every solution"""
+        result = solver.solve(0.9, required=['Normal'])
+        assert all(s[0] == 'Normal' for s in result['solutions'])
+
+    def test_allowed_types_only(self, solver):
+        """Test restricting candidates limits what is coverable"""
+        result = solver.solve(1.0, allowed=['Fire', 'Water', 'Grass'])
+        assert result['solutions'] == [['Fire', 'Water', 'Grass']]
+        assert result['coverable'] < result['total']
+
+    def test_max_size_unreachable(self, solver):
+        """Test an unreachable size limit returns no solutions"""
+        result = solver.solve(1.0, max_size=2)
+        assert result['size'] is None
+        assert result['solutions'] == []
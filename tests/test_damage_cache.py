@@ -0,0 +1,122 @@
+"""
+Test Suite for Damage Cache
+Tests key canonicalization, LRU eviction and calculator memoization
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics and utils to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "utils"))
+
+from damage_cache import DamageCache, battle_key
+from damage_calculator import DamageCalculator
+from performance_profiler import PerformanceProfiler
+
+
+ATTACKER = {'name': 'Garchomp', 'attack': 130, 'sp_attack': 80, 'type_1': 'Dragon', 'type_2': 'Ground'}
+DEFENDER = {'name': 'Snorlax', 'hp': 160, 'defense': 65, 'sp_defense': 110, 'type_1': 'Normal', 'type_2': None}
+MOVE = {'name': 'Earthquake', 'type': 'Ground', 'category': 'Physical', 'power': 100}
+
+
+@pytest.fixture
+def calculator(tmp_path):
+    """Damage calculator over a two-Pokemon dex"""
+    pd.DataFrame([
+        {**ATTACKER, 'pokedex_number': 445, 'hp': 108, 'defense': 95, 'sp_defense': 85, 'speed': 102},
+        {**DEFENDER, 'pokedex_number': 143, 'attack': 110, 'sp_attack': 65, 'speed': 30},
+    ]).to_csv(tmp_path / "pokemon.csv", index=False)
+    return DamageCalculator(data_dir=str(tmp_path), cache_size=8)
+
+
+class TestKeys:
+    """Test canonical keys"""
+
+    def test_defaults_and_order(self):
+        """Test omitted defaults, key order and NumPy values share a key"""
+        explicit = {'critical': False, 'attack_boost': 0, 'weather': 1.0}
+        numpy_attacker = {**ATTACKER, 'attack': np.int64(130), 'level': 100}
+        assert battle_key('damage', ATTACKER, DEFENDER, MOVE, {}) == \
+            battle_key('damage', numpy_attacker, DEFENDER, MOVE, explicit)
+
+    def test_missing_type(self):
+        """Test NaN and None second types share a key"""
+        nan_defender = {**DEFENDER, 'type_2': float('nan')}
+        assert battle_key('damage', ATTACKER, DEFENDER, MOVE, {}) == \
+            battle_key('damage', ATTACKER, nan_defender, MOVE, {})
+
+    def test_inputs_that_matter(self):
+        """Test stats, boosts and extra arguments change the key"""
+        base = battle_key('damage', ATTACKER, DEFENDER, MOVE, {})
+        assert base != battle_key('damage', {**ATTACKER, 'attack': 131}, DEFENDER, MOVE, {})
+        assert base != battle_key('damage', ATTACKER, DEFENDER, MOVE, {'attack_boost': 1})
+        assert base != battle_key('distribution', ATTACKER, DEFENDER, MOVE, {})
+        assert battle_key('d', ATTACKER, DEFENDER, MOVE, {}, 0.5) != battle_key('d', ATTACKER, DEFENDER, MOVE, {}, 1.0)
+
+
+class TestDamageCache:
+    """Test the LRU cache"""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted"""
+        cache = DamageCache(maxsize=2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        cache.get_or_compute('a', lambda: 0)  # refresh 'a'
+        cache.get_or_compute('c', lambda: 3)
+        assert cache.get_or_compute('a', lambda: -1) == 1
+        assert cache.get_or_compute('b', lambda: -2) == -2
+        assert cache.info() == {'hits': 2, 'misses': 4, 'size': 2, 'maxsize': 2}
+
+    def test_results_are_copies(self):
+        """Test callers cannot alter a cached result"""
+        cache = DamageCache()
+        cache.get_or_compute('k', lambda: {'rolls': [1, 2]})['rolls'].append(3)
+        assert cache.get_or_compute('k', lambda: None) == {'rolls': [1, 2]}
+
+    def test_disabled(self):
+        """Test a zero-size cache always computes"""
+        cache = DamageCache(maxsize=0)
+        assert cache.get_or_compute('k', lambda: 1) == 1
+        assert cache.get_or_compute('k', lambda: 2) == 2
+        assert cache.info()['misses'] == 2 and len(cache) == 0
+
+
+class TestCalculatorMemoization:
+    """Test DamageCalculator uses the cache"""
+
+    def test_repeat_calls_hit(self, calculator):
+        """Test identical calls hit and match the uncached result"""
+        first = calculator.calculate_damage(ATTACKER, DEFENDER, MOVE, {})
+        second = calculator.calculate_damage(dict(ATTACKER), dict(DEFENDER), dict(MOVE), {'critical': False})
+        assert first == second == calculator._calculate_damage(ATTACKER, DEFENDER, MOVE, {})
+        assert calculator.cache.info()['hits'] == 1
+
+        calculator.damage_distribution(ATTACKER, DEFENDER, MOVE, {})
+        calculator.damage_distribution(ATTACKER, DEFENDER, MOVE, {})
+        calculator.damage_distribution(ATTACKER, DEFENDER, MOVE, {}, max_hits=2)
+        assert calculator.cache.info()['hits'] == 2
+
+    def test_sweep_cached(self, calculator):
+        """Test repeated sweeps hit and return independent frames"""
+        first = calculator.sweep(ATTACKER, MOVE, {})
+        first['name'] = 'changed'
+        second = calculator.sweep(ATTACKER, MOVE, {})
+        assert 'changed' not in second['name'].tolist()
+        assert calculator.cache.info()['hits'] == 1
+
+    def test_profiler_reports_counters(self, calculator, tmp_path):
+        """Test registered caches appear in the profiler's cache stats"""
+        profiler = PerformanceProfiler(log_dir=str(tmp_path / "perf"))
+        profiler.register_cache('damage_calculator', calculator.cache.info)
+        calculator.calculate_damage(ATTACKER, DEFENDER, MOVE, {})
+        calculator.calculate_damage(ATTACKER, DEFENDER, MOVE, {})
+
+        stats = profiler.get_cache_stats()['damage_calculator']
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert 'Cache Statistics' in Path(profiler.export_performance_report()).read_text()
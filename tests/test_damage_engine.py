@@ -0,0 +1,151 @@
+"""
+Test Suite for Damage Engine
+Tests the one-vs-all sweep and exact roll distributions
+"""
+
+import pytest
+import sys
+from itertools import product
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from damage_engine import DamageEngine, stat_stage_multiplier, damage_rolls, ko_chances, ko_cache_info
+from damage_calculator import DamageCalculator
+
+
+@pytest.fixture
+def dex():
+    """Create a small defender pool"""
+    return pd.DataFrame({
+        'pokedex_number': [6, 25, 143, 445, 94],
+        'name': ['Charizard', 'Pikachu', 'Snorlax', 'Garchomp', 'Gengar'],
+        'type_1': ['Fire', 'Electric', 'Normal', 'Dragon', 'Ghost'],
+        'type_2': ['Flying', None, None, 'Ground', 'Poison'],
+        'hp': [78, 35, 160, 108, 60], 'attack': [84, 55, 110, 130, 65],
+        'defense': [78, 40, 65, 95, 60], 'sp_attack': [109, 50, 65, 80, 130],
+        'sp_defense': [85, 50, 110, 85, 75], 'speed': [100, 90, 30, 102, 110],
+        'total_points': [534, 320, 540, 600, 500]
+    })
+
+
+@pytest.fixture
+def calculator(tmp_path, dex):
+    """Damage calculator over the same pool"""
+    dex.to_csv(tmp_path / "pokemon.csv", index=False)
+    return DamageCalculator(data_dir=str(tmp_path))
+
+
+MOVES = [
+    {'name': 'Flamethrower', 'type': 'Fire', 'category': 'Special', 'power': 90},
+    {'name': 'Earthquake', 'type': 'Ground', 'category': 'Physical', 'power': 100},
+    {'name': 'Shadow Ball', 'type': 'Ghost', 'category': 'Special', 'power': 80},
+]
+
+MODIFIERS = [
+    {},
+    {'attack_boost': 2, 'defense_boost': -1, 'critical': True, 'item': 1.5},
+    {'attack_boost': -3, 'defense_boost': 4, 'weather': 1.5, 'ability': 1.3},
+]
+
+
+class TestSweep:
+    """Test sweep results"""
+
+    @pytest.mark.parametrize('move', MOVES)
+    @pytest.mark.parametrize('modifiers', MODIFIERS)
+    def test_matches_single_calculation(self, calculator, dex, move, modifiers):
+        """Test every row equals calculate_damage for that defender"""
+        attacker = dex.iloc[3].to_dict()
+        result = DamageEngine(dex).sweep(attacker, move, modifiers)
+
+        for i in range(len(dex)):
+            single = calculator.calculate_damage(attacker, dex.iloc[i].to_dict(), move, modifiers)
+            assert result['min_damage'][i] == single['min_damage']
+            assert result['max_damage'][i] == single['max_damage']
+            assert result['damage'][i] == single['damage']
+            assert result['type_multiplier'][i] == single['type_multiplier']
+            assert result['ohko'][i] == single['ohko']
+            assert result['twoko'][i] == single['twoko']
+
+    def test_immunity_and_status(self, dex):
+        """Test immune defenders and status moves take no damage"""
+        engine = DamageEngine(dex)
+        attacker = dex.iloc[3].to_dict()
+        result = engine.sweep(attacker, MOVES[1])
+        assert result['max_damage'][0] == 0  # Flying is immune to Ground
+
+        status = engine.sweep(attacker, {'name': 'Toxic', 'type': 'Poison', 'power': None})
+        assert not status['max_damage'].any()
+
+    def test_subset_pool(self, dex):
+        """Test a named pool sweeps only its members"""
+        engine = DamageEngine(dex).subset(['Pikachu', 'Gengar'])
+        assert len(engine) == 2
+        frame = engine.sweep_frame(dex.iloc[3].to_dict(), MOVES[1])
+        assert frame['name'].tolist() == ['Pikachu', 'Gengar']
+
+
+class TestDistribution:
+    """Test exact rolls and KO chances"""
+
+    def test_rolls(self):
+        """Test the 16 rolls span min_damage to max_damage"""
+        rolls = damage_rolls(100.0)
+        assert rolls.tolist() == list(range(85, 101))
+        assert damage_rolls([50.0, 10.0]).shape == (2, 16)
+
+    def test_single_hit_chance(self):
+        """Test OHKO chance is the share of lethal rolls"""
+        chances = ko_chances(range(85, 101), range(127, 143), hp=93, crit_chance=0.0, max_hits=2)
+        assert chances == [0.5, 1.0]
+
+    def test_matches_brute_force(self):
+        """Test convolution against enumerating every roll and crit outcome"""
+        rolls, crit_rolls, hp, crit = list(range(20, 36)), list(range(30, 46)), 90, 0.25
+        outcomes = [(r, (1 - crit) / 16) for r in rolls] + [(r, crit / 16) for r in crit_rolls]
+
+        expected = []
+        for hits in (1, 2, 3):
+            total = 0.0
+            for combo in product(outcomes, repeat=hits):
+                if sum(r for r, _ in combo) >= hp:
+                    p = 1.0
+                    for _, weight in combo:
+                        p *= weight
+                    total += p
+            expected.append(total)
+
+        assert np.allclose(ko_chances(rolls, crit_rolls, hp, crit_chance=crit, max_hits=3), expected)
+
+    def test_cached_on_canonical_input(self):
+        """Test reordered rolls reuse the cached result"""
+        ko_chances([10, 12, 11] * 5 + [13], [15] * 16, hp=41, crit_chance=0.1)
+        hits = ko_cache_info().hits
+        ko_chances([13] + [11, 12, 10] * 5, np.full(16, 15), hp=41.0, crit_chance=0.1)
+        assert ko_cache_info().hits == hits + 1
+
+    def test_calculator_distribution(self, calculator, dex):
+        """Test the calculator's rolls agree with its min/max damage"""
+        attacker, defender = dex.iloc[3].to_dict(), dex.iloc[2].to_dict()
+        single = calculator.calculate_damage(attacker, defender, MOVES[1], {})
+        distribution = calculator.damage_distribution(attacker, defender, MOVES[1], {})
+
+        assert distribution['rolls'][0] == single['min_damage']
+        assert distribution['rolls'][-1] == single['max_damage']
+        assert len(distribution['crit_rolls']) == 16
+        assert distribution['ko_chances'] == sorted(distribution['ko_chances'])
+
+
+class TestStages:
+    """Test stat stage multipliers"""
+
+    def test_stage_multipliers(self):
+        """Test boosts and drops"""
+        assert stat_stage_multiplier(0) == 1.0
+        assert stat_stage_multiplier(2) == 2.0
+        assert stat_stage_multiplier(-2) == 0.5
+        assert np.allclose(stat_stage_multiplier(np.array([6, -6])), [4.0, 0.25])
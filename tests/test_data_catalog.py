@@ -0,0 +1,106 @@
+"""
+Test Suite for Data Catalog
+Tests one-time loading, change detection and shared catalogs
+"""
+
+import pytest
+import sys
+import json
+import os
+from pathlib import Path
+import pandas as pd
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from data_catalog import DataCatalog, get_data_catalog
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a minimal data directory"""
+    pd.DataFrame({
+        'pokedex_number': [6, 25],
+        'name': ['Charizard', 'Pikachu'],
+        'type_1': ['Fire', 'Electric'],
+        'type_2': ['Flying', None],
+        'hp': [78, 35], 'attack': [84, 55], 'defense': [78, 40],
+        'sp_attack': [109, 50], 'sp_defense': [85, 50], 'speed': [100, 90],
+        'total_points': [534, 320]
+    }).to_csv(tmp_path / "pokemon.csv", index=False)
+
+    (tmp_path / "competitive").mkdir()
+    pd.DataFrame({
+        'pokemon_id': [6], 'name': ['Charizard'], 'tier': ['OU'],
+        'usage_percent': [5.0], 'last_updated': ['2024-01']
+    }).to_csv(tmp_path / "competitive" / "tier_data.csv", index=False)
+
+    (tmp_path / "moves").mkdir()
+    with open(tmp_path / "moves" / "pokemon_movesets.json", 'w') as f:
+        json.dump({'6': {'pokemon_id': 6, 'name': 'Charizard', 'types': ['FIRE', 'FLYING'],
+                         'moveset': [{'name': 'Flamethrower', 'type': 'Fire',
+                                      'category': 'Special', 'power': 90,
+                                      'accuracy': 100, 'learn_method': 'tm'}]}}, f)
+
+    return tmp_path
+
+
+class TestDataCatalog:
+    """Test dataset caching"""
+
+    def test_pokemon_is_enriched(self, data_dir):
+        """Test pokemon() returns the enriched dex"""
+        catalog = DataCatalog(data_dir)
+        df = catalog.pokemon()
+        assert len(df) == 2
+        assert 'type_combo' in df.columns
+        assert df.loc[0, 'type_combo'] == 'Fire/Flying'
+
+    def test_loaded_once(self, data_dir):
+        """Test repeated access reuses the parsed data"""
+        catalog = DataCatalog(data_dir)
+        assert catalog.movesets() is catalog.movesets()
+
+    def test_movesets_store(self, data_dir):
+        """Test movesets are served from the compact store"""
+        catalog = DataCatalog(data_dir)
+        assert catalog.movesets().moveset('Charizard')[0]['name'] == 'Flamethrower'
+
+    def test_pokemon_index(self, data_dir):
+        """Test the pokemon index is built once and matches the data"""
+        catalog = DataCatalog(data_dir)
+        index = catalog.pokemon_index()
+        assert index is catalog.pokemon_index()
+        assert index.row('Pikachu')['pokedex_number'] == 25
+
+    def test_reload_on_change(self, data_dir):
+        """Test a changed source file is re-read"""
+        catalog = DataCatalog(data_dir)
+        assert len(catalog.tier_data()) == 1
+
+        path = data_dir / "competitive" / "tier_data.csv"
+        pd.DataFrame({
+            'pokemon_id': [6, 25], 'name': ['Charizard', 'Pikachu'], 'tier': ['OU', 'UU'],
+            'usage_percent': [5.0, 2.0], 'last_updated': ['2024-01', '2024-01']
+        }).to_csv(path, index=False)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert len(catalog.tier_data()) == 2
+
+    def test_frames_are_isolated(self, data_dir):
+        """Test callers cannot modify each other's frames"""
+        catalog = DataCatalog(data_dir)
+        first = catalog.pokemon()
+        first['name'] = 'changed'
+        assert catalog.pokemon().loc[0, 'name'] == 'Charizard'
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing dataset raises FileNotFoundError"""
+        catalog = DataCatalog(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            catalog.usage_stats()
+
+    def test_shared_catalog(self, data_dir):
+        """Test get_data_catalog returns one catalog per directory"""
+        assert get_data_catalog(str(data_dir)) is get_data_catalog(str(data_dir))
@@ -0,0 +1,107 @@
+"""
+Test Suite for Dex Enrichment
+Tests the vectorized derived columns against the row-wise originals
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from dex_enrichment import enrich_dex, add_type_effectiveness, VARIANT_ORDER, AGAINST_COLUMNS
+
+
+@pytest.fixture
+def dex():
+    """Create a small dex covering each role"""
+    return pd.DataFrame({
+        'pokedex_number': [6, 6, 25, 143, 242, 1],
+        'name': ['Charizard', 'Mega Charizard Y', 'Pikachu', 'Snorlax', 'Blissey', 'Bulbasaur'],
+        'type_1': ['Fire', 'Fire', 'Electric', 'Normal', 'Normal', 'Grass'],
+        'type_2': ['Flying', 'Flying', None, None, '', 'Poison'],
+        'hp': [78, 78, 35, 160, 255, 45],
+        'attack': [84, 104, 55, 110, 10, 49],
+        'defense': [78, 78, 40, 65, 10, 49],
+        'sp_attack': [109, 159, 50, 65, 75, 65],
+        'sp_defense': [85, 115, 50, 110, 135, 65],
+        'speed': [100, 100, 90, 30, 55, 45],
+        'total_points': [534, 634, 320, 540, 540, 318],
+        'variant_type': ['base', 'mega-y', 'base', 'base', 'base', 'gigantamax-x']
+    })
+
+
+class TestEnrichment:
+    """Test enrich_dex derived columns"""
+
+    def test_type_combo(self, dex):
+        """Test type combos skip missing and empty secondary types"""
+        df = enrich_dex(dex)
+        assert list(df['type_combo']) == [
+            'Fire/Flying', 'Fire/Flying', 'Electric', 'Normal', 'Normal', 'Grass/Poison'
+        ]
+
+    def test_type_combo_id(self, dex):
+        """Test combo ids point at each row's defensive profile"""
+        from type_engine import get_type_engine
+
+        df = enrich_dex(dex)
+        engine = get_type_engine()
+        assert df.loc[0, 'type_combo_id'] == df.loc[1, 'type_combo_id']
+        assert df.loc[3, 'type_combo_id'] == df.loc[4, 'type_combo_id'] == engine.combo_id(['Normal'])
+        profile = engine.combo_profile(df.loc[0, 'type_combo_id'])
+        assert profile[engine.index('Rock')] == 4.0
+
+    def test_type_effectiveness_columns(self, dex):
+        """Test against_* columns replace stale values for every row"""
+        dex['against_rock'] = 1.0
+        df = enrich_dex(dex)
+        assert len(AGAINST_COLUMNS) == 18
+        assert df.loc[0, 'against_rock'] == 4.0
+        assert df.loc[0, 'against_ground'] == 0.0
+        assert df.loc[3, 'against_fight'] == 2.0
+        assert df.loc[3, 'against_ghost'] == 0.0
+
+    def test_type_effectiveness_follows_types(self, dex):
+        """Test a variant with changed types gets its own multipliers"""
+        df = add_type_effectiveness(dex)
+        dex.loc[1, 'type_2'] = 'Dragon'
+        df = add_type_effectiveness(dex)
+        assert df.loc[1, 'against_rock'] == 2.0
+        assert df.loc[1, 'against_dragon'] == 2.0
+
+    def test_roles_match_recommender_rules(self, dex):
+        """Test roles follow the recommender's priority order"""
+        df = enrich_dex(dex)
+        assert list(df['role']) == [
+            'Support', 'Special Sweeper', 'Balanced',
+            'Special Tank', 'Special Tank', 'Balanced'
+        ]
+
+    def test_archetypes(self, dex):
+        """Test archetypes follow the similar finder's rules"""
+        df = enrich_dex(dex)
+        assert df.loc[1, 'archetype'] == 'special_attacker'
+        assert df.loc[3, 'archetype'] == 'physical_attacker'
+
+    def test_variant_sort_order(self, dex):
+        """Test known variants are ordered and unknown ones sort last"""
+        df = enrich_dex(dex)
+        assert df.loc[0, 'variant_sort_order'] == VARIANT_ORDER['base']
+        assert df.loc[1, 'variant_sort_order'] == VARIANT_ORDER['mega-y']
+        assert df.loc[5, 'variant_sort_order'] == 99
+
+    def test_stat_vectors_and_rank(self, dex):
+        """Test normalized stats and BST rank"""
+        df = enrich_dex(dex)
+        assert df.loc[4, 'hp_norm'] == pytest.approx(1.0)
+        assert df.loc[1, 'bst_rank'] == 1
+        assert list(df.loc[[3, 4], 'bst_rank']) == [2, 2], "Ties share the best rank"
+
+    def test_missing_variant_columns_are_added(self, dex):
+        """Test pre-variant datasets get default variant columns"""
+        df = enrich_dex(dex.drop(columns=['variant_type']))
+        assert (df['variant_type'] == 'base').all()
+        assert list(df['base_pokemon_id']) == list(df['pokedex_number'])
@@ -0,0 +1,71 @@
+"""
+Test Suite for Dex Index
+Tests name, pokedex number and variant group lookups
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from dex_index import DexIndex
+from dex_store import DexStore
+
+
+@pytest.fixture
+def dex():
+    """Create a small dex with variants out of display order"""
+    return pd.DataFrame({
+        'pokedex_number': [6, 25, 6, 6, 150],
+        'name': ['Mega Charizard Y', 'Pikachu', 'Charizard', 'Mega Charizard X', 'Mewtwo'],
+        'base_pokemon_id': [6, 25, 6, 6, 150],
+        'variant_type': ['mega-y', 'base', 'base', 'mega-x', 'base'],
+        'variant_sort_order': [3, 0, 0, 2, 0]
+    }, index=[10, 11, 12, 13, 14])
+
+
+class TestDexIndex:
+    """Test index lookups"""
+
+    def test_name_lookup(self, dex):
+        """Test name to row lookup"""
+        index = DexIndex(dex)
+        assert index.position('Pikachu') == 1
+        assert index.row('Mewtwo')['pokedex_number'] == 150
+        assert 'Charizard' in index
+
+    def test_unknown_name(self, dex):
+        """Test unknown names return None"""
+        index = DexIndex(dex)
+        assert index.position('Missingno') is None
+        assert index.row('Missingno') is None
+
+    def test_number_positions(self, dex):
+        """Test pokedex number to rows lookup"""
+        index = DexIndex(dex)
+        assert sorted(index.number_positions(6)) == [0, 2, 3]
+        assert len(index.number_positions(999)) == 0
+
+    def test_variant_group_in_display_order(self, dex):
+        """Test variant groups are ordered base first"""
+        index = DexIndex(dex)
+        assert list(index.variants(6)['name']) == [
+            'Charizard', 'Mega Charizard X', 'Mega Charizard Y'
+        ]
+        assert index.variants(999).empty
+
+    def test_missing_columns(self):
+        """Test a frame with only names still indexes by name"""
+        index = DexIndex(pd.DataFrame({'name': ['Bulbasaur']}))
+        assert index.position('Bulbasaur') == 0
+        assert len(index.variant_positions(1)) == 0
+
+    def test_store_index_matches_frame(self, dex):
+        """Test store positions line up with the store frame"""
+        store = DexStore(dex)
+        position = store.index.position('Mewtwo')
+        assert store.frame.iloc[position]['name'] == 'Mewtwo'
+        assert store.index is store.index
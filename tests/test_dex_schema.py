@@ -0,0 +1,89 @@
+"""
+Test Suite for Dex Schema
+Tests dictionary-seeded dtypes and safe casting
+"""
+
+import pytest
+import sys
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from dex_schema import DexSchema, get_dex_schema, prepare_dex
+
+
+@pytest.fixture
+def dex():
+    """Create a small dex as parsed from CSV"""
+    return pd.DataFrame({
+        'pokedex_number': [1, 4, 150],
+        'name': ['Bulbasaur', 'Charmander', 'Mewtwo'],
+        'generation': [1, 1, 1],
+        'status': ['Normal', 'Normal', 'Legendary'],
+        'type_1': ['Grass', 'Fire', 'Psychic'],
+        'type_2': ['Poison', None, None],
+        'hp': [45, 39, 106], 'attack': [49, 52, 110], 'defense': [49, 43, 90],
+        'sp_attack': [65, 60, 154], 'sp_defense': [65, 50, 90], 'speed': [45, 65, 130],
+        'total_points': [318, 309, 680],
+        'catch_rate': [45.0, 45.0, np.nan],
+        'against_fire': [2.0, 0.5, 1.0]
+    })
+
+
+class TestDexSchema:
+    """Test schema construction and casting"""
+
+    def test_from_dictionary(self, tmp_path):
+        """Test dtypes are inferred from the dictionary summaries"""
+        path = tmp_path / "dictionary.json"
+        path.write_text(json.dumps({'columns': {
+            'type_number': {'dtype': 'int64', 'min': 1.0, 'max': 2.0},
+            'weight_kg': {'dtype': 'float64', 'min': 0.1, 'max': 999.9},
+            'catch_rate': {'dtype': 'float64', 'min': 3.0, 'max': 255.0},
+            'growth_rate': {'dtype': 'object', 'unique_values': {'Slow': 1}},
+            'species': {'dtype': 'object'}
+        }}))
+        dtypes = DexSchema.from_dictionary(path).dtypes
+        assert dtypes['type_number'] == 'uint8'
+        assert dtypes['weight_kg'] == 'float32'
+        assert dtypes['catch_rate'] == 'UInt8'
+        assert dtypes['growth_rate'] == 'category'
+        assert 'species' not in dtypes
+        assert dtypes['hp'] == 'int16'
+
+    def test_compact_dtypes(self, dex):
+        """Test stats, categories and nullable ints after preparation"""
+        df = prepare_dex(dex)
+        assert df['hp'].dtype == 'int16'
+        assert isinstance(df['type_1'].dtype, pd.CategoricalDtype)
+        assert isinstance(df['status'].dtype, pd.CategoricalDtype)
+        assert str(df['catch_rate'].dtype) == 'UInt8'
+        assert df['catch_rate'].isna().sum() == 1
+        assert df['against_fire'].dtype == 'float32'
+
+    def test_generation_integer(self, dex):
+        """Test generation stays a small integer for comparisons and arithmetic"""
+        df = prepare_dex(dex)
+        assert df['generation'].dtype == 'int8'
+        assert (df['generation'] <= 5).all()
+        assert df['generation'].mean() == pytest.approx(dex['generation'].mean())
+
+    def test_values_preserved(self, dex):
+        """Test casting does not change any value"""
+        df = prepare_dex(dex.copy())
+        assert df['name'].tolist() == dex['name'].tolist()
+        assert df['type_2'].isna().tolist() == [False, True, True]
+        assert df['total_points'].tolist() == [318, 309, 680]
+
+    def test_unfit_column_left_unchanged(self):
+        """Test non-integral values are not forced into an int dtype"""
+        df = DexSchema({'catch_rate': 'UInt8'}).apply(pd.DataFrame({'catch_rate': [1.5, 2.0]}))
+        assert df['catch_rate'].dtype == 'float64'
+
+    def test_shared_schema(self):
+        """Test loaders share one schema"""
+        assert get_dex_schema() is get_dex_schema()
@@ -0,0 +1,87 @@
+"""
+Test Suite for Dex Snapshot
+Tests columnar snapshot building, reuse and invalidation
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+import pandas as pd
+
+pytest.importorskip("pyarrow")
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from dex_snapshot import DexSnapshot, load_dex_frame
+
+
+@pytest.fixture
+def dex_csv(tmp_path):
+    """Write a small dex CSV for testing"""
+    df = pd.DataFrame({
+        'pokedex_number': [1, 4, 7],
+        'name': ['Bulbasaur', 'Charmander', 'Squirtle'],
+        'type_1': ['Grass', 'Fire', 'Water'],
+        'type_2': ['Poison', None, None],
+        'hp': [45, 39, 44]
+    })
+    path = tmp_path / "dex.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+class TestDexSnapshot:
+    """Test snapshot lifecycle"""
+
+    def test_first_load_builds_snapshot(self, dex_csv):
+        """Test the first load writes snapshot and manifest"""
+        snapshot = DexSnapshot(dex_csv)
+        assert not snapshot.is_fresh(), "No snapshot should exist yet"
+
+        df = snapshot.load()
+        assert len(df) == 3
+        assert snapshot.snapshot_path.exists(), "Snapshot file should be written"
+        assert snapshot.manifest_path.exists(), "Manifest should be written"
+        assert snapshot.is_fresh(), "Snapshot should match the CSV"
+
+    def test_fresh_snapshot_skips_csv_parse(self, dex_csv, monkeypatch):
+        """Test a fresh snapshot is read without parsing the CSV"""
+        expected = load_dex_frame(dex_csv)
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("CSV should not be parsed")
+
+        monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+        df = load_dex_frame(dex_csv)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_changed_csv_rebuilds(self, dex_csv):
+        """Test editing the CSV invalidates the snapshot"""
+        load_dex_frame(dex_csv)
+
+        df = pd.read_csv(dex_csv)
+        df.loc[0, 'hp'] = 99
+        df.to_csv(dex_csv, index=False)
+
+        reloaded = load_dex_frame(dex_csv)
+        assert reloaded.loc[0, 'hp'] == 99, "Snapshot should be rebuilt from new CSV"
+
+    def test_touched_csv_reuses_snapshot(self, dex_csv):
+        """Test an mtime-only change is detected as unchanged content"""
+        snapshot = DexSnapshot(dex_csv)
+        snapshot.load()
+
+        stat = dex_csv.stat()
+        os.utime(dex_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert snapshot.is_fresh(), "Same content should keep the snapshot"
+
+    def test_custom_cache_dir(self, dex_csv, tmp_path):
+        """Test snapshots can live outside the data directory"""
+        cache_dir = tmp_path / "snapshots"
+        snapshot = DexSnapshot(dex_csv, cache_dir=cache_dir)
+        snapshot.load()
+        assert snapshot.snapshot_path.parent == cache_dir
+        assert snapshot.snapshot_path.exists()
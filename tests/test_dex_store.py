@@ -0,0 +1,102 @@
+"""
+Test Suite for Dex Store
+Tests shared frame isolation and position-based filtering
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from dex_store import DexStore
+
+
+@pytest.fixture
+def store():
+    """Create a store over a small dex"""
+    df = pd.DataFrame({
+        'pokedex_number': [6, 6, 25, 150, 151],
+        'name': ['Charizard', 'Mega Charizard X', 'Pikachu', 'Mewtwo', 'Mew'],
+        'type_1': ['Fire', 'Fire', 'Electric', 'Psychic', 'Psychic'],
+        'generation': [1, 1, 1, 1, 1],
+        'status': ['Normal', 'Normal', 'Normal', 'Legendary', 'Mythical'],
+        'variant_type': ['base', 'mega-x', 'base', 'base', 'base'],
+        'total_points': [534, 634, 320, 680, 600]
+    })
+    return DexStore(df)
+
+
+class TestDexStoreFilters:
+    """Test select() filters"""
+
+    def test_no_filters_returns_all(self, store):
+        """Test empty filters keep every row"""
+        assert list(store.select()) == [0, 1, 2, 3, 4]
+
+    def test_variant_filter(self, store):
+        """Test variant type filter"""
+        assert list(store.select(variant_types=['mega-x'])) == [1]
+
+    def test_combined_filters(self, store):
+        """Test filters are intersected"""
+        positions = store.select(
+            primary_types=['Psychic'],
+            status='Legendary',
+            bst_range=(600, 700)
+        )
+        assert list(positions) == [3]
+
+    def test_bst_range_inclusive(self, store):
+        """Test BST bounds are inclusive"""
+        assert list(store.select(bst_range=(320, 534))) == [0, 2]
+
+    def test_missing_column_is_ignored(self, store):
+        """Test filters on absent columns do not drop rows"""
+        df = store.frame.drop(columns=['variant_type'])
+        assert len(DexStore(df).select(variant_types=['base'])) == 5
+
+    def test_take_returns_selected_rows(self, store):
+        """Test take() materializes the selected rows"""
+        taken = store.take(store.select(generation=1, primary_types=['Fire']))
+        assert list(taken['name']) == ['Charizard', 'Mega Charizard X']
+
+    def test_categorical_columns(self, store):
+        """Test filters match on categorical codes"""
+        df = store.frame
+        for column in ['variant_type', 'type_1', 'status']:
+            df[column] = df[column].astype('category')
+        df['generation'] = df['generation'].astype(pd.CategoricalDtype(range(1, 10), ordered=True))
+        categorical = DexStore(df)
+
+        assert list(categorical.select(variant_types=['base', 'galarian'])) == [0, 2, 3, 4]
+        assert list(categorical.select(primary_types=['Psychic'], status='Mythical')) == [4]
+        assert list(categorical.select(generation=1)) == [0, 1, 2, 3, 4]
+        assert len(categorical.select(generation=9)) == 0
+
+
+class TestDexStoreIsolation:
+    """Test sessions cannot mutate the shared frame"""
+
+    @pytest.fixture(autouse=True)
+    def copy_on_write(self):
+        """Enable Copy-on-Write as the app does on pandas 2.x"""
+        if int(pd.__version__.split('.')[0]) < 3:
+            with pd.option_context('mode.copy_on_write', True):
+                yield
+        else:
+            yield
+
+    def test_new_column_does_not_leak(self, store):
+        """Test adding a column to a session frame leaves the store untouched"""
+        session_df = store.frame
+        session_df['type_combo'] = 'x'
+        assert 'type_combo' not in store.frame.columns
+
+    def test_value_write_does_not_leak(self, store):
+        """Test writing values to a session frame leaves the store untouched"""
+        session_df = store.frame
+        session_df.loc[0, 'total_points'] = 1
+        assert store.frame.loc[0, 'total_points'] == 534
@@ -0,0 +1,110 @@
+"""
+Test Suite for EV Optimizer
+Tests minimal survivable spreads against per-spread damage calculations
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from damage_calculator import DamageCalculator
+from ev_optimizer import MAX_SPREAD_EVS
+
+
+@pytest.fixture
+def dex():
+    """Create a small dex"""
+    return pd.DataFrame({
+        'pokedex_number': [6, 143, 445, 94],
+        'name': ['Charizard', 'Snorlax', 'Garchomp', 'Gengar'],
+        'type_1': ['Fire', 'Normal', 'Dragon', 'Ghost'],
+        'type_2': ['Flying', None, 'Ground', 'Poison'],
+        'hp': [78, 160, 108, 60], 'attack': [84, 110, 130, 65],
+        'defense': [78, 65, 95, 60], 'sp_attack': [109, 65, 80, 130],
+        'sp_defense': [85, 110, 85, 75], 'speed': [100, 30, 102, 110],
+        'total_points': [534, 540, 600, 500]
+    })
+
+
+@pytest.fixture
+def calculator(tmp_path, dex):
+    """Damage calculator over the same dex"""
+    dex.to_csv(tmp_path / "pokemon.csv", index=False)
+    return DamageCalculator(data_dir=str(tmp_path))
+
+
+EARTHQUAKE = {'name': 'Earthquake', 'type': 'Ground', 'category': 'Physical', 'power': 100}
+SHADOW_BALL = {'name': 'Shadow Ball', 'type': 'Ghost', 'category': 'Special', 'power': 80}
+
+
+def survival(calculator, defender, evs, nature, threat):
+    """Survival chance of one spread via the calculator's exact distribution"""
+    final = calculator.stat_engine.apply(defender, evs, nature)
+    distribution = calculator.damage_distribution(
+        threat['attacker'], final, threat['move'], threat.get('modifiers', {}), max_hits=1
+    )
+    return 1 - distribution['ko_chances'][0]
+
+
+def threat(calculator, dex, name, evs, nature, move):
+    """An attacker with a final-stat spread and a move"""
+    attacker = calculator.stat_engine.apply(dex.set_index('name').loc[name].to_dict() | {'name': name},
+                                            evs, nature)
+    return {'attacker': attacker, 'move': move}
+
+
+class TestOptimize:
+    """Test spread search"""
+
+    def test_minimal_against_brute_force(self, calculator, dex):
+        """Test the spread survives and no cheaper HP/Def spread does"""
+        defender = dex.iloc[0].to_dict()
+        attack = threat(calculator, dex, 'Garchomp', {'attack': 252}, 'Adamant', EARTHQUAKE)
+        # Charizard is immune to Ground; use a strong Normal-type stand-in move
+        attack['move'] = {**EARTHQUAKE, 'type': 'Normal', 'power': 220}
+        result = calculator.optimize_evs(defender, [attack], 'Bold', target=0.9)
+
+        assert result['feasible'] and result['total'] > 0
+        assert result['evs']['sp_defense'] == 0
+        assert survival(calculator, defender, result['evs'], 'Bold', attack) >= 0.9
+        assert result['survival'][0] == pytest.approx(survival(calculator, defender, result['evs'], 'Bold', attack))
+
+        for hp in range(0, result['total'], 4):
+            for defense in range(0, result['total'] - hp, 4):
+                evs = {'hp': hp, 'defense': defense}
+                assert survival(calculator, defender, evs, 'Bold', attack) < 0.9
+
+    def test_mixed_threats(self, calculator, dex):
+        """Test physical and special threats are all survived"""
+        defender = dex.iloc[1].to_dict()
+        threats = [
+            threat(calculator, dex, 'Garchomp', {'attack': 252}, 'Adamant', {**EARTHQUAKE, 'power': 150}),
+            threat(calculator, dex, 'Gengar', {'sp_attack': 252}, 'Modest', {**SHADOW_BALL, 'type': 'Dark', 'power': 200}),
+        ]
+        result = calculator.optimize_evs(defender, threats, 'Careful', target=0.8)
+
+        assert result['total'] <= MAX_SPREAD_EVS
+        assert result['remaining'] == MAX_SPREAD_EVS - result['total']
+        for attack, chance in zip(threats, result['survival']):
+            assert chance >= 0.8
+            assert chance == pytest.approx(survival(calculator, defender, result['evs'], 'Careful', attack))
+        assert all(alt['total'] >= result['total'] for alt in result['alternatives'])
+
+    def test_infeasible_reports_best_effort(self, calculator, dex):
+        """Test an unreachable target still returns the safest legal spread"""
+        defender = dex.iloc[3].to_dict()
+        attack = threat(calculator, dex, 'Garchomp', {'attack': 252}, 'Adamant', {**EARTHQUAKE, 'power': 250})
+        result = calculator.optimize_evs(defender, [attack], 'Bold', target=1.0)
+
+        assert not result['feasible']
+        assert result['total'] <= MAX_SPREAD_EVS
+        assert result['worst'] == max([result['worst']] + [a['worst'] for a in result['alternatives']])
+
+    def test_no_threats(self, calculator, dex):
+        """Test no threats need no EVs"""
+        result = calculator.optimize_evs(dex.iloc[0].to_dict(), [], 'Hardy')
+        assert result['feasible'] and result['total'] == 0
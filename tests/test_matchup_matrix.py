@@ -0,0 +1,115 @@
+"""
+Test Suite for Matchup Matrix
+Tests tier matchup artifacts and incremental rebuilds
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from damage_engine import DamageEngine
+from matchup_matrix import (
+    attack_moves, build_matchups, compute_matchups, load_matchups, tier_pool, MATCHUP_LEVEL
+)
+from data_catalog import DataCatalog
+
+
+@pytest.fixture
+def dex():
+    """Create a small dex"""
+    return pd.DataFrame({
+        'pokedex_number': [6, 25, 143, 445, 94, 9],
+        'name': ['Charizard', 'Pikachu', 'Snorlax', 'Garchomp', 'Gengar', 'Blastoise'],
+        'type_1': ['Fire', 'Electric', 'Normal', 'Dragon', 'Ghost', 'Water'],
+        'type_2': ['Flying', None, None, 'Ground', 'Poison', None],
+        'hp': [78, 35, 160, 108, 60, 79], 'attack': [84, 55, 110, 130, 65, 83],
+        'defense': [78, 40, 65, 95, 60, 100], 'sp_attack': [109, 50, 65, 80, 130, 85],
+        'sp_defense': [85, 50, 110, 85, 75, 105], 'speed': [100, 90, 30, 102, 110, 78],
+        'total_points': [534, 320, 540, 600, 500, 530]
+    })
+
+
+@pytest.fixture
+def data_dir(tmp_path, dex):
+    """Data directory with a dex and two tiers"""
+    dex.to_csv(tmp_path / "pokemon.csv", index=False)
+    (tmp_path / "competitive").mkdir()
+    pd.DataFrame({
+        'pokemon_id': [6, 25, 143, 445, 94, 9],
+        'name': dex['name'],
+        'tier': ['OU', 'OU', 'OU', 'UU', 'UU', 'UU'],
+        'usage_percent': [10.0] * 6,
+        'last_updated': ['2025-11-04'] * 6
+    }).to_csv(tmp_path / "competitive" / "tier_data.csv", index=False)
+    return tmp_path
+
+
+def build(data_dir, **kwargs):
+    """Build with a fresh catalog so file changes are seen"""
+    return build_matchups(str(data_dir), max_workers=1,
+                          catalog=DataCatalog(str(data_dir)), **kwargs)
+
+
+class TestCompute:
+    """Test matrix contents"""
+
+    def test_matches_damage_engine(self, dex):
+        """Test each cell is the best single sweep over the attacker's moves"""
+        pool = tier_pool(dex, dex['name'])
+        moves = [attack_moves(row, []) for row in pool.to_dict('records')]
+        matrix = compute_matchups({'ALL': pool}, {'ALL': moves}, max_workers=1, chunk_size=4)['ALL']
+
+        engine = DamageEngine(pool)
+        for a, attacker in enumerate(pool.to_dict('records')):
+            attacker['level'] = MATCHUP_LEVEL
+            best = np.max([engine.sweep(attacker, move)['percent'] for move in moves[a]], axis=0)
+            assert np.allclose(matrix.best_percent[a], best, rtol=1e-6)
+
+        garchomp, charizard = matrix.names.index('Garchomp'), matrix.names.index('Charizard')
+        assert matrix.speed[garchomp, charizard] == 1
+        assert matrix.speed[charizard, garchomp] == -1
+        assert (np.diag(matrix.speed) == 0).all()
+
+    def test_immunity_is_no_ko(self, dex):
+        """Test a Normal-only attacker never KOs a Ghost"""
+        pool = tier_pool(dex, ['Snorlax', 'Gengar'])
+        moves = [attack_moves(row, []) for row in pool.to_dict('records')]
+        matrix = compute_matchups({'T': pool}, {'T': moves}, max_workers=1)['T']
+        result = matrix.lookup('Snorlax', 'Gengar')
+        assert result['best_percent'] == 0 and result['ko_hits'] == 0
+
+    def test_process_pool_matches(self, dex):
+        """Test chunks computed across processes equal the in-process result"""
+        pool = tier_pool(dex, dex['name'])
+        moves = [attack_moves(row, []) for row in pool.to_dict('records')]
+        serial = compute_matchups({'ALL': pool}, {'ALL': moves}, max_workers=1, chunk_size=2)['ALL']
+        parallel = compute_matchups({'ALL': pool}, {'ALL': moves}, max_workers=2, chunk_size=2)['ALL']
+        for key in ('best_percent', 'best_move', 'ko_hits', 'speed'):
+            assert np.array_equal(serial.arrays[key], parallel.arrays[key])
+
+
+class TestBuild:
+    """Test artifacts and incremental rebuilds"""
+
+    def test_build_and_load(self, data_dir):
+        """Test artifacts round-trip and counters exclude the defender"""
+        assert build(data_dir) == {'OU': 'built', 'UU': 'built'}
+        matrix = load_matchups('UU', str(data_dir))
+        assert sorted(matrix.names) == ['Blastoise', 'Garchomp', 'Gengar']
+        assert 'Gengar' not in matrix.counters('Gengar')['name'].tolist()
+        assert load_matchups('RU', str(data_dir)) is None
+
+    def test_only_changed_tiers_rebuild(self, data_dir, dex):
+        """Test unchanged tiers are skipped and an edited tier rebuilds"""
+        build(data_dir)
+        assert build(data_dir) == {'OU': 'unchanged', 'UU': 'unchanged'}
+
+        dex.loc[dex['name'] == 'Gengar', 'sp_attack'] = 140
+        dex.to_csv(data_dir / "pokemon.csv", index=False)
+        assert build(data_dir) == {'OU': 'unchanged', 'UU': 'built'}
+        assert build(data_dir, force=True) == {'OU': 'built', 'UU': 'built'}
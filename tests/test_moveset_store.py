@@ -0,0 +1,119 @@
+"""
+Test Suite for Moveset Store
+Tests JSON conversion, lookups and the compiled cache
+"""
+
+import pytest
+import sys
+import json
+from pathlib import Path
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+from moveset_store import MovesetStore, load_moveset_store
+
+FLAMETHROWER = {'name': 'Flamethrower', 'type': 'Fire', 'category': 'Special',
+                'power': 90, 'accuracy': 100}
+PROTECT = {'name': 'Protect', 'type': 'Normal', 'category': 'Status',
+           'power': 0, 'accuracy': None}
+SURF = {'name': 'Surf', 'type': 'Water', 'category': 'Special',
+        'power': 90, 'accuracy': 100}
+
+
+@pytest.fixture
+def movesets():
+    """Create movesets in the pokemon_movesets.json shape"""
+    return {
+        '6': {'pokemon_id': 6, 'name': 'Charizard', 'types': ['FIRE', 'FLYING'],
+              'moveset': [{**FLAMETHROWER, 'learn_method': 'tm'},
+                          {**PROTECT, 'learn_method': 'tm'}]},
+        '7': {'pokemon_id': 7, 'name': 'Squirtle', 'types': ['WATER'],
+              'moveset': [{**SURF, 'learn_method': 'level-up'},
+                          {**PROTECT, 'learn_method': 'egg'}]},
+        '132': {'pokemon_id': 132, 'name': 'Ditto', 'types': ['NORMAL'], 'moveset': []}
+    }
+
+
+class TestMovesetStore:
+    """Test store conversion and lookups"""
+
+    def test_moves_interned(self, movesets):
+        """Test each distinct move is stored once"""
+        store = MovesetStore.from_json(movesets)
+        assert len(store.moves) == 3
+        assert len(store.flat_move_ids) == 4
+
+    def test_round_trip(self, movesets):
+        """Test decoded entries match the source JSON"""
+        store = MovesetStore.from_json(movesets)
+        for key, entry in movesets.items():
+            assert store.entry(key) == entry
+
+    def test_lookup_by_name_and_id(self, movesets):
+        """Test Pokemon can be found by name, id or id string"""
+        store = MovesetStore.from_json(movesets)
+        assert store.moveset('Squirtle') == store.moveset(7) == store.moveset('7')
+        assert 'Charizard' in store
+        assert 'Missingno' not in store
+        assert store.moveset('Missingno') == []
+
+    def test_decoded_moves_are_copies(self, movesets):
+        """Test callers cannot corrupt the shared decoded moveset"""
+        store = MovesetStore.from_json(movesets)
+        store.moveset('Charizard')[0]['power'] = 0
+        assert store.moveset('Charizard')[0]['power'] == 90
+
+    def test_learners(self, movesets):
+        """Test who-learns-move lookups"""
+        store = MovesetStore.from_json(movesets)
+        assert store.learners('Protect') == ['Charizard', 'Squirtle']
+        assert store.learners('Surf') == ['Squirtle']
+        assert store.learners('Splash') == []
+
+    def test_save_and_load(self, movesets, tmp_path):
+        """Test the .npz form reloads identically"""
+        store = MovesetStore.from_json(movesets)
+        store.save(tmp_path / "store.npz")
+        loaded = MovesetStore.load(tmp_path / "store.npz")
+        assert loaded.entry('Charizard') == movesets['6']
+        assert list(loaded.move_ids('Squirtle')) == list(store.move_ids('Squirtle'))
+
+
+class TestLoadMovesetStore:
+    """Test the compiled cache"""
+
+    def test_compiled_once(self, movesets, tmp_path):
+        """Test the compiled store is reused until the JSON changes"""
+        json_path = tmp_path / "pokemon_movesets.json"
+        json_path.write_text(json.dumps(movesets))
+
+        load_moveset_store(json_path)
+        compiled = list((tmp_path / ".cache").glob("pokemon_movesets.*.npz"))
+        assert len(compiled) == 1
+
+        assert load_moveset_store(json_path).moveset('Ditto') == []
+
+        del movesets['132']
+        json_path.write_text(json.dumps(movesets))
+        store = load_moveset_store(json_path)
+        assert 'Ditto' not in store
+        assert len(list((tmp_path / ".cache").glob("pokemon_movesets.*.npz"))) == 1
+
+    def test_only_own_stores_removed(self, movesets, tmp_path):
+        """Test a rebuild keeps a sibling source's store and in-flight temp files"""
+        json_path = tmp_path / "pokemon_movesets.json"
+        json_path.write_text(json.dumps(movesets))
+        sibling = tmp_path / "pokemon_movesets.extra.json"
+        sibling.write_text(json.dumps(movesets))
+        load_moveset_store(sibling)
+        in_flight = tmp_path / ".cache" / "pokemon_movesets.0123456789abcdef.v1.4242.tmp.npz"
+        in_flight.write_bytes(b"partial")
+
+        load_moveset_store(json_path)
+        del movesets['132']
+        json_path.write_text(json.dumps(movesets))
+        load_moveset_store(json_path)
+
+        assert len(list((tmp_path / ".cache").glob("pokemon_movesets.extra.*.npz"))) == 1
+        assert in_flight.exists()
@@ -0,0 +1,109 @@
+"""
+Test Suite for Speed Tiers
+Tests binary-search speed queries against linear scans
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from speed_tiers import SpeedTierIndex, SPEED_MODIFIERS
+
+
+@pytest.fixture
+def dex():
+    """Create a dex with varied and tied Speeds"""
+    rng = np.random.default_rng(7)
+    n = 60
+    speeds = rng.integers(5, 160, n)
+    speeds[:4] = [100, 100, 30, 150]
+    stats = {stat: rng.integers(20, 150, n) for stat in ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense']}
+    return pd.DataFrame({'name': [f"Mon{i}" for i in range(n)], **stats, 'speed': speeds})
+
+
+@pytest.fixture
+def index(dex):
+    """Speed index with the bundled nature reference"""
+    return SpeedTierIndex(dex)
+
+
+def scan(index, speed, spread, level, field_modifiers=()):
+    """Linear-scan reference: (faster, slower, equal) name sets"""
+    factor = index.multiplier(field_modifiers)
+    field = {n: int(s * factor) for n, s in zip(index.names, index.speeds[(spread, level)])}
+    return (
+        {n for n, s in field.items() if s > speed},
+        {n for n, s in field.items() if s < speed},
+        {n for n, s in field.items() if s == speed},
+    )
+
+
+class TestSpeeds:
+    """Test the stored Speeds"""
+
+    def test_spreads(self, index):
+        """Test Speed 100 at each spread and level"""
+        assert index.speed('Mon0', 'max_plus', 100) == 328
+        assert index.speed('Mon0', 'max_neutral', 100) == 299
+        assert index.speed('Mon0', 'min_minus', 100) == 184
+        assert index.speed('Mon0', 'max_plus', 50) == 167
+
+    def test_modifiers(self, index):
+        """Test Scarf, Tailwind and paralysis"""
+        assert index.speed('Mon0', modifiers=['scarf']) == int(328 * 1.5)
+        assert index.speed('Mon0', modifiers=['tailwind', 'paralysis']) == 328
+        assert set(SPEED_MODIFIERS) == {'scarf', 'tailwind', 'paralysis'}
+
+
+class TestQueries:
+    """Test outspeed queries"""
+
+    @pytest.mark.parametrize('spread', ['max_plus', 'max_neutral', 'min_minus'])
+    @pytest.mark.parametrize('level', [50, 100])
+    def test_match_linear_scan(self, index, spread, level):
+        """Test faster_than / slower_than / ties for every Pokemon"""
+        for name in index.names:
+            speed = index.speed(name, spread, level)
+            faster, slower, equal = scan(index, speed, spread, level)
+            assert set(index.faster_than(name, spread, level)) == faster
+            assert set(index.slower_than(name, spread, level)) == slower
+            assert set(index.ties(name, spread, level)) == equal
+
+    def test_field_modifiers(self, index):
+        """Test a Scarfed target against a Tailwind field"""
+        speed = index.speed('Mon2', modifiers=['scarf'])
+        faster, slower, _ = scan(index, speed, 'max_plus', 100, ['tailwind'])
+        query = dict(modifiers=['scarf'], field_modifiers=['tailwind'])
+        assert set(index.faster_than('Mon2', **query)) == faster
+        assert set(index.slower_than('Mon2', **query)) == slower
+
+    def test_sorted_results(self, index):
+        """Test faster Pokemon come back slowest first"""
+        faster = index.faster_than(200, 'max_neutral')
+        speeds = [index.speed(n, 'max_neutral') for n in faster]
+        assert speeds == sorted(speeds) and min(speeds) > 200
+
+    def test_whole_dex_counts(self, index):
+        """Test each count key equals the length of the list query of the same name"""
+        counts = index.speed_counts('max_neutral', 100, field_spread='min_minus')
+        for i, name in enumerate(index.names):
+            for query in ('faster_than', 'slower_than'):
+                found = getattr(index, query)(name, 'max_neutral', field_spread='min_minus')
+                assert counts[query][i] == len(found)
+
+    def test_direction(self):
+        """Test faster_than lists faster Pokemon and slower_than slower ones"""
+        dex = pd.DataFrame({'name': ['Slow', 'Mid', 'Fast'], 'hp': 50, 'attack': 50, 'defense': 50,
+                            'sp_attack': 50, 'sp_defense': 50, 'speed': [20, 80, 140]})
+        index = SpeedTierIndex(dex)
+        assert list(index.faster_than('Mid')) == ['Fast']
+        assert list(index.slower_than('Mid')) == ['Slow']
+        counts = index.speed_counts()
+        mid = list(index.names).index('Mid')
+        assert (counts['faster_than'][mid], counts['slower_than'][mid]) == (1, 1)
+        assert counts['faster_than'][list(index.names).index('Slow')] == 2
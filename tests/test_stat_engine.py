@@ -0,0 +1,101 @@
+"""
+Test Suite for Stat Engine
+Tests batched final stats against the per-call formula
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from stat_engine import StatEngine, STATS, calculate_stats
+
+
+def reference_stat(base_stat, iv, ev, level=100, nature_modifier=1.0, is_hp=False):
+    """Per-call formula of CompetitiveDataEnhancer.calculate_stat_with_iv_ev"""
+    if is_hp:
+        return int(((2 * base_stat + iv + (ev // 4)) * level // 100) + level + 10)
+    return int((((2 * base_stat + iv + (ev // 4)) * level // 100) + 5) * nature_modifier)
+
+
+@pytest.fixture
+def dex():
+    """Create a small dex"""
+    return pd.DataFrame({
+        'name': ['Charizard', 'Snorlax', 'Shuckle'],
+        'hp': [78, 160, 20], 'attack': [84, 110, 10],
+        'defense': [78, 65, 230], 'sp_attack': [109, 65, 10],
+        'sp_defense': [85, 110, 230], 'speed': [100, 30, 5]
+    })
+
+
+@pytest.fixture
+def engine(dex):
+    """Stat engine with the bundled nature reference"""
+    return StatEngine(dex)
+
+
+SPREADS = np.array([
+    [252, 0, 0, 252, 4, 0],
+    [0, 252, 4, 0, 0, 252],
+    [85, 1, 7, 100, 255, 63],
+])
+
+
+class TestCalculateStats:
+    """Test the array formula"""
+
+    def test_known_values(self):
+        """Test a Timid max-speed Charizard at level 100"""
+        timid = [1.0, 0.9, 1.0, 1.0, 1.0, 1.1]
+        stats = calculate_stats([78, 84, 78, 109, 85, 100], 31, [252, 0, 0, 0, 4, 252], timid, 100)
+        assert stats.tolist() == [360, 183, 192, 254, 207, 328]
+
+    def test_hp_ignores_nature(self):
+        """Test HP uses its own formula and no nature multiplier"""
+        stats = calculate_stats([100] * 6, 31, 0, [0.9] * 6, 50)
+        assert stats[0] == reference_stat(100, 31, 0, 50, is_hp=True)
+        assert stats[1] == reference_stat(100, 31, 0, 50, 0.9)
+
+
+class TestStatEngine:
+    """Test dex-wide sweeps"""
+
+    def test_nature_table(self, engine):
+        """Test the 25 natures and their multipliers"""
+        assert len(engine.nature_names) == 25
+        adamant = engine.nature_modifiers(['Adamant'])[0]
+        assert adamant[STATS.index('attack')] == 1.1
+        assert adamant[STATS.index('sp_attack')] == 0.9
+        assert (engine.nature_modifiers(['Hardy', 'Unknown']) == 1.0).all()
+
+    def test_sweep_matches_reference(self, engine, dex):
+        """Test every Pokemon, spread, nature and level against the per-call formula"""
+        levels = [1, 50, 100]
+        result = engine.sweep(SPREADS, levels=levels, ivs=[31, 0, 31, 20, 31, 31])
+        assert result.shape == (len(dex), len(SPREADS), 25, len(levels), 6)
+
+        ivs = [31, 0, 31, 20, 31, 31]
+        for p in range(len(dex)):
+            for s, spread in enumerate(SPREADS):
+                for n in range(25):
+                    for l, level in enumerate(levels):
+                        for i, stat in enumerate(STATS):
+                            assert result[p, s, n, l, i] == reference_stat(
+                                dex[stat].iloc[p], ivs[i], spread[i], level,
+                                engine.nature_table[n, i], is_hp=(stat == 'hp')
+                            )
+
+    def test_apply_and_frame_agree(self, engine, dex):
+        """Test a single dict and a whole frame get the same stats"""
+        evs = {'hp': 252, 'defense': 252, 'sp_defense': 4}
+        single = engine.apply(dex.iloc[1].to_dict(), evs, 'Impish', level=50)
+        frame = engine.frame(dex, evs, 'Impish', level=50)
+
+        assert single['level'] == 50
+        assert single['name'] == 'Snorlax'
+        assert [single[stat] for stat in STATS] == frame.loc[1, STATS].tolist()
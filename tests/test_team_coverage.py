@@ -0,0 +1,96 @@
+"""
+Test Suite for Team Coverage
+Tests the incremental coverage state and candidate ranking
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from type_engine import get_type_engine
+from team_coverage import CoverageState, rank_candidates
+
+
+@pytest.fixture
+def engine():
+    """Shared type engine"""
+    return get_type_engine()
+
+
+@pytest.fixture
+def candidates():
+    """Create a small candidate pool"""
+    return pd.DataFrame({
+        'pokedex_number': [6, 9, 3, 395, 130],
+        'name': ['Charizard', 'Blastoise', 'Venusaur', 'Empoleon', 'Gyarados'],
+        'type_1': ['Fire', 'Water', 'Grass', 'Water', 'Water'],
+        'type_2': ['Flying', None, 'Poison', 'Steel', 'Flying'],
+        'total_points': [534, 530, 525, 530, 540]
+    })
+
+
+class TestCoverageState:
+    """Test incremental updates"""
+
+    def test_add_matches_profiles(self, engine):
+        """Test counts follow the members' defensive profiles"""
+        charizard = engine.combo_id(['Fire', 'Flying'])
+        state = CoverageState.from_combo_ids([charizard], engine)
+
+        assert state.weak[engine.index('Rock')] == 1
+        assert state.resist[engine.index('Ground')] == 1  # immunity counts as resisting
+        assert state.hits[engine.index('Grass')] == 1
+        assert state.size == 1
+
+    def test_remove_restores_state(self, engine):
+        """Test removing a member undoes its add"""
+        state = CoverageState(engine)
+        state.add(engine.combo_id(['Water']))
+        before = state.exposure.copy()
+
+        state.add(engine.combo_id(['Fire', 'Flying']))
+        state.remove(engine.combo_id(['Fire', 'Flying']))
+        assert np.array_equal(state.exposure, before)
+        assert state.size == 1
+
+    def test_deltas_match_recomputation(self, engine):
+        """Test vectorized deltas equal adding each candidate and recounting"""
+        state = CoverageState.from_combo_ids([engine.combo_id(['Fire', 'Flying'])], engine)
+        combo_ids = np.arange(engine.n_combos)
+        defensive, offensive = state.deltas(combo_ids)
+
+        for combo_id in (0, 42, 170):
+            after = CoverageState.from_combo_ids([engine.combo_id(['Fire', 'Flying']), combo_id], engine)
+            assert defensive[combo_id] == (
+                np.maximum(state.exposure, 0).sum() - np.maximum(after.exposure, 0).sum()
+            )
+            assert offensive[combo_id] == (after.hits > 0).sum() - (state.hits > 0).sum()
+
+    def test_unknown_combo_neutral(self, engine):
+        """Test unknown type combinations score zero"""
+        defensive, offensive = CoverageState(engine).deltas(np.array([-1]))
+        assert defensive[0] == 0 and offensive[0] == 0
+
+
+class TestRankCandidates:
+    """Test candidate ranking"""
+
+    def test_rock_weakness_covered(self, engine, candidates):
+        """Test a Fire/Flying team prefers a Water/Steel partner over Gyarados"""
+        state = CoverageState.from_combo_ids([engine.combo_id(['Fire', 'Flying'])], engine)
+        ranked = rank_candidates(candidates, state, top_n=5, exclude_numbers=[6])
+
+        assert 'Charizard' not in ranked['name'].tolist()
+        names = ranked['name'].tolist()
+        assert names.index('Empoleon') < names.index('Gyarados')
+
+    def test_top_n(self, engine, candidates):
+        """Test only top_n rows are returned"""
+        ranked = rank_candidates(candidates, CoverageState(engine), top_n=2)
+        assert len(ranked) == 2
+        assert {'defensive_delta', 'offensive_delta', 'coverage_score'} <= set(ranked.columns)
@@ -0,0 +1,152 @@
+"""
+Test Suite for Team Optimizer
+Tests team scoring, beam search and swap search against brute force
+"""
+
+import pytest
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+import numpy as np
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+import team_optimizer
+from team_optimizer import (
+    TeamScorer, beam_search, local_search, multi_start, optimize_team,
+    NEW_TYPE_BONUS, WEAKNESS_COVER_BONUS
+)
+
+
+@pytest.fixture
+def scorer():
+    """Scorer over 14 random Pokemon with 6 types and 5 attacking types"""
+    rng = np.random.default_rng(5)
+    n, vocab, attacks = 14, 6, 5
+    type_ids = np.stack([rng.integers(0, vocab, n), np.where(rng.random(n) < 0.4, -1, rng.integers(0, vocab, n))], axis=1)
+    weak = np.vstack([rng.random((vocab, attacks)) < 0.3, np.zeros((1, attacks), dtype=bool)])
+    resists = np.vstack([rng.random((vocab, attacks)) < 0.3, np.zeros((1, attacks), dtype=bool)])
+    return TeamScorer(rng.uniform(20, 80, n), type_ids, weak, resists)
+
+
+def reference_score(scorer, team):
+    """Score one team with plain loops"""
+    types = {member: [t for t in scorer.type_ids[member] if t >= 0] for member in team}
+    score = sum(scorer.base_scores[member] for member in team)
+    score += NEW_TYPE_BONUS * len({t for member in team for t in types[member]})
+    for member in team:
+        others = [t for other in team if other != member for t in types[other]]
+        weak = {a for t in others for a in np.flatnonzero(scorer.type_weak[t])}
+        for t in types[member]:
+            score += WEAKNESS_COVER_BONUS * len(weak & set(np.flatnonzero(scorer.type_resists[t])))
+    return score
+
+
+def brute_force(scorer, pool, fixed=(), size=6):
+    """Best score over every team"""
+    others = [p for p in pool if p not in fixed]
+    teams = np.array([list(fixed) + list(c) for c in combinations(others, size - len(fixed))])
+    return scorer.score(teams).max()
+
+
+class TestTeamScorer:
+    """Test team scores"""
+
+    def test_matches_reference(self, scorer):
+        """Test batched scores equal the loop reference"""
+        rng = np.random.default_rng(0)
+        teams = np.array([rng.choice(14, 6, replace=False) for _ in range(30)])
+        np.testing.assert_allclose(scorer.score(teams), [reference_score(scorer, t) for t in teams])
+
+    def test_order_independent(self, scorer):
+        """Test member order does not change the score"""
+        team = np.array([0, 3, 5, 7, 9, 11])
+        assert scorer.score(team[None])[0] == pytest.approx(scorer.score(team[::-1][None])[0])
+
+
+class TestSearch:
+    """Test the searches"""
+
+    def test_beam_keeps_fixed(self, scorer):
+        """Test beam search keeps fixed members and scores its team"""
+        team, score = beam_search(scorer, np.arange(14), fixed=[2, 4], beam_width=4)
+        assert list(team[:2]) == [2, 4] and len(set(team)) == 6
+        assert score == pytest.approx(scorer.score(team[None])[0])
+
+    def test_wide_beam_is_exact(self, scorer):
+        """Test a beam as wide as the search space finds the optimum"""
+        _, score = beam_search(scorer, np.arange(10), beam_width=10_000)
+        assert score == pytest.approx(brute_force(scorer, range(10)))
+
+    def test_beam_stops_widening_at_deadline(self, scorer):
+        """Test a passed deadline completes the best partial team greedily"""
+        team, score = beam_search(scorer, np.arange(14), fixed=[2], beam_width=10_000,
+                                  deadline=time.monotonic() - 1)
+        greedy, greedy_score = beam_search(scorer, np.arange(14), fixed=[2], beam_width=1)
+        assert list(team) == list(greedy) and score == pytest.approx(greedy_score)
+
+    def test_local_search_improves(self, scorer):
+        """Test swap search never lowers the score and keeps fixed members"""
+        start = np.array([0, 1, 2, 3, 4, 5])
+        team, score = local_search(scorer, np.arange(14), start, n_fixed=2)
+        assert score >= scorer.score(start[None])[0]
+        assert list(team[:2]) == [0, 1]
+
+    def test_multi_start_finds_optimum(self, scorer):
+        """Test enough random starts reach the brute-force optimum"""
+        _, score, runs = multi_start(scorer, np.arange(14), [3], 6, deadline=time.monotonic() + 30,
+                                     seed=1, starts=40)
+        assert runs == 40
+        assert score == pytest.approx(brute_force(scorer, range(14), fixed=[3]))
+
+
+class TestOptimizeTeam:
+    """Test the budgeted optimizer"""
+
+    def test_not_worse_than_initial(self, scorer):
+        """Test the result scores at least as well as the initial team"""
+        initial = [0, 1, 2, 3, 4, 5]
+        result = optimize_team(scorer, np.arange(14), budget=5, workers=1, starts=5,
+                               beam_width=2, initial=[initial], random_state=0)
+        assert result['score'] >= scorer.score(np.array([initial]))[0]
+        assert result['starts'] == 5
+
+    def test_parallel_starts(self, scorer):
+        """Test pooled starts return a valid team within the budget"""
+        start = time.monotonic()
+        result = optimize_team(scorer, np.arange(14), fixed=[7], budget=3, workers=2,
+                               starts=6, random_state=0)
+        assert time.monotonic() - start < 30
+        assert result['starts'] == 6 and result['team'][0] == 7
+        assert result['score'] == pytest.approx(brute_force(scorer, range(14), fixed=[7]))
+
+    def test_reuses_pool(self, scorer):
+        """Test repeated calls share one process pool and workers stop at the caller's deadline"""
+        first = optimize_team(scorer, np.arange(14), budget=1.5, workers=2, random_state=0)
+        executor = team_optimizer._executor
+        start = time.monotonic()
+        second = optimize_team(scorer, np.arange(14), budget=1.5, workers=2, random_state=0)
+        assert time.monotonic() - start < 2.5
+        assert team_optimizer._executor is executor
+        assert team_optimizer.POOL_START_METHOD != 'fork'
+        assert first['starts'] > 0 and second['starts'] > 0
+
+    def test_short_budget_in_process(self, scorer, monkeypatch):
+        """Test a budget under POOL_MIN_BUDGET does not start a pool by default"""
+        monkeypatch.setattr(team_optimizer, '_parallel_starts', None)
+        result = optimize_team(scorer, np.arange(14), budget=0.3)
+        assert result['starts'] > 0
+
+    def test_budget(self, scorer):
+        """Test an unlimited start count stops at the budget"""
+        start = time.monotonic()
+        result = optimize_team(scorer, np.arange(14), budget=0.3, workers=1)
+        assert time.monotonic() - start < 2
+        assert result['starts'] > 0
+
+    def test_small_pool(self, scorer):
+        """Test a pool no larger than a team is returned whole"""
+        result = optimize_team(scorer, [4, 2, 9], fixed=[9], workers=1)
+        assert list(result['team']) == [9, 2, 4] and result['method'] == 'whole pool'
@@ -0,0 +1,146 @@
+"""
+Test Suite for Team Recommender
+Tests vectorized candidate scoring against the per-Pokemon scorer and greedy loop
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from team_recommender import TeamRecommender
+from type_engine import TYPES
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Data directory with a random dex, tier list and usage table"""
+    rng = np.random.default_rng(11)
+    n = 40
+    type_1 = rng.choice(TYPES, n)
+    # Mono-types as '-' (as in pokemon.csv) and a few missing values
+    type_2 = np.where(rng.random(n) < 0.4, '-', rng.choice(TYPES, n)).astype(object)
+    type_2[:3] = None
+    stats = {s: rng.integers(30, 150, n) for s in ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']}
+    dex = pd.DataFrame({
+        'pokedex_number': np.arange(1, n + 1),
+        'name': [f"Mon{i}" for i in range(n)],
+        'type_1': type_1,
+        'type_2': type_2,
+        **stats,
+    })
+    dex['total_points'] = dex[list(stats)].sum(axis=1)
+    dex.to_csv(tmp_path / "pokemon.csv", index=False)
+
+    competitive = tmp_path / "competitive"
+    competitive.mkdir()
+    tiers = ['OU'] * 30 + ['AG'] * 3 + ['UU'] * 7
+    pd.DataFrame({'name': dex['name'], 'tier': tiers}).to_csv(competitive / "tier_data.csv", index=False)
+    usage = pd.DataFrame({
+        'pokemon_name': rng.choice(dex['name'][:25], 80),
+        'usage_percent': rng.uniform(0, 30, 80).round(2),
+    })
+    usage.to_csv(competitive / "usage_stats.csv", index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def recommender(data_dir):
+    """Recommender over the random data"""
+    return TeamRecommender(data_dir=str(data_dir))
+
+
+def greedy_reference(recommender, tier, seed_pokemon=()):
+    """The original loop: score every candidate with _score_pokemon_for_team"""
+    tier_names = recommender.tier_data.loc[recommender.tier_data['tier'] == tier, 'name']
+    available = recommender.pokemon_data[recommender.pokemon_data['name'].isin(tier_names)]
+    team = [p for p in seed_pokemon if p in available['name'].values]
+    while len(team) < 6:
+        coverage = recommender.analyze_team_coverage(team)
+        scores = [
+            (pokemon['name'], recommender._score_pokemon_for_team(pokemon, team, coverage))
+            for _, pokemon in available.iterrows() if pokemon['name'] not in team
+        ]
+        if not scores:
+            break
+        scores.sort(key=lambda x: x[1], reverse=True)
+        team.append(scores[0][0])
+    return team
+
+
+class TestScoring:
+    """Test vectorized scores"""
+
+    @pytest.mark.parametrize('size', [0, 1, 3, 5])
+    def test_matches_single_scorer(self, recommender, size):
+        """Test every candidate's score equals _score_pokemon_for_team"""
+        rng = np.random.default_rng(size)
+        dex = recommender.pokemon_data
+        team = list(rng.choice(dex['name'], size, replace=False))
+        coverage = recommender.analyze_team_coverage(team)
+
+        candidates = np.arange(len(dex))
+        scores = recommender._candidate_scores(candidates, team)
+        expected = [recommender._score_pokemon_for_team(row, team, coverage) for _, row in dex.iterrows()]
+        np.testing.assert_allclose(scores, expected)
+
+    def test_usage_means(self, recommender):
+        """Test the usage bonus uses each Pokemon's mean usage"""
+        usage = recommender.usage_stats
+        name = usage['pokemon_name'].iloc[0]
+        assert recommender.usage_means[name] == pytest.approx(
+            usage.loc[usage['pokemon_name'] == name, 'usage_percent'].mean()
+        )
+
+
+class TestRecommendTeam:
+    """Test the greedy team builder"""
+
+    @pytest.mark.parametrize('seed_pokemon', [(), ('Mon5',), ('Mon2', 'Mon17', 'Mon39')])
+    def test_matches_reference(self, recommender, seed_pokemon):
+        """Test the team equals the per-candidate greedy loop"""
+        team = recommender.recommend_team('OU', seed_pokemon=list(seed_pokemon))
+        assert [p['name'] for p in team] == greedy_reference(recommender, 'OU', seed_pokemon)
+        assert len(team) == 6
+
+    def test_small_pool(self, recommender):
+        """Test a pool smaller than a team ends with every member once"""
+        team = recommender.recommend_team('AG', seed_pokemon=['Mon31'])
+        assert [p['name'] for p in team][0] == 'Mon31'
+        assert sorted(p['name'] for p in team) == ['Mon30', 'Mon31', 'Mon32']
+
+
+class TestOptimizeTeam:
+    """Test the optimizer mode"""
+
+    def test_team_score_matches_criteria(self, recommender):
+        """Test the whole-team score against the greedy criteria, member by member"""
+        team = ['Mon1', 'Mon4', 'Mon9', 'Mon12', 'Mon20', 'Mon33']
+        dex = recommender.pokemon_data.set_index('name', drop=False)
+        expected = 0.0
+        types = set()
+        for name in team:
+            member = dex.loc[name]
+            others = [other for other in team if other != name]
+            # Weaknesses of the rest of the team; new-type bonuses are added once per type below
+            coverage = recommender.analyze_team_coverage(others)
+            coverage['team_types'] = [member['type_1'], member['type_2']]
+            expected += recommender._score_pokemon_for_team(member, others, coverage)
+            types.update(t for t in coverage['team_types'] if pd.notna(t))
+        expected += 50 * len(types)
+        assert recommender.team_score(team) == pytest.approx(expected)
+
+    @pytest.mark.parametrize('seed_pokemon', [(), ('Mon2', 'Mon17')])
+    def test_not_worse_than_greedy(self, recommender, seed_pokemon):
+        """Test the optimized team scores at least as well as the greedy one"""
+        greedy = recommender.recommend_team('OU', seed_pokemon=list(seed_pokemon))
+        result = recommender.optimize_team('OU', seed_pokemon=list(seed_pokemon), budget=0.5,
+                                           workers=1, random_state=0)
+        names = [p['name'] for p in result['team']]
+        assert len(set(names)) == 6 and names[:len(seed_pokemon)] == list(seed_pokemon)
+        assert result['score'] >= recommender.team_score([p['name'] for p in greedy])
+        assert result['score'] == pytest.approx(recommender.team_score(names))
@@ -14,8 +14,9 @@ from type_calculator import (
     calculate_type_effectiveness,
     get_pokemon_weaknesses,
     get_offensive_coverage,
-    TYPE_CHART
+    get_attack_matchups
 )
+from type_engine import get_type_engine
 
 
 class TestTypeEffectiveness:
@@ -155,7 +156,7 @@ class TestTypeChart:
     """Test type chart data integrity"""
     
     def test_all_types_present(self):
-        """Test that all 18 types are in the chart"""
+        """Test that all 18 types are in the engine's chart"""
         expected_types = [
             'Normal', 'Fire', 'Water', 'Electric', 'Grass', 'Ice',
             'Fighting', 'Poison', 'Ground', 'Flying', 'Psychic', 'Bug',
@@ -163,28 +164,33 @@ class TestTypeChart:
         ]
         
         for type_name in expected_types:
-            assert type_name in TYPE_CHART, f"{type_name} should be in TYPE_CHART"
+            assert type_name in get_type_engine().types, f"{type_name} should be in the type chart"
     
-    def test_type_chart_structure(self):
-        """Test that each type has required keys"""
-        required_keys = [
-            'weak_to', 'resistant_to', 'immune_to',
-            'super_effective', 'not_effective', 'no_effect'
-        ]
+    def test_attack_matchups_structure(self):
+        """Test that each attacking type has every matchup list"""
+        required_keys = ['super_effective', 'not_effective', 'no_effect']
         
-        for type_name, type_data in TYPE_CHART.items():
+        for type_name in get_type_engine().types:
+            matchups = get_attack_matchups(type_name)
             for key in required_keys:
-                assert key in type_data, f"{type_name} should have {key}"
+                assert key in matchups, f"{type_name} should have {key}"
+    
+    def test_attack_matchups(self):
+        """Test matchup lists for a few attacking types"""
+        assert get_attack_matchups('Normal') == {
+            'super_effective': [], 'not_effective': ['Rock', 'Steel'], 'no_effect': ['Ghost']
+        }
+        assert get_attack_matchups('Water')['super_effective'] == ['Fire', 'Ground', 'Rock']
+        assert get_attack_matchups('Dragon')['no_effect'] == ['Fairy']
     
     def test_reciprocal_relationships(self):
         """Test that type relationships are reciprocal"""
         # If Fire is super effective against Grass,
         # Grass should be weak to Fire
-        for attacker, attacker_data in TYPE_CHART.items():
-            for defender in attacker_data['super_effective']:
-                if defender in TYPE_CHART:
-                    assert attacker in TYPE_CHART[defender]['weak_to'], \
-                        f"{defender} should be weak to {attacker}"
+        for attacker in get_type_engine().types:
+            for defender in get_attack_matchups(attacker)['super_effective']:
+                assert attacker in get_pokemon_weaknesses([defender])['weak'], \
+                    f"{defender} should be weak to {attacker}"
 
 
 class TestEdgeCases:
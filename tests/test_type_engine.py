@@ -0,0 +1,134 @@
+"""
+Test Suite for Type Engine
+Tests the type matrix and vectorized dual-type lookups
+"""
+
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add analytics to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "analytics"))
+
+from type_engine import get_type_engine, TYPES, NO_TYPE, NO_COMBO
+
+# Reference chart: attacking type -> (super effective, not very effective, no effect)
+REFERENCE_CHART = {
+    'Normal': ([], ['Rock', 'Steel'], ['Ghost']),
+    'Fire': (['Grass', 'Ice', 'Bug', 'Steel'], ['Fire', 'Water', 'Rock', 'Dragon'], []),
+    'Water': (['Fire', 'Ground', 'Rock'], ['Water', 'Grass', 'Dragon'], []),
+    'Electric': (['Water', 'Flying'], ['Electric', 'Grass', 'Dragon'], ['Ground']),
+    'Grass': (['Water', 'Ground', 'Rock'], ['Fire', 'Grass', 'Poison', 'Flying', 'Bug', 'Dragon', 'Steel'], []),
+    'Ice': (['Grass', 'Ground', 'Flying', 'Dragon'], ['Fire', 'Water', 'Ice', 'Steel'], []),
+    'Fighting': (['Normal', 'Ice', 'Rock', 'Dark', 'Steel'],
+                 ['Poison', 'Flying', 'Psychic', 'Bug', 'Fairy'], ['Ghost']),
+    'Poison': (['Grass', 'Fairy'], ['Poison', 'Ground', 'Rock', 'Ghost'], ['Steel']),
+    'Ground': (['Fire', 'Electric', 'Poison', 'Rock', 'Steel'], ['Grass', 'Bug'], ['Flying']),
+    'Flying': (['Grass', 'Fighting', 'Bug'], ['Electric', 'Rock', 'Steel'], []),
+    'Psychic': (['Fighting', 'Poison'], ['Psychic', 'Steel'], ['Dark']),
+    'Bug': (['Grass', 'Psychic', 'Dark'], ['Fire', 'Fighting', 'Poison', 'Flying', 'Ghost', 'Steel', 'Fairy'], []),
+    'Rock': (['Fire', 'Ice', 'Flying', 'Bug'], ['Fighting', 'Ground', 'Steel'], []),
+    'Ghost': (['Psychic', 'Ghost'], ['Dark'], ['Normal']),
+    'Dragon': (['Dragon'], ['Steel'], ['Fairy']),
+    'Dark': (['Psychic', 'Ghost'], ['Fighting', 'Dark', 'Fairy'], []),
+    'Steel': (['Ice', 'Rock', 'Fairy'], ['Fire', 'Water', 'Electric', 'Steel'], []),
+    'Fairy': (['Fighting', 'Dragon', 'Dark'], ['Fire', 'Poison', 'Steel'], []),
+}
+
+
+@pytest.fixture
+def engine():
+    """Shared engine loaded from data/type-chart.yaml"""
+    return get_type_engine()
+
+
+class TestTypeMatrix:
+    """Test the matrix built from the YAML chart"""
+
+    def test_shape(self, engine):
+        """Test one row and column per type"""
+        assert engine.types == TYPES
+        assert engine.matrix.shape == (18, 18)
+
+    def test_matches_reference_chart(self, engine):
+        """Test every entry agrees with the reference chart"""
+        for attack, relations in REFERENCE_CHART.items():
+            row = engine.matrix[engine.index(attack)]
+            expected = np.ones(18)
+            for types, multiplier in zip(relations, (2, 0.5, 0)):
+                expected[engine.indices(types)] = multiplier
+            assert np.array_equal(row, expected), attack
+
+
+class TestLookups:
+    """Test scalar and vectorized multipliers"""
+
+    def test_dual_type_products(self, engine):
+        """Test dual-type multipliers multiply per type"""
+        assert engine.effectiveness('Ground', ['Fire', 'Flying']) == 0.0
+        assert engine.effectiveness('Ice', ['Dragon', 'Flying']) == 4.0
+        assert engine.effectiveness('Fire', ['Water', 'Dragon']) == 0.25
+        assert engine.effectiveness('Fighting', ['Normal']) == 2.0
+
+    def test_case_insensitive(self, engine):
+        """Test type names match regardless of case"""
+        assert engine.effectiveness('ice', ['DRAGON', 'flying']) == 4.0
+
+    def test_missing_and_unknown_types_neutral(self, engine):
+        """Test NaN, '-' and unknown names act as no type"""
+        assert engine.index(float('nan')) == NO_TYPE
+        assert engine.effectiveness('Fire', ['Grass', '-']) == 2.0
+        assert engine.effectiveness('Shadow', ['Grass']) == 1.0
+        assert np.all(engine.defensive_profile([None]) == 1)
+
+    def test_multipliers_broadcast(self, engine):
+        """Test index arrays broadcast to a full grid"""
+        attack = np.arange(18)
+        grid = engine.multipliers(attack[:, None], attack[None, :])
+        assert np.array_equal(grid, engine.matrix)
+
+    def test_defensive_profiles(self, engine):
+        """Test batched profiles match single profiles"""
+        defend_1 = engine.indices(['Dragon', 'Steel', 'Normal'])
+        defend_2 = engine.indices(['Flying', 'Fairy', None])
+        profiles = engine.defensive_profiles(defend_1, defend_2)
+
+        assert profiles.shape == (3, 18)
+        assert np.array_equal(profiles[0], engine.defensive_profile(['Dragon', 'Flying']))
+        assert np.array_equal(profiles[2], engine.defensive_profile(['Normal']))
+
+    def test_offensive_profile(self, engine):
+        """Test offensive rows are the attacking types' matrix rows"""
+        profile = engine.offensive_profile(['Fire', 'Ground'])
+        assert np.array_equal(profile[1], engine.matrix[engine.index('Ground')])
+        assert profile[1][engine.index('Flying')] == 0
+
+
+class TestComboTable:
+    """Test the precomputed type combination profiles"""
+
+    def test_every_combination_once(self, engine):
+        """Test 18 single plus 153 dual combinations"""
+        assert engine.combo_profiles.shape == (171, 18)
+        assert len({tuple(pair) for pair in engine.combo_types.tolist()}) == 171
+
+    def test_rows_match_defensive_profiles(self, engine):
+        """Test each row equals the profile computed from its types"""
+        for combo_id in range(engine.n_combos):
+            names = engine.combo_names(combo_id)
+            assert np.array_equal(engine.combo_profile(combo_id), engine.defensive_profile(names))
+
+    def test_combo_id_order_insensitive(self, engine):
+        """Test type order, repeats and missing second types"""
+        assert engine.combo_id(['Dragon', 'Flying']) == engine.combo_id(['Flying', 'Dragon'])
+        assert engine.combo_id(['Fire', 'Fire']) == engine.combo_id(['Fire', None])
+        assert engine.combo_id(['Fire', '-']) == engine.combo_id(['Fire'])
+
+    def test_vectorized_combo_ids(self, engine):
+        """Test batched ids match single lookups and unknowns are neutral"""
+        ids = engine.combo_ids(['Dragon', 'Water', 'Shadow'], ['Flying', None, None])
+        assert ids[0] == engine.combo_id(['Dragon', 'Flying'])
+        assert ids[1] == engine.combo_id(['Water'])
+        assert ids[2] == NO_COMBO
+        assert np.all(engine.combo_profile(ids[2]) == 1)
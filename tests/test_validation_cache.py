@@ -0,0 +1,128 @@
+"""
+Test Suite for Validation Cache
+Tests fingerprint reuse, persistence and the background worker
+"""
+
+import pytest
+import sys
+import os
+from pathlib import Path
+import pandas as pd
+
+# Add utils to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "utils"))
+
+from validation_cache import ValidationCache
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a data directory with a valid pokemon.csv"""
+    data = tmp_path / "data"
+    data.mkdir()
+    pd.DataFrame({
+        'pokedex_number': [1, 4], 'name': ['Bulbasaur', 'Charmander'],
+        'type_1': ['Grass', 'Fire'], 'type_2': ['Poison', None],
+        'hp': [45, 39], 'attack': [49, 52], 'defense': [49, 43],
+        'sp_attack': [65, 60], 'sp_defense': [65, 50], 'speed': [45, 65],
+        'total_points': [318, 309]
+    }).to_csv(data / "pokemon.csv", index=False)
+    return data
+
+
+def make_cache(data_dir):
+    """Create a cache stored next to the data directory"""
+    return ValidationCache(cache_file=str(data_dir.parent / "cache.json"), data_dir=str(data_dir))
+
+
+class TestValidationCache:
+    """Test cached validation"""
+
+    def test_pending_until_refreshed(self, data_dir):
+        """Test nothing is validated on read"""
+        cache = make_cache(data_dir)
+        results = cache.cached_results()
+        assert results['total'] == 0
+        assert results['pending'] == [str(data_dir / "pokemon.csv")]
+
+    def test_refresh_validates_once(self, data_dir):
+        """Test each file version is validated once"""
+        cache = make_cache(data_dir)
+        assert cache.refresh() == 1
+        assert cache.refresh() == 0
+
+        results = cache.cached_results()
+        assert results['total'] == 1
+        assert results['valid'] == 1
+        assert results['pending'] == []
+
+    def test_persisted_across_instances(self, data_dir):
+        """Test results survive a restart"""
+        make_cache(data_dir).refresh()
+        cache = make_cache(data_dir)
+        assert cache.stale_files() == []
+        assert cache.cached_results()['valid'] == 1
+
+    def test_touched_file_not_revalidated(self, data_dir):
+        """Test a new mtime with the same content reuses the report"""
+        cache = make_cache(data_dir)
+        cache.refresh()
+
+        path = data_dir / "pokemon.csv"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert len(cache.stale_files()) == 1
+        assert cache.refresh() == 0
+        assert cache.stale_files() == []
+
+    def test_changed_file_revalidated(self, data_dir):
+        """Test changed content produces a new report"""
+        cache = make_cache(data_dir)
+        cache.refresh()
+
+        pd.DataFrame({'name': ['Bulbasaur']}).to_csv(data_dir / "pokemon.csv", index=False)
+
+        assert cache.refresh() == 1
+        assert cache.cached_results()['invalid'] == 1
+
+    def test_background_refresh(self, data_dir):
+        """Test the worker fills the cache"""
+        cache = make_cache(data_dir)
+        assert cache.start_background_refresh()
+        cache.wait(timeout=30)
+        assert cache.cached_results()['valid'] == 1
+        assert not cache.start_background_refresh()
+
+    def test_failed_validation_reported(self, data_dir, monkeypatch):
+        """Test a check that raises is reported as failed, not pending"""
+        cache = make_cache(data_dir)
+
+        def broken_check(path):
+            raise RuntimeError("parser crashed")
+
+        checks = [(data_dir / "pokemon.csv", broken_check)]
+        monkeypatch.setattr(cache.validator, 'data_file_checks', lambda data_dir: checks)
+        assert cache.start_background_refresh()
+        cache.wait(timeout=30)
+
+        results = cache.cached_results()
+        assert results['pending'] == [] and results['total'] == 0
+        assert results['failed'] == [{'file': str(data_dir / "pokemon.csv"),
+                                      'error': 'RuntimeError: parser crashed'}]
+        assert not cache.start_background_refresh()
+
+    def test_worker_error_reported(self, data_dir, monkeypatch):
+        """Test a refresh that raises is surfaced in the results"""
+        cache = make_cache(data_dir)
+        assert cache.start_background_refresh()
+        cache.wait(timeout=30)
+
+        def broken_refresh():
+            raise OSError("disk full")
+
+        (data_dir / "pokemon.csv").write_text("name\nBulbasaur\n")
+        monkeypatch.setattr(cache, 'refresh', broken_refresh)
+        assert cache.start_background_refresh()
+        cache.wait(timeout=30)
+        assert cache.cached_results()['worker_error'] == 'OSError: disk full'
@@ -0,0 +1,87 @@
+"""
+Test Suite for YAML Loader
+Tests the compiled YAML cache and loader memoization
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add data loaders to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "data_loaders"))
+
+import yaml_loader
+from yaml_loader import load_yaml_cached, PokemonDataLoader
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    """Create a small YAML file"""
+    path = tmp_path / "games.yaml"
+    path.write_text("red:\n  name: Red\n  generation: 1\nblue:\n  name: Blue\n  generation: 1\n")
+    return path
+
+
+class TestYamlCache:
+    """Test load_yaml_cached"""
+
+    def test_parses_yaml(self, yaml_file):
+        """Test the first load parses the file"""
+        data = load_yaml_cached(yaml_file)
+        assert data['red'] == {'name': 'Red', 'generation': 1}
+
+    def test_second_load_skips_parsing(self, yaml_file, monkeypatch):
+        """Test a cached load never calls the YAML parser"""
+        load_yaml_cached(yaml_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML was re-parsed")
+
+        monkeypatch.setattr(yaml_loader.yaml, 'load', fail)
+        assert load_yaml_cached(yaml_file)['blue']['name'] == 'Blue'
+
+    def test_changed_source_reparsed(self, yaml_file):
+        """Test a content change invalidates the cache"""
+        load_yaml_cached(yaml_file)
+        yaml_file.write_text("gold:\n  name: Gold\n")
+        assert list(load_yaml_cached(yaml_file)) == ['gold']
+
+        # Only the current version's cache is kept
+        assert len(list((yaml_file.parent / ".cache").glob("games.*.pickle"))) == 1
+
+    def test_similar_names_keep_their_caches(self, yaml_file, monkeypatch):
+        """Test re-caching games.yaml leaves games.extra.yaml's cache alone"""
+        extra = yaml_file.parent / "games.extra.yaml"
+        extra.write_text("silver:\n  name: Silver\n")
+        load_yaml_cached(extra)
+        load_yaml_cached(yaml_file)
+        yaml_file.write_text("gold:\n  name: Gold\n")
+        load_yaml_cached(yaml_file)
+
+        assert len(list((yaml_file.parent / ".cache").glob("games.extra.*.pickle"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML was re-parsed")
+
+        monkeypatch.setattr(yaml_loader.yaml, 'load', fail)
+        assert list(load_yaml_cached(extra)) == ['silver']
+
+    def test_corrupt_cache_reparsed(self, yaml_file):
+        """Test an unreadable cache falls back to parsing"""
+        load_yaml_cached(yaml_file)
+        cache_file = next((yaml_file.parent / ".cache").glob("games.*.pickle"))
+        cache_file.write_bytes(b"not a pickle")
+        assert load_yaml_cached(yaml_file)['red']['name'] == 'Red'
+
+
+class TestPokemonDataLoader:
+    """Test loader memoization"""
+
+    def test_load_yaml_file_memoized(self, tmp_path, yaml_file):
+        """Test repeated loads return the same object"""
+        (tmp_path / "pokemondbgit").mkdir()
+        yaml_file.rename(tmp_path / "pokemondbgit" / "games.yaml")
+
+        loader = PokemonDataLoader(base_path=str(tmp_path))
+        assert loader.load_yaml_file('games.yaml') is loader.load_yaml_file('games.yaml')
+        assert loader.load_yaml_file('missing.yaml') == {}